@@ -1,4 +1,6 @@
-from app.admin.agent_generator_api import router as agent_generator_router
+import importlib
+from typing import Any
+
 from app.admin.api import admin_router, admin_router_readonly
 from app.admin.credit import credit_router, credit_router_readonly
 from app.admin.health import health_router
@@ -18,3 +20,13 @@ __all__ = [
     "user_router_readonly",
     "agent_generator_router",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The agent generator pulls in OpenAI and schema validation, so it is only
+    # imported by the API server that registers its router
+    if name == "agent_generator_router":
+        module = importlib.import_module("app.admin.agent_generator_api")
+        globals()[name] = module.router
+        return module.router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,26 +2,50 @@ import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from sqlalchemy import select, text
+from sqlalchemy import JSON, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from intentkit.config.config import config
-from intentkit.models.credit import (
-    CreditAccount,
-    CreditAccountTable,
-    CreditEvent,
-    CreditEventTable,
-    CreditTransaction,
-    CreditTransactionTable,
-)
+from intentkit.models.credit import CreditAccountCheckpointTable
 from intentkit.models.db import get_session, init_db
 
 logger = logging.getLogger(__name__)
 
 
+def _to_json_value(value: Any) -> Any:
+    """Convert Decimal and datetime values in details to JSON-serializable values."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {k: _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_json_value(v) for v in value]
+    return value
+
+
+async def _begin_read_only(session: AsyncSession) -> None:
+    """Start a read-only REPEATABLE READ transaction on the session.
+
+    All queries of a check then see the same snapshot, and Postgres can skip the
+    bookkeeping needed for writes.
+    """
+    await session.execute(
+        text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+    )
+
+
 class AccountCheckingResult:
-    """Result of an account checking operation."""
+    """Result of an account checking operation.
+
+    Details keep the raw Decimal and datetime values from the database, they are only
+    converted when the result is serialized with to_dict() or printed.
+    """
 
     def __init__(self, check_type: str, status: bool, details: Optional[Dict] = None):
         self.check_type = check_type
@@ -29,13 +53,22 @@ class AccountCheckingResult:
         self.details = details or {}
         self.timestamp = datetime.now(timezone.utc)
 
+    def to_dict(self) -> Dict:
+        """Convert the result to a JSON-serializable dict."""
+        return {
+            "check_type": self.check_type,
+            "status": self.status,
+            "details": _to_json_value(self.details),
+            "timestamp": self.timestamp.isoformat(),
+        }
+
     def __str__(self) -> str:
         status_str = "PASSED" if self.status else "FAILED"
-        return f"[{self.timestamp.isoformat()}] {self.check_type}: {status_str} - {self.details}"
+        return f"[{self.timestamp.isoformat()}] {self.check_type}: {status_str} - {_to_json_value(self.details)}"
 
 
 async def check_account_balance_consistency(
-    check_recent_only: bool = True, recent_hours: int = 24
+    check_recent_only: bool = True, recent_hours: int = 24, use_checkpoint: bool = False
 ) -> List[AccountCheckingResult]:
     """Check if all account balances are consistent with their transactions.
 
@@ -47,16 +80,26 @@ async def check_account_balance_consistency(
     transaction queries, ensuring that only transactions from events up to and including
     the last recorded event for that account are considered.
 
+    With use_checkpoint, consistent accounts are checkpointed in credit_account_checkpoints
+    with their transaction sums up to last_event_id, so the next run only aggregates
+    transactions from newer events. Accounts without a checkpoint fall back to a full
+    recompute. This writes to the database and relies on event ids growing in commit
+    order, so it is off by default and the read-only checker never enables it.
+
     Args:
         check_recent_only: If True, only check accounts updated within recent_hours. Default True.
         recent_hours: Number of hours to look back for recent updates. Default 24.
+        use_checkpoint: If True, start from existing checkpoints and refresh them for
+            consistent accounts. Needs write access. Default False.
 
     Returns:
-        List of checking results
+        List of checking results, one failed result per inconsistent account followed
+        by a summary result with the checked, passed and failed account counts
     """
     results = []
     batch_size = 1000  # Process 1000 accounts at a time
     total_processed = 0
+    passed_count = 0
     batch_count = 0
     last_id = ""  # Starting ID for pagination (empty string comes before all valid IDs)
 
@@ -65,25 +108,83 @@ async def check_account_balance_consistency(
     if check_recent_only:
         time_threshold = datetime.now(timezone.utc) - timedelta(hours=recent_hours)
 
+    # Only check accounts updated recently if requested
+    account_filter = (
+        "AND a.updated_at >= :time_threshold"
+        if check_recent_only and time_threshold
+        else ""
+    )
+
+    # Fetch a batch of accounts together with their aggregated transactions in a single
+    # statement, so no per-account queries or model validation are needed.
+    # If account has last_event_id, only include transactions from events up to and including that event
+    # If no last_event_id, include all transactions for the account
+    # If account has a checkpoint, only include transactions from events after the checkpoint
+    batch_query = text(f"""
+        WITH batch AS (
+            SELECT
+                a.id, a.owner_type, a.owner_id, a.free_credits, a.reward_credits, a.credits, a.last_event_id,
+                cp.last_event_id as checkpoint_event_id,
+                cp.credits as cp_credits,
+                cp.debits as cp_debits,
+                cp.free_credits as cp_free_credits,
+                cp.reward_credits as cp_reward_credits,
+                cp.permanent_credits as cp_permanent_credits
+            FROM credit_accounts a
+            LEFT JOIN credit_account_checkpoints cp
+              ON cp.account_id = a.id
+             AND cp.last_event_id <= a.last_event_id
+             AND :use_checkpoint
+            WHERE a.id > :last_id {account_filter}
+            ORDER BY a.id
+            LIMIT :batch_size
+        ),
+        tx AS (
+            SELECT
+                ct.account_id,
+                SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.change_amount ELSE 0 END) as credits,
+                SUM(CASE WHEN ct.credit_debit = 'debit' THEN ct.change_amount ELSE 0 END) as debits,
+                SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.free_amount ELSE -ct.free_amount END) as free_credits_sum,
+                SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.reward_amount ELSE -ct.reward_amount END) as reward_credits_sum,
+                SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.permanent_amount ELSE -ct.permanent_amount END) as permanent_credits_sum
+            FROM credit_transactions ct
+            JOIN batch ON ct.account_id = batch.id
+            LEFT JOIN credit_events ce ON ct.event_id = ce.id
+            WHERE (
+                batch.last_event_id IS NULL
+                OR (ce.id IS NOT NULL AND ce.id <= batch.last_event_id)
+            )
+            AND (
+                batch.checkpoint_event_id IS NULL
+                OR ct.event_id > batch.checkpoint_event_id
+            )
+            GROUP BY ct.account_id
+        )
+        SELECT
+            batch.id, batch.owner_type, batch.owner_id, batch.free_credits, batch.reward_credits,
+            batch.credits, batch.last_event_id, batch.checkpoint_event_id,
+            COALESCE(batch.cp_credits, 0) + COALESCE(tx.credits, 0) as tx_credits,
+            COALESCE(batch.cp_debits, 0) + COALESCE(tx.debits, 0) as tx_debits,
+            COALESCE(batch.cp_free_credits, 0) + COALESCE(tx.free_credits_sum, 0) as tx_free_credits,
+            COALESCE(batch.cp_reward_credits, 0) + COALESCE(tx.reward_credits_sum, 0) as tx_reward_credits,
+            COALESCE(batch.cp_permanent_credits, 0) + COALESCE(tx.permanent_credits_sum, 0) as tx_permanent_credits
+        FROM batch
+        LEFT JOIN tx ON tx.account_id = batch.id
+        ORDER BY batch.id
+    """)
+
     while True:
         # Create a new session for each batch to prevent timeouts
         async with get_session() as session:
-            # Get accounts in batches using ID-based pagination
-            query = (
-                select(CreditAccountTable)
-                .where(CreditAccountTable.id > last_id)  # ID-based pagination
-                .order_by(CreditAccountTable.id)
-                .limit(batch_size)
-            )
-
-            # Add time filter if checking recent updates only
-            if check_recent_only and time_threshold:
-                query = query.where(CreditAccountTable.updated_at >= time_threshold)
-            accounts_result = await session.execute(query)
-            batch_accounts = [
-                CreditAccount.model_validate(acc)
-                for acc in accounts_result.scalars().all()
-            ]
+            params = {
+                "last_id": last_id,
+                "batch_size": batch_size,
+                "use_checkpoint": use_checkpoint,
+            }
+            if account_filter:
+                params["time_threshold"] = time_threshold
+            batch_result = await session.execute(batch_query, params)
+            batch_accounts = batch_result.fetchall()
 
             # If no more accounts to process, break the loop
             if not batch_accounts:
@@ -99,68 +200,27 @@ async def check_account_balance_consistency(
                 f"Processing account balance batch: {batch_count}, accounts: {current_batch_size}"
             )
 
+            # Sleep for 10ms per batch to reduce database load
+            await asyncio.sleep(0.01)
+
+            # Checkpoints to persist for consistent accounts in this batch
+            checkpoints = []
+
             # Process each account in the batch
             for account in batch_accounts:
-                # Sleep for 10ms to reduce database load
-                await asyncio.sleep(0.01)
-
                 # Calculate the total balance across all credit types
                 total_balance = (
                     account.free_credits + account.reward_credits + account.credits
                 )
 
-                # Calculate the expected balance from all transactions, regardless of credit type
-                # If account has last_event_id, only include transactions from events up to and including that event
-                # If no last_event_id, include all transactions for the account
-                if account.last_event_id:
-                    query = text("""
-                    SELECT 
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.change_amount ELSE 0 END) as credits,
-                        SUM(CASE WHEN ct.credit_debit = 'debit' THEN ct.change_amount ELSE 0 END) as debits,
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.free_amount ELSE -ct.free_amount END) as free_credits_sum,
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.reward_amount ELSE -ct.reward_amount END) as reward_credits_sum,
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.permanent_amount ELSE -ct.permanent_amount END) as permanent_credits_sum
-                    FROM credit_transactions ct
-                    JOIN credit_events ce ON ct.event_id = ce.id
-                    WHERE ct.account_id = :account_id 
-                      AND ce.id <= :last_event_id
-                """)
-
-                    tx_result = await session.execute(
-                        query,
-                        {
-                            "account_id": account.id,
-                            "last_event_id": account.last_event_id,
-                        },
-                    )
-                else:
-                    query = text("""
-                    SELECT 
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.change_amount ELSE 0 END) as credits,
-                        SUM(CASE WHEN ct.credit_debit = 'debit' THEN ct.change_amount ELSE 0 END) as debits,
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.free_amount ELSE -ct.free_amount END) as free_credits_sum,
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.reward_amount ELSE -ct.reward_amount END) as reward_credits_sum,
-                        SUM(CASE WHEN ct.credit_debit = 'credit' THEN ct.permanent_amount ELSE -ct.permanent_amount END) as permanent_credits_sum
-                    FROM credit_transactions ct
-                    WHERE ct.account_id = :account_id
-                """)
-
-                    tx_result = await session.execute(
-                        query,
-                        {"account_id": account.id},
-                    )
-                tx_data = tx_result.fetchone()
-
-                credits = tx_data.credits or Decimal("0")
-                debits = tx_data.debits or Decimal("0")
+                credits = account.tx_credits
+                debits = account.tx_debits
                 expected_balance = credits - debits
 
                 # Calculate expected balances for each credit type
-                expected_free_credits = tx_data.free_credits_sum or Decimal("0")
-                expected_reward_credits = tx_data.reward_credits_sum or Decimal("0")
-                expected_permanent_credits = tx_data.permanent_credits_sum or Decimal(
-                    "0"
-                )
+                expected_free_credits = account.tx_free_credits
+                expected_reward_credits = account.tx_reward_credits
+                expected_permanent_credits = account.tx_permanent_credits
 
                 # Compare total balances and individual credit type balances
                 is_total_consistent = total_balance == expected_balance
@@ -175,33 +235,54 @@ async def check_account_balance_consistency(
                     and is_permanent_consistent
                 )
 
+                if is_consistent:
+                    passed_count += 1
+
+                    # Only checkpoint accounts that have an event cutoff
+                    if (
+                        use_checkpoint
+                        and account.last_event_id
+                        and account.last_event_id != account.checkpoint_event_id
+                    ):
+                        checkpoints.append(
+                            {
+                                "account_id": account.id,
+                                "last_event_id": account.last_event_id,
+                                "credits": credits,
+                                "debits": debits,
+                                "free_credits": expected_free_credits,
+                                "reward_credits": expected_reward_credits,
+                                "permanent_credits": expected_permanent_credits,
+                            }
+                        )
+                    continue
+
+                # Only inconsistent accounts get a detailed result
                 result = AccountCheckingResult(
                     check_type="account_balance_consistency",
-                    status=is_consistent,
+                    status=False,
                     details={
                         "account_id": account.id,
                         "owner_type": account.owner_type,
                         "owner_id": account.owner_id,
-                        "current_total_balance": float(total_balance),
-                        "free_credits": float(account.free_credits),
-                        "reward_credits": float(account.reward_credits),
-                        "permanent_credits": float(account.credits),
-                        "expected_total_balance": float(expected_balance),
-                        "expected_free_credits": float(expected_free_credits),
-                        "expected_reward_credits": float(expected_reward_credits),
-                        "expected_permanent_credits": float(expected_permanent_credits),
-                        "total_credits": float(credits),
-                        "total_debits": float(debits),
-                        "total_balance_difference": float(
-                            total_balance - expected_balance
-                        ),
-                        "free_credits_difference": float(
+                        "current_total_balance": total_balance,
+                        "free_credits": account.free_credits,
+                        "reward_credits": account.reward_credits,
+                        "permanent_credits": account.credits,
+                        "expected_total_balance": expected_balance,
+                        "expected_free_credits": expected_free_credits,
+                        "expected_reward_credits": expected_reward_credits,
+                        "expected_permanent_credits": expected_permanent_credits,
+                        "total_credits": credits,
+                        "total_debits": debits,
+                        "total_balance_difference": total_balance - expected_balance,
+                        "free_credits_difference": (
                             account.free_credits - expected_free_credits
                         ),
-                        "reward_credits_difference": float(
+                        "reward_credits_difference": (
                             account.reward_credits - expected_reward_credits
                         ),
-                        "permanent_credits_difference": float(
+                        "permanent_credits_difference": (
                             account.credits - expected_permanent_credits
                         ),
                         "is_total_consistent": is_total_consistent,
@@ -216,35 +297,69 @@ async def check_account_balance_consistency(
                 )
                 results.append(result)
 
-                if not is_consistent:
-                    inconsistency_details = []
-                    if not is_total_consistent:
-                        inconsistency_details.append(
-                            f"Total: {total_balance} vs {expected_balance}"
-                        )
-                    if not is_free_consistent:
-                        inconsistency_details.append(
-                            f"Free: {account.free_credits} vs {expected_free_credits}"
-                        )
-                    if not is_reward_consistent:
-                        inconsistency_details.append(
-                            f"Reward: {account.reward_credits} vs {expected_reward_credits}"
-                        )
-                    if not is_permanent_consistent:
-                        inconsistency_details.append(
-                            f"Permanent: {account.credits} vs {expected_permanent_credits}"
-                        )
-
-                    logger.warning(
-                        f"Account balance inconsistency detected: {account.id} ({account.owner_type}:{account.owner_id}) - "
-                        f"{'; '.join(inconsistency_details)}"
+                inconsistency_details = []
+                if not is_total_consistent:
+                    inconsistency_details.append(
+                        f"Total: {total_balance} vs {expected_balance}"
+                    )
+                if not is_free_consistent:
+                    inconsistency_details.append(
+                        f"Free: {account.free_credits} vs {expected_free_credits}"
                     )
+                if not is_reward_consistent:
+                    inconsistency_details.append(
+                        f"Reward: {account.reward_credits} vs {expected_reward_credits}"
+                    )
+                if not is_permanent_consistent:
+                    inconsistency_details.append(
+                        f"Permanent: {account.credits} vs {expected_permanent_credits}"
+                    )
+
+                logger.warning(
+                    f"Account balance inconsistency detected: {account.id} ({account.owner_type}:{account.owner_id}) - "
+                    f"{'; '.join(inconsistency_details)}"
+                )
+
+            if checkpoints:
+                stmt = insert(CreditAccountCheckpointTable)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[CreditAccountCheckpointTable.account_id],
+                    set_={
+                        "last_event_id": stmt.excluded.last_event_id,
+                        "credits": stmt.excluded.credits,
+                        "debits": stmt.excluded.debits,
+                        "free_credits": stmt.excluded.free_credits,
+                        "reward_credits": stmt.excluded.reward_credits,
+                        "permanent_credits": stmt.excluded.permanent_credits,
+                        "checked_at": func.now(),
+                    },
+                )
+                await session.execute(stmt, checkpoints)
+                await session.commit()
 
     filter_info = (
         f" (recent {recent_hours}h only)" if check_recent_only else " (all accounts)"
     )
+    failed_count = total_processed - passed_count
     logger.info(
-        f"Completed account balance consistency check{filter_info}: processed {total_processed} accounts in {batch_count} batches"
+        f"Completed account balance consistency check{filter_info}: processed {total_processed} accounts in {batch_count} batches, "
+        f"{failed_count} inconsistent"
+    )
+
+    # The summary result comes last and carries the counts of the whole run
+    results.append(
+        AccountCheckingResult(
+            check_type="account_balance_consistency",
+            status=failed_count == 0,
+            details={
+                "checked_count": total_processed,
+                "passed_count": passed_count,
+                "failed_count": failed_count,
+                "batches": batch_count,
+                "check_recent_only": check_recent_only,
+                "recent_hours": recent_hours if check_recent_only else None,
+            },
+        )
     )
 
     return results
@@ -255,9 +370,11 @@ async def check_transaction_balance() -> List[AccountCheckingResult]:
 
     For each credit event, the sum of all credit transactions should equal the sum of all debit transactions.
     Events are processed in batches to prevent memory overflow issues using ID-based pagination for better performance.
+    Balanced events are filtered out in the database, so only imbalanced events are returned.
 
     Returns:
-        List of checking results
+        List of checking results, one failed result per imbalanced event,
+        or a single passed summary result if all events are balanced
     """
     results = []
     batch_size = 1000  # Process 1000 events at a time
@@ -268,151 +385,238 @@ async def check_transaction_balance() -> List[AccountCheckingResult]:
     # Time window for events (last 3 days for performance)
     three_days_ago = datetime.now(timezone.utc) - timedelta(hours=4)
 
+    # Fetch the size and last id of a batch of events, together with the imbalanced
+    # events of the batch, in one grouped query. Timestamps are formatted as ISO strings in SQL. The bounds row is always returned,
+    # with NULL event columns if every event in the batch is balanced.
+    batch_query = text("""
+        WITH batch AS (
+            SELECT id, event_type, created_at
+            FROM credit_events
+            WHERE created_at >= :since AND id > :last_id
+            ORDER BY id
+            LIMIT :batch_size
+        ),
+        bounds AS (
+            SELECT COUNT(*) as batch_events, MAX(id) as batch_last_id
+            FROM batch
+        ),
+        imbalanced AS (
+            SELECT
+                batch.id,
+                batch.event_type,
+                to_char(batch.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"') as created_at,
+                COALESCE(SUM(CASE WHEN t.credit_debit = 'credit' THEN t.change_amount END), 0) as credit_sum,
+                COALESCE(SUM(CASE WHEN t.credit_debit = 'debit' THEN t.change_amount END), 0) as debit_sum
+            FROM batch
+            LEFT JOIN credit_transactions t ON t.event_id = batch.id
+            GROUP BY batch.id, batch.event_type, batch.created_at
+            HAVING COALESCE(SUM(CASE WHEN t.credit_debit = 'credit' THEN t.change_amount END), 0)
+                <> COALESCE(SUM(CASE WHEN t.credit_debit = 'debit' THEN t.change_amount END), 0)
+        )
+        SELECT bounds.batch_events, bounds.batch_last_id, imbalanced.*
+        FROM bounds
+        LEFT JOIN imbalanced ON TRUE
+        ORDER BY imbalanced.id
+    """)
+
     while True:
         # Create a new session for each batch to prevent timeouts
         async with get_session() as session:
-            # Get events in batches using ID-based pagination
-            query = (
-                select(CreditEventTable)
-                .where(CreditEventTable.created_at >= three_days_ago)
-                .where(
-                    CreditEventTable.id > last_id
-                )  # Key change: ID-based pagination with string comparison
-                .order_by(CreditEventTable.id)
-                .limit(batch_size)
+            await _begin_read_only(session)
+            events_result = await session.execute(
+                batch_query,
+                {
+                    "since": three_days_ago,
+                    "last_id": last_id,
+                    "batch_size": batch_size,
+                },
             )
-            events_result = await session.execute(query)
-            batch_events = [
-                CreditEvent.model_validate(event)
-                for event in events_result.scalars().all()
-            ]
+            batch_rows = events_result.fetchall()
 
             # If no more events to process, break the loop
-            if not batch_events:
+            current_batch_size = batch_rows[0].batch_events
+            if not current_batch_size:
                 break
 
             # Update counters and last_id for next iteration
             batch_count += 1
-            current_batch_size = len(batch_events)
             total_processed += current_batch_size
-            last_id = batch_events[-1].id  # Update last_id for next batch
+            last_id = batch_rows[0].batch_last_id  # Update last_id for next batch
 
             logger.info(
                 f"Processing transaction balance batch: {batch_count}, events: {current_batch_size}"
             )
 
-            # Process each event in the batch
-            for event in batch_events:
-                # Sleep for 10ms to reduce database load
-                await asyncio.sleep(0.01)
+            # Sleep for 10ms per batch to reduce database load
+            await asyncio.sleep(0.01)
 
-                # Get all transactions for this event
-                tx_query = select(CreditTransactionTable).where(
-                    CreditTransactionTable.event_id == event.id
-                )
-                tx_result = await session.execute(tx_query)
-                transactions = [
-                    CreditTransaction.model_validate(tx)
-                    for tx in tx_result.scalars().all()
-                ]
-
-                # Calculate credit and debit sums
-                credit_sum = sum(
-                    tx.change_amount
-                    for tx in transactions
-                    if tx.credit_debit == "credit"
-                )
-                debit_sum = sum(
-                    tx.change_amount
-                    for tx in transactions
-                    if tx.credit_debit == "debit"
-                )
+            # Process each imbalanced event in the batch
+            for event in batch_rows:
+                if event.id is None:
+                    continue
 
-                # Check if they balance
-                is_balanced = credit_sum == debit_sum
+                credit_sum = event.credit_sum
+                debit_sum = event.debit_sum
 
                 result = AccountCheckingResult(
                     check_type="transaction_balance",
-                    status=is_balanced,
+                    status=False,
                     details={
                         "event_id": event.id,
                         "event_type": event.event_type,
-                        "credit_sum": float(credit_sum),
-                        "debit_sum": float(debit_sum),
-                        "difference": float(credit_sum - debit_sum),
-                        "created_at": event.created_at.isoformat()
-                        if event.created_at
-                        else None,
+                        "credit_sum": credit_sum,
+                        "debit_sum": debit_sum,
+                        "difference": credit_sum - debit_sum,
+                        "created_at": event.created_at,
                         "batch": batch_count,
                     },
                 )
                 results.append(result)
 
-                if not is_balanced:
-                    logger.warning(
-                        f"Transaction imbalance detected for event {event.id} ({event.event_type}). "
-                        f"Credit: {credit_sum}, Debit: {debit_sum}"
-                    )
+                logger.warning(
+                    f"Transaction imbalance detected for event {event.id} ({event.event_type}). "
+                    f"Credit: {credit_sum}, Debit: {debit_sum}"
+                )
 
     logger.info(
-        f"Completed transaction balance check: processed {total_processed} events in {batch_count} batches"
+        f"Completed transaction balance check: processed {total_processed} events in {batch_count} batches, "
+        f"{len(results)} imbalanced"
     )
 
+    if not results:
+        results.append(
+            AccountCheckingResult(
+                check_type="transaction_balance",
+                status=True,
+                details={
+                    "checked_count": total_processed,
+                    "imbalanced_count": 0,
+                    "batches": batch_count,
+                },
+            )
+        )
+
     return results
 
 
+async def count_orphaned_transactions(session: AsyncSession) -> int:
+    """Count transactions with event_ids that don't exist in the events table.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of orphaned transactions
+    """
+    query = text("""
+        SELECT COUNT(*)
+        FROM credit_transactions t
+        WHERE NOT EXISTS (SELECT 1 FROM credit_events e WHERE e.id = t.event_id)
+    """)
+    return await session.scalar(query)
+
+
+async def fetch_orphaned_transactions_sample(
+    session: AsyncSession, limit: int = 100
+) -> List[Dict]:
+    """Fetch a sample of orphaned transactions, serialized as JSON by the database.
+
+    Args:
+        session: Database session
+        limit: Maximum number of transactions to fetch. Default 100.
+
+    Returns:
+        List of orphaned transaction details
+    """
+    query = text("""
+        SELECT COALESCE(json_agg(sample), '[]'::json) as sample
+        FROM (
+            SELECT t.id, t.account_id, t.event_id, t.tx_type, t.credit_debit, t.change_amount, t.credit_type,
+                to_char(t.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"') as created_at
+            FROM credit_transactions t
+            WHERE NOT EXISTS (SELECT 1 FROM credit_events e WHERE e.id = t.event_id)
+            LIMIT :limit
+        ) sample
+    """).columns(sample=JSON)
+    return await session.scalar(query, {"limit": limit})
+
+
+async def count_orphaned_events(session: AsyncSession) -> int:
+    """Count events that don't have any transactions.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of orphaned events
+    """
+    query = text("""
+        SELECT COUNT(*)
+        FROM credit_events e
+        WHERE NOT EXISTS (SELECT 1 FROM credit_transactions t WHERE t.event_id = e.id)
+    """)
+    return await session.scalar(query)
+
+
+async def fetch_orphaned_events_sample(
+    session: AsyncSession, limit: int = 100
+) -> List[Dict]:
+    """Fetch a sample of orphaned events, serialized as JSON by the database.
+
+    Args:
+        session: Database session
+        limit: Maximum number of events to fetch. Default 100.
+
+    Returns:
+        List of orphaned event details
+    """
+    query = text("""
+        SELECT COALESCE(json_agg(sample), '[]'::json) as sample
+        FROM (
+            SELECT e.id as event_id, e.event_type, e.account_id, e.total_amount, e.credit_type,
+                to_char(e.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"') as created_at
+            FROM credit_events e
+            WHERE NOT EXISTS (SELECT 1 FROM credit_transactions t WHERE t.event_id = e.id)
+            LIMIT :limit
+        ) sample
+    """).columns(sample=JSON)
+    return await session.scalar(query, {"limit": limit})
+
+
 async def check_orphaned_transactions() -> List[AccountCheckingResult]:
     """Check for orphaned transactions that don't have a corresponding event.
 
+    The orphaned transactions are counted first, a sample for the report is only
+    fetched if there are any.
+
     Returns:
         List of checking results
     """
+    sample_size = 100  # Limit to first 100 for report size
+
     # Create a new session for this function
     async with get_session() as session:
-        # Find transactions with event_ids that don't exist in the events table
-        query = text("""
-        SELECT t.id, t.account_id, t.event_id, t.tx_type, t.credit_debit, t.change_amount, t.credit_type, t.created_at
-        FROM credit_transactions t
-        LEFT JOIN credit_events e ON t.event_id = e.id
-        WHERE e.id IS NULL
-    """)
-
-        result = await session.execute(query)
-        orphaned_txs = result.fetchall()
-
-        # Process orphaned transactions with a sleep to reduce database load
+        await _begin_read_only(session)
+        orphaned_count = await count_orphaned_transactions(session)
         orphaned_tx_details = []
-        for tx in orphaned_txs[:100]:  # Limit to first 100 for report size
-            # Sleep for 10ms to reduce database load
-            await asyncio.sleep(0.01)
-
-            # Add transaction details to the list
-            orphaned_tx_details.append(
-                {
-                    "id": tx.id,
-                    "account_id": tx.account_id,
-                    "event_id": tx.event_id,
-                    "tx_type": tx.tx_type,
-                    "credit_debit": tx.credit_debit,
-                    "change_amount": float(tx.change_amount),
-                    "credit_type": tx.credit_type,
-                    "created_at": tx.created_at.isoformat() if tx.created_at else None,
-                }
+        if orphaned_count:
+            orphaned_tx_details = await fetch_orphaned_transactions_sample(
+                session, sample_size
             )
 
-        check_result = AccountCheckingResult(
-            check_type="orphaned_transactions",
-            status=(len(orphaned_txs) == 0),
-            details={
-                "orphaned_count": len(orphaned_txs),
-                "orphaned_transactions": orphaned_tx_details,
-            },
-        )
+    check_result = AccountCheckingResult(
+        check_type="orphaned_transactions",
+        status=(orphaned_count == 0),
+        details={
+            "orphaned_count": orphaned_count,
+            "orphaned_transactions": orphaned_tx_details,
+        },
+    )
 
-        if orphaned_txs:
-            logger.warning(
-                f"Found {len(orphaned_txs)} orphaned transactions without corresponding events"
-            )
+    if orphaned_count:
+        logger.warning(
+            f"Found {orphaned_count} orphaned transactions without corresponding events"
+        )
 
     return [check_result]
 
@@ -420,23 +624,19 @@ async def check_orphaned_transactions() -> List[AccountCheckingResult]:
 async def check_orphaned_events() -> List[AccountCheckingResult]:
     """Check for orphaned events that don't have any transactions.
 
+    The orphaned events are counted first, a sample for the report is only
+    fetched if there are any.
+
     Returns:
         List of checking results
     """
+    sample_size = 100  # Limit to first 100 for report size
+
     # Create a new session for this function
     async with get_session() as session:
-        # Find events that don't have any transactions
-        query = text("""
-        SELECT e.id, e.event_type, e.account_id, e.total_amount, e.credit_type, e.created_at
-        FROM credit_events e
-        LEFT JOIN credit_transactions t ON e.id = t.event_id
-        WHERE t.id IS NULL
-    """)
-
-        result = await session.execute(query)
-        orphaned_events = result.fetchall()
-
-        if not orphaned_events:
+        await _begin_read_only(session)
+        orphaned_count = await count_orphaned_events(session)
+        if not orphaned_count:
             return [
                 AccountCheckingResult(
                     check_type="orphaned_events",
@@ -446,239 +646,268 @@ async def check_orphaned_events() -> List[AccountCheckingResult]:
             ]
 
         # If we found orphaned events, report them
-        orphaned_event_ids = [event.id for event in orphaned_events]
-        orphaned_event_details = []
-        for event in orphaned_events:
-            # Sleep for 10ms to reduce database load
-            await asyncio.sleep(0.01)
+        orphaned_event_details = await fetch_orphaned_events_sample(
+            session, sample_size
+        )
 
-            # Add event details to the list
-            orphaned_event_details.append(
-                {
-                    "event_id": event.id,
-                    "event_type": event.event_type,
-                    "account_id": event.account_id,
-                    "total_amount": float(event.total_amount),
-                    "credit_type": event.credit_type,
-                    "created_at": event.created_at.isoformat()
-                    if event.created_at
-                    else None,
-                }
-            )
+    orphaned_event_ids = [event["event_id"] for event in orphaned_event_details]
+    logger.warning(
+        f"Found {orphaned_count} orphaned events with no transactions: {orphaned_event_ids}"
+    )
 
-        logger.warning(
-            f"Found {len(orphaned_events)} orphaned events with no transactions: {orphaned_event_ids}"
+    return [
+        AccountCheckingResult(
+            check_type="orphaned_events",
+            status=False,
+            details={
+                "orphaned_count": orphaned_count,
+                "orphaned_events": orphaned_event_details,
+            },
         )
+    ]
 
-        return [
-            AccountCheckingResult(
-                check_type="orphaned_events",
-                status=False,
-                details={
-                    "orphaned_count": len(orphaned_events),
-                    "orphaned_events": orphaned_event_details,
-                },
-            )
-        ]
+
+async def _query_system_totals() -> Row:
+    """Query the account balance totals and transaction totals in a single round trip."""
+    async with get_session() as session:
+        await _begin_read_only(session)
+        query = text("""
+        WITH account_totals AS (
+            SELECT
+                SUM(free_credits) as total_free_credits,
+                SUM(reward_credits) as total_reward_credits,
+                SUM(credits) as total_permanent_credits
+            FROM credit_accounts
+        ),
+        transaction_totals AS (
+            SELECT
+                SUM(CASE WHEN credit_debit = 'credit' THEN change_amount ELSE 0 END) as total_credits,
+                SUM(CASE WHEN credit_debit = 'debit' THEN change_amount ELSE 0 END) as total_debits
+            FROM credit_transactions
+        )
+        SELECT * FROM account_totals, transaction_totals
+    """)
+
+        result = await session.execute(query)
+        return result.fetchone()
 
 
-async def check_total_credit_balance() -> List[AccountCheckingResult]:
+async def check_total_credit_balance(
+    balance_data: Optional[Row] = None,
+) -> List[AccountCheckingResult]:
     """Check if the sum of all free_credits, reward_credits, and credits across all accounts is 0.
 
     This verifies that the overall credit system is balanced, with all credits accounted for.
 
+    Args:
+        balance_data: System totals already fetched by the caller, queried if not given
+
     Returns:
         List of checking results
     """
-    # Create a new session for this function
-    async with get_session() as session:
-        # Query to sum all credit types across all accounts
-        query = text("""
-        SELECT 
-            SUM(free_credits) as total_free_credits,
-            SUM(reward_credits) as total_reward_credits,
-            SUM(credits) as total_permanent_credits,
-            SUM(free_credits) + SUM(reward_credits) + SUM(credits) as grand_total
-        FROM credit_accounts
-    """)
+    if balance_data is None:
+        balance_data = await _query_system_totals()
 
-        result = await session.execute(query)
-        balance_data = result.fetchone()
-
-        total_free_credits = balance_data.total_free_credits or Decimal("0")
-        total_reward_credits = balance_data.total_reward_credits or Decimal("0")
-        total_permanent_credits = balance_data.total_permanent_credits or Decimal("0")
-        grand_total = balance_data.grand_total or Decimal("0")
+    total_free_credits = balance_data.total_free_credits or Decimal("0")
+    total_reward_credits = balance_data.total_reward_credits or Decimal("0")
+    total_permanent_credits = balance_data.total_permanent_credits or Decimal("0")
+    grand_total = total_free_credits + total_reward_credits + total_permanent_credits
 
-        # Check if the grand total is zero (or very close to zero due to potential floating point issues)
-        is_balanced = grand_total == Decimal("0")
+    # Check if the grand total is zero (or very close to zero due to potential floating point issues)
+    is_balanced = grand_total == Decimal("0")
 
-        # If not exactly zero but very close (due to potential rounding issues), log a warning but still consider it balanced
-        if not is_balanced and abs(grand_total) < Decimal("0.001"):
-            logger.warning(
-                f"Total credit balance is very close to zero but not exact: {grand_total}. "
-                f"This might be due to rounding issues."
-            )
-            is_balanced = True
-
-        result = AccountCheckingResult(
-            check_type="total_credit_balance",
-            status=is_balanced,
-            details={
-                "total_free_credits": float(total_free_credits),
-                "total_reward_credits": float(total_reward_credits),
-                "total_permanent_credits": float(total_permanent_credits),
-                "grand_total": float(grand_total),
-            },
+    # If not exactly zero but very close (due to potential rounding issues), log a warning but still consider it balanced
+    if not is_balanced and abs(grand_total) < Decimal("0.001"):
+        logger.warning(
+            f"Total credit balance is very close to zero but not exact: {grand_total}. "
+            f"This might be due to rounding issues."
         )
+        is_balanced = True
+
+    result = AccountCheckingResult(
+        check_type="total_credit_balance",
+        status=is_balanced,
+        details={
+            "total_free_credits": total_free_credits,
+            "total_reward_credits": total_reward_credits,
+            "total_permanent_credits": total_permanent_credits,
+            "grand_total": grand_total,
+        },
+    )
 
-        if not is_balanced:
-            logger.warning(
-                f"Total credit balance inconsistency detected. System is not balanced. "
-                f"Total: {grand_total} (Free: {total_free_credits}, Reward: {total_reward_credits}, "
-                f"Permanent: {total_permanent_credits})"
-            )
+    if not is_balanced:
+        logger.warning(
+            f"Total credit balance inconsistency detected. System is not balanced. "
+            f"Total: {grand_total} (Free: {total_free_credits}, Reward: {total_reward_credits}, "
+            f"Permanent: {total_permanent_credits})"
+        )
 
     return [result]
 
 
-async def check_transaction_total_balance() -> List[AccountCheckingResult]:
+async def check_transaction_total_balance(
+    balance_data: Optional[Row] = None,
+) -> List[AccountCheckingResult]:
     """Check if the total credit and debit amounts in the CreditTransaction table are balanced.
 
     This verifies that across all transactions in the system, the total credits equal the total debits.
 
+    Args:
+        balance_data: System totals already fetched by the caller, queried if not given
+
     Returns:
         List of checking results
     """
-    # Create a new session for this function
-    async with get_session() as session:
-        # Query to sum all credit and debit transactions
-        query = text("""
-        SELECT 
-            SUM(CASE WHEN credit_debit = 'credit' THEN change_amount ELSE 0 END) as total_credits,
-            SUM(CASE WHEN credit_debit = 'debit' THEN change_amount ELSE 0 END) as total_debits
-        FROM credit_transactions
-    """)
+    if balance_data is None:
+        balance_data = await _query_system_totals()
 
-        result = await session.execute(query)
-        balance_data = result.fetchone()
-
-        total_credits = balance_data.total_credits or Decimal("0")
-        total_debits = balance_data.total_debits or Decimal("0")
-        difference = total_credits - total_debits
+    total_credits = balance_data.total_credits or Decimal("0")
+    total_debits = balance_data.total_debits or Decimal("0")
+    difference = total_credits - total_debits
 
-        # Check if credits and debits are balanced (difference should be zero)
-        is_balanced = difference == Decimal("0")
-
-        # If not exactly zero but very close (due to potential rounding issues), log a warning but still consider it balanced
-        if not is_balanced and abs(difference) < Decimal("0.001"):
-            logger.warning(
-                f"Transaction total balance is very close to zero but not exact: {difference}. "
-                f"This might be due to rounding issues."
-            )
-            is_balanced = True
+    # Check if credits and debits are balanced (difference should be zero)
+    is_balanced = difference == Decimal("0")
 
-        result = AccountCheckingResult(
-            check_type="transaction_total_balance",
-            status=is_balanced,
-            details={
-                "total_credits": float(total_credits),
-                "total_debits": float(total_debits),
-                "difference": float(difference),
-            },
+    # If not exactly zero but very close (due to potential rounding issues), log a warning but still consider it balanced
+    if not is_balanced and abs(difference) < Decimal("0.001"):
+        logger.warning(
+            f"Transaction total balance is very close to zero but not exact: {difference}. "
+            f"This might be due to rounding issues."
         )
+        is_balanced = True
+
+    result = AccountCheckingResult(
+        check_type="transaction_total_balance",
+        status=is_balanced,
+        details={
+            "total_credits": total_credits,
+            "total_debits": total_debits,
+            "difference": difference,
+        },
+    )
 
-        if not is_balanced:
-            logger.warning(
-                f"Transaction total balance inconsistency detected. System is not balanced. "
-                f"Credits: {total_credits}, Debits: {total_debits}, Difference: {difference}"
-            )
+    if not is_balanced:
+        logger.warning(
+            f"Transaction total balance inconsistency detected. System is not balanced. "
+            f"Credits: {total_credits}, Debits: {total_debits}, Difference: {difference}"
+        )
 
     return [result]
 
 
-async def run_quick_checks() -> Dict[str, List[AccountCheckingResult]]:
-    """Run quick account checking procedures and return results.
+def _count_results(check_results: List[AccountCheckingResult]) -> Tuple[int, int]:
+    """Count the checked and failed items of a check.
 
-    These checks are designed to be fast and can be run frequently.
-
-    Returns:
-        Dictionary mapping check names to their results
+    Checks that end with a summary result are counted from its checked_count and
+    failed_count, the others by their number of results.
     """
-    logger.info("Starting quick account checking procedures")
+    if check_results and "failed_count" in check_results[-1].details:
+        details = check_results[-1].details
+        return details["checked_count"], details["failed_count"]
+    return len(check_results), sum(1 for result in check_results if not result.status)
 
-    results = {}
-    # Quick checks don't need a session at this level as each function creates its own session
-    results["transaction_balance"] = await check_transaction_balance()
-    results["orphaned_transactions"] = await check_orphaned_transactions()
-    results["orphaned_events"] = await check_orphaned_events()
-    results["total_credit_balance"] = await check_total_credit_balance()
-    results["transaction_total_balance"] = await check_transaction_total_balance()
 
-    # Log summary
-    all_passed = True
-    failed_count = 0
-    for check_name, check_results in results.items():
-        check_failed_count = sum(1 for result in check_results if not result.status)
-        failed_count += check_failed_count
+def _report_results(name: str, results: Dict[str, List[AccountCheckingResult]]) -> None:
+    """Log the summary of a checking run and send it to Slack.
+
+    Args:
+        name: Name of the checking run, like "quick" or "slow"
+        results: Dictionary mapping check names to their results
+    """
+    # Count total and failed results of each check once, reused for logging and Slack
+    summary = {
+        check_name: _count_results(check_results)
+        for check_name, check_results in results.items()
+    }
+    total_checks = sum(total for total, _ in summary.values())
+    failed_count = sum(failed for _, failed in summary.values())
+    all_passed = failed_count == 0
 
+    # Log summary
+    for check_name, (check_total, check_failed_count) in summary.items():
         if check_failed_count > 0:
             logger.warning(
-                f"{check_name}: {check_failed_count} of {len(check_results)} checks failed"
+                f"{check_name}: {check_failed_count} of {check_total} checks failed"
             )
-            all_passed = False
         else:
-            logger.info(f"{check_name}: All {len(check_results)} checks passed")
+            logger.info(f"{check_name}: All {check_total} checks passed")
 
     if all_passed:
-        logger.info("All quick account checks passed successfully")
+        logger.info(f"All {name} account checks passed successfully")
     else:
         logger.warning(
-            f"Quick account checking summary: {failed_count} checks failed - see logs for details"
+            f"{name.capitalize()} account checking summary: {failed_count} checks failed - see logs for details"
         )
 
     # Send summary to Slack
     from intentkit.utils.slack_alert import send_slack_message
 
     # Create a summary message with color based on status
-    total_checks = sum(len(check_results) for check_results in results.values())
-
+    label = f"{name.capitalize()} Account Checking"
     if all_passed:
         color = "good"  # Green color
-        title = "✅ Quick Account Checking Completed Successfully"
-        text = f"All {total_checks} quick account checks passed successfully."
+        title = f"✅ {label} Completed Successfully"
+        text = f"All {total_checks} {name} account checks passed successfully."
         notify = ""  # No notification needed for success
     else:
         color = "danger"  # Red color
-        title = "❌ Quick Account Checking Found Issues"
-        text = f"Quick account checking found {failed_count} issues out of {total_checks} checks."
+        title = f"❌ {label} Found Issues"
+        text = f"{name.capitalize()} account checking found {failed_count} issues out of {total_checks} checks."
         notify = "<!channel> "  # Notify channel for failures
 
-    # Create attachments with check details
-    attachments = [{"color": color, "title": title, "text": text, "fields": []}]
-
-    # Add fields for each check type
-    for check_name, check_results in results.items():
-        check_failed_count = sum(1 for result in check_results if not result.status)
-        check_status = (
-            "✅ Passed"
+    # Create attachments with a field for each check type
+    fields = [
+        {
+            "title": check_name.replace("_", " ").title(),
+            "value": "✅ Passed"
             if check_failed_count == 0
-            else f"❌ Failed ({check_failed_count} issues)"
-        )
-
-        attachments[0]["fields"].append(
-            {
-                "title": check_name.replace("_", " ").title(),
-                "value": check_status,
-                "short": True,
-            }
-        )
+            else f"❌ Failed ({check_failed_count} issues)",
+            "short": True,
+        }
+        for check_name, (_, check_failed_count) in summary.items()
+    ]
+    attachments = [{"color": color, "title": title, "text": text, "fields": fields}]
 
     # Send the message
-    send_slack_message(
-        message=f"{notify}Quick Account Checking Results", attachments=attachments
+    send_slack_message(message=f"{notify}{label} Results", attachments=attachments)
+
+
+async def run_quick_checks(
+    mode: Literal["full", "fast"] = "full",
+) -> Dict[str, List[AccountCheckingResult]]:
+    """Run quick account checking procedures and return results.
+
+    These checks are designed to be fast and can be run frequently.
+
+    Args:
+        mode: "full" runs all quick checks. "fast" only runs the two system-wide
+            total balance checks, which need a single aggregate query. Default "full".
+
+    Returns:
+        Dictionary mapping check names to their results
+    """
+    logger.info(f"Starting quick account checking procedures ({mode} mode)")
+
+    # Each check opens its own session, so they are independent and can run
+    # concurrently with the system totals query to overlap database wait time
+    checks = {}
+    if mode == "full":
+        checks["transaction_balance"] = check_transaction_balance()
+        checks["orphaned_transactions"] = check_orphaned_transactions()
+        checks["orphaned_events"] = check_orphaned_events()
+    balance_data, *check_results = await asyncio.gather(
+        _query_system_totals(), *checks.values()
+    )
+    results = dict(zip(checks.keys(), check_results))
+
+    # Both total balance checks read the same totals, queried once above
+    results["total_credit_balance"] = await check_total_credit_balance(balance_data)
+    results["transaction_total_balance"] = await check_transaction_total_balance(
+        balance_data
     )
 
+    _report_results("quick", results)
+
     return results
 
 
@@ -696,69 +925,7 @@ async def run_slow_checks() -> Dict[str, List[AccountCheckingResult]]:
     # Slow checks don't need a session at this level as each function creates its own session
     results["account_balance"] = await check_account_balance_consistency()
 
-    # Log summary
-    all_passed = True
-    failed_count = 0
-    for check_name, check_results in results.items():
-        check_failed_count = sum(1 for result in check_results if not result.status)
-        failed_count += check_failed_count
-
-        if check_failed_count > 0:
-            logger.warning(
-                f"{check_name}: {check_failed_count} of {len(check_results)} checks failed"
-            )
-            all_passed = False
-        else:
-            logger.info(f"{check_name}: All {len(check_results)} checks passed")
-
-    if all_passed:
-        logger.info("All slow account checks passed successfully")
-    else:
-        logger.warning(
-            f"Slow account checking summary: {failed_count} checks failed - see logs for details"
-        )
-
-    # Send summary to Slack
-    from intentkit.utils.slack_alert import send_slack_message
-
-    # Create a summary message with color based on status
-    total_checks = sum(len(check_results) for check_results in results.values())
-
-    if all_passed:
-        color = "good"  # Green color
-        title = "✅ Slow Account Checking Completed Successfully"
-        text = f"All {total_checks} slow account checks passed successfully."
-        notify = ""  # No notification needed for success
-    else:
-        color = "danger"  # Red color
-        title = "❌ Slow Account Checking Found Issues"
-        text = f"Slow account checking found {failed_count} issues out of {total_checks} checks."
-        notify = "<!channel> "  # Notify channel for failures
-
-    # Create attachments with check details
-    attachments = [{"color": color, "title": title, "text": text, "fields": []}]
-
-    # Add fields for each check type
-    for check_name, check_results in results.items():
-        check_failed_count = sum(1 for result in check_results if not result.status)
-        check_status = (
-            "✅ Passed"
-            if check_failed_count == 0
-            else f"❌ Failed ({check_failed_count} issues)"
-        )
-
-        attachments[0]["fields"].append(
-            {
-                "title": check_name.replace("_", " ").title(),
-                "value": check_status,
-                "short": True,
-            }
-        )
-
-    # Send the message
-    send_slack_message(
-        message=f"{notify}Slow Account Checking Results", attachments=attachments
-    )
+    _report_results("slow", results)
 
     return results
 
@@ -771,20 +938,19 @@ async def main():
     # Test the modified check_account_balance_consistency function with permanent checking
     results = await check_account_balance_consistency(check_recent_only=False)
 
-    # Print summary of results
-    total_accounts = len(results)
-    failed_accounts = sum(1 for result in results if not result.status)
-    passed_accounts = total_accounts - failed_accounts
+    # Print summary of results, the last result holds the counts of the whole run
+    *failed_results, summary = results
+    failed_accounts = summary.details["failed_count"]
 
     logger.info("Account balance consistency check completed:")
-    logger.info(f"  Total accounts checked: {total_accounts}")
-    logger.info(f"  Passed: {passed_accounts}")
+    logger.info(f"  Checked: {summary.details['checked_count']}")
+    logger.info(f"  Passed: {summary.details['passed_count']}")
     logger.info(f"  Failed: {failed_accounts}")
 
     if failed_accounts > 0:
         logger.warning(f"Found {failed_accounts} accounts with balance inconsistencies")
         # Log details of first few failed accounts for debugging
-        for i, result in enumerate([r for r in results if not r.status][:5]):
+        for i, result in enumerate(failed_results[:5]):
             details = result.details
             logger.warning(
                 f"  Account {i + 1}: {details['account_id']} - "
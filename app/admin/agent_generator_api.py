@@ -3,25 +3,33 @@
 FastAPI endpoints for generating agent schemas from natural language prompts.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Type
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field, validator
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from pydantic import BaseModel, Field, field_validator
 
 from app.admin.generator import generate_validated_agent_schema
 from app.admin.generator.conversation_service import (
+    ConversationService,
     get_conversation_history,
+    get_conversation_summary,
     get_project_metadata,
     get_projects_by_user,
+    update_project_tags,
 )
 from app.admin.generator.llm_logger import (
     LLMLogger,
     create_llm_logger,
 )
 from app.admin.generator.utils import generate_tags_from_nation_api
+from intentkit.config.config import config
 from intentkit.models.agent import AgentUpdate
+from intentkit.models.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +39,139 @@ router = APIRouter(
     tags=["Agent"],
 )
 
+# Generation history responses are cached in Redis when it is configured, so an
+# invalidation after a write reaches every API worker. Without Redis they are
+# cached in this process only, which is consistent for a single worker only.
+_history_cache_prefix = "intentkit:agent_generator:history"
+
+# In-memory cache, used when Redis is not configured
+_cache: Dict[str, Dict[str, Any]] = {}
+_generations_cache_ttl = 30  # seconds
+_generation_detail_cache_ttl = 60  # seconds
+_cache_max_size = 1024
+_generation_result_cache_ttl = 3600  # seconds
+
+# Futures of generations in progress by result cache key, identical concurrent
+# requests wait for the first one instead of starting their own
+_inflight_generations: Dict[str, asyncio.Future] = {}
+
+
+def _get_cached_response(key: str, ttl: int) -> Optional[Any]:
+    """Get a cached response if it has not expired."""
+    cached = _cache.get(key)
+    if cached and time.time() - cached["timestamp"] < ttl:
+        return cached["data"]
+    return None
+
+
+def _set_cached_response(key: str, data: Any) -> None:
+    """Cache a response, evicting the oldest entry when full."""
+    _cache.pop(key, None)
+    if len(_cache) >= _cache_max_size:
+        _cache.pop(next(iter(_cache)))
+    _cache[key] = {"data": data, "timestamp": time.time()}
+
+
+async def _get_cached_history(
+    scope: str, key: str, ttl: int, model: Type[BaseModel]
+) -> Optional[BaseModel]:
+    """Get a cached history response from Redis, or memory if Redis is off."""
+    cache_key = f"{_history_cache_prefix}:{scope}:{key}"
+    if not config.redis_host:
+        return _get_cached_response(cache_key, ttl)
+    try:
+        cached = await get_redis().get(cache_key)
+    except Exception as e:
+        logger.warning("Failed to read generation history cache: %s", e)
+        return None
+    return model.model_validate_json(cached) if cached else None
+
+
+async def _set_cached_history(
+    scope: str, key: str, ttl: int, response: BaseModel
+) -> None:
+    """Cache a history response in Redis, or memory if Redis is off.
+
+    In Redis every scope keeps a set of its cached keys, so invalidating a scope
+    doesn't need to scan the keyspace.
+    """
+    cache_key = f"{_history_cache_prefix}:{scope}:{key}"
+    if not config.redis_host:
+        _set_cached_response(cache_key, response)
+        return
+    index_key = f"{_history_cache_prefix}:keys:{scope}"
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.set(cache_key, response.model_dump_json(), ex=ttl)
+            pipe.sadd(index_key, cache_key)
+            pipe.expire(index_key, ttl)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("Failed to write generation history cache: %s", e)
+
+
+async def _invalidate_generation_cache(project_id: str) -> None:
+    """Drop cached history responses that may include the given project."""
+    scopes = ("generations", f"generation:{project_id}")
+    if not config.redis_host:
+        prefixes = tuple(f"{_history_cache_prefix}:{scope}:" for scope in scopes)
+        for key in list(_cache):
+            if key.startswith(prefixes):
+                _cache.pop(key, None)
+        return
+    index_keys = [f"{_history_cache_prefix}:keys:{scope}" for scope in scopes]
+    try:
+        redis = get_redis()
+        cached_keys = await redis.sunion(index_keys)
+        await redis.delete(*cached_keys, *index_keys)
+    except Exception as e:
+        logger.warning("Failed to invalidate generation history cache: %s", e)
+
+
+def _generation_context_key(request: "AgentGenerateRequest") -> str:
+    """Hash everything besides the prompt that affects a generation result."""
+    payload = json.dumps(
+        {
+            "existing_agent": request.existing_agent.model_dump(mode="json")
+            if request.existing_agent
+            else None,
+            "user_id": request.user_id,
+            "release": config.release,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _generation_result_cache_key(request: "AgentGenerateRequest") -> str:
+    """Build a content-addressed cache key for a generation request."""
+    payload = f"{_generation_context_key(request)}:{request.prompt}"
+    digest = hashlib.sha256(payload.encode()).hexdigest()
+    return f"intentkit:agent_generator:result:{digest}"
+
+
+async def _get_cached_generation_result(key: str) -> Optional[Dict[str, Any]]:
+    """Get a cached generation result from Redis, or memory if Redis is off."""
+    if not config.redis_host:
+        return _get_cached_response(key, _generation_result_cache_ttl)
+    try:
+        cached = await get_redis().get(key)
+    except Exception as e:
+        logger.warning("Failed to read generation result cache: %s", e)
+        return None
+    return json.loads(cached) if cached else None
+
+
+async def _set_cached_generation_result(key: str, result: Dict[str, Any]) -> None:
+    """Cache a generation result in Redis, or memory if Redis is off."""
+    if not config.redis_host:
+        _set_cached_response(key, result)
+        return
+    try:
+        await get_redis().set(key, json.dumps(result), ex=_generation_result_cache_ttl)
+    except Exception as e:
+        logger.warning("Failed to write generation result cache: %s", e)
+
 
 class AgentGenerateRequest(BaseModel):
     """Request model for agent generation."""
@@ -56,20 +197,14 @@ class AgentGenerateRequest(BaseModel):
         description="Project ID for conversation history. If not provided, a new project will be created.",
     )
 
-    @validator("prompt")
-    def validate_prompt_length(cls, v):
-        if len(v) < 10:
-            raise ValueError(
-                "Prompt is too short. Please provide at least 10 characters describing the agent's capabilities."
-            )
-        if len(v) > 1000:
-            raise ValueError(
-                "Prompt is too long. Please keep your description under 1000 characters to ensure efficient processing."
-            )
-        return v
+    defer_tags: bool = Field(
+        False,
+        description="Generate tags in the background instead of in the response. Poll GET /agent/generations/{project_id}/tags for the result.",
+    )
 
-    @validator("user_id")
-    def validate_user_id(cls, v):
+    @field_validator("user_id")
+    @classmethod
+    def validate_user_id(cls, v: str) -> str:
         if not v or not v.strip():
             raise ValueError(
                 "User ID is required and cannot be empty. Please provide a valid user identifier."
@@ -93,6 +228,11 @@ class AgentGenerateResponse(BaseModel):
         description="Generated tags for the agent as ID objects: [{'id': 1}, {'id': 2}]",
     )
 
+    tags_status: str = Field(
+        "ready",
+        description="'ready' if tags are included, 'pending' if they are generated in the background",
+    )
+
     autonomous_tasks: List[Dict[str, Any]] = Field(
         default_factory=list,
         description="List of autonomous tasks generated for the agent",
@@ -104,6 +244,46 @@ class AgentGenerateResponse(BaseModel):
     )
 
 
+class AgentGenerateBatchRequest(BaseModel):
+    """Request model for batch agent generation."""
+
+    items: List[AgentGenerateRequest] = Field(
+        ...,
+        description="Agent generation requests to process",
+        min_length=1,
+        max_length=20,
+    )
+
+    max_concurrency: int = Field(
+        default=4,
+        description="Maximum number of generations running at the same time",
+        ge=1,
+        le=8,
+    )
+
+
+class AgentGenerateBatchItemResult(BaseModel):
+    """Result of one item in a batch agent generation."""
+
+    success: bool = Field(..., description="Whether the agent was generated")
+
+    result: Optional[AgentGenerateResponse] = Field(
+        None, description="The generation result if successful"
+    )
+
+    error: Optional[Dict[str, Any]] = Field(
+        None, description="Error detail if the generation failed"
+    )
+
+
+class AgentGenerateBatchResponse(BaseModel):
+    """Response model for batch agent generation."""
+
+    results: List[AgentGenerateBatchItemResult] = Field(
+        ..., description="Per-item results, in the same order as the request items"
+    )
+
+
 class GenerationsListRequest(BaseModel):
     """Request model for getting generations list."""
 
@@ -132,6 +312,9 @@ class GenerationDetailResponse(BaseModel):
     user_id: Optional[str] = Field(None, description="User ID who owns this project")
     created_at: Optional[str] = Field(None, description="Project creation timestamp")
     last_activity: Optional[str] = Field(None, description="Last activity timestamp")
+    conversation_history: List[Dict[str, Any]] = Field(
+        ..., description="Page of conversation history, oldest first"
+    )
     message_count: int = Field(..., description="Number of messages in conversation")
     last_message: Optional[Dict[str, Any]] = Field(
         None, description="Last message in conversation"
@@ -139,66 +322,81 @@ class GenerationDetailResponse(BaseModel):
     first_message: Optional[Dict[str, Any]] = Field(
         None, description="First message in conversation"
     )
-    conversation_history: List[Dict[str, Any]] = Field(
-        ..., description="Full conversation history"
+    offset: int = Field(0, description="Offset of the first returned message")
+    has_more: bool = Field(
+        False, description="Whether more messages exist after this page"
+    )
+    next_offset: Optional[int] = Field(
+        None, description="Offset to request the next page, if any"
     )
 
 
-@router.post(
-    "/generate",
-    summary="Generate Agent from Natural Language Prompt",
-    response_model=AgentGenerateResponse,
-)
-async def generate_agent(
-    request: AgentGenerateRequest,
-) -> AgentGenerateResponse:
-    """Generate an agent schema from a natural language prompt.
+class GenerationTagsResponse(BaseModel):
+    """Response model for generated tags of a project."""
 
-    Converts plain English descriptions into complete, validated agent configurations.
-    Automatically identifies required skills, sets up configurations, detects autonomous
-    task patterns, and ensures everything works correctly with intelligent error correction.
+    project_id: str = Field(..., description="Project ID")
+    status: str = Field(
+        ..., description="'ready' once tags are stored, 'pending' otherwise"
+    )
+    tags: List[Dict[str, int]] = Field(
+        default_factory=list,
+        description="Generated tags for the agent as ID objects: [{'id': 1}, {'id': 2}]",
+    )
 
-    **Autonomous Task Detection:**
-    The API can automatically detect scheduling patterns in prompts like:
-    - "Buy 0.1 ETH every hour" → Creates 60-minute autonomous task with CDP trade skill
-    - "Check portfolio daily" → Creates 24-hour autonomous task with portfolio skills
-    - "Post tweet every 30 minutes" → Creates 30-minute autonomous task with Twitter skill
 
-    **Request Body:**
-    * `prompt` - Natural language description of the agent's desired capabilities and schedule
-    * `existing_agent` - Optional existing agent to update (preserves current setup while adding capabilities)
-    * `user_id` - Required user ID for logging and rate limiting
-    * `project_id` - Optional project ID for conversation history
+async def _generate_and_store_tags(
+    project_id: str, agent_schema: Dict[str, Any], prompt: str
+) -> None:
+    """Generate tags for a generated agent and store them on its project."""
+    try:
+        tags = await generate_tags_from_nation_api(agent_schema, prompt)
+        await update_project_tags(project_id, tags)
+        await _invalidate_generation_cache(project_id)
+        logger.info("Stored %d background tags for project %s", len(tags), project_id)
+    except Exception as e:
+        logger.exception(
+            "Failed to generate background tags for project %s: %s", project_id, e
+        )
 
-    **Returns:**
-    * `AgentGenerateResponse` - Contains agent schema, autonomous tasks, activated skills, project ID, and summary
 
-    **Response Fields:**
-    * `agent` - Complete agent schema with skills and autonomous configurations
-    * `autonomous_tasks` - List of autonomous tasks detected and configured
-    * `activated_skills` - List of skills that were activated based on the prompt
-    * `project_id` - Project ID for conversation tracking
-    * `summary` - Human-readable summary of the generated agent
-    * `tags` - Generated tags for categorization
+async def _generate_agent_impl(
+    request: AgentGenerateRequest,
+    *,
+    background_tasks: Optional[BackgroundTasks] = None,
+    no_cache: bool = False,
+) -> AgentGenerateResponse:
+    """Generate an agent for one request, shared by the single and batch endpoints.
 
-    **Raises:**
-    * `HTTPException`:
-      - 400: Invalid request (missing user_id, invalid prompt format or length)
-      - 500: Agent generation failed after retries
+    Args:
+        request: The agent generation request
+        background_tasks: Runs deferred tag generation after the response, without
+            it tags are generated inline even if the request defers them
+        no_cache: Skip the cached result for an identical request
+
+    Returns:
+        The generation response
+
+    Raises:
+        HTTPException: 500 if the generation failed after retries, or a cached
+            result could not be recorded under the project
     """
+    # Deferred tags need a background task runner, otherwise they are generated inline
+    defer_tags = request.defer_tags and background_tasks is not None
+
     # Create or reuse LLM logger based on project_id
     if request.project_id:
         llm_logger = LLMLogger(request_id=request.project_id, user_id=request.user_id)
         project_id = request.project_id
-        logger.info(f"Using existing project_id: {project_id}")
+        logger.info("Using existing project_id: %s", project_id)
     else:
         llm_logger = create_llm_logger(user_id=request.user_id)
         project_id = llm_logger.request_id
-        logger.info(f"Created new project_id: {project_id}")
+        logger.info("Created new project_id: %s", project_id)
 
     logger.info(
-        f"Agent generation request received: {request.prompt[:100]}... "
-        f"(project_id={project_id})"
+        "Agent generation request received: %.100s... (project_id=%s)",
+        request.prompt,
+        project_id,
     )
 
     # Determine if this is an update operation
@@ -206,72 +404,150 @@ async def generate_agent(
 
     if is_update:
         logger.info(
-            f"Processing agent update with existing agent data (project_id={project_id})"
+            "Processing agent update with existing agent data (project_id=%s)",
+            project_id,
         )
 
+    result_cache_key = None
+    inflight = None
     try:
+        # Reuse the result of an identical request, only for new projects because
+        # existing ones feed their conversation history into generation
+        if not request.project_id and not no_cache:
+            result_cache_key = _generation_result_cache_key(request)
+            cached = await _get_cached_generation_result(result_cache_key)
+            cache_type = "exact"
+            if cached is None and result_cache_key in _inflight_generations:
+                # Shielded so a cancelled request doesn't cancel the shared future,
+                # a None result means the first request failed and we generate here
+                cached = await asyncio.shield(_inflight_generations[result_cache_key])
+                cache_type = "inflight"
+            if cached is not None:
+                logger.info(
+                    "Generation cache hit (type=%s, project_id=%s)",
+                    cache_type,
+                    project_id,
+                )
+                conversation_service = ConversationService(
+                    project_id=project_id, user_id=request.user_id
+                )
+                await conversation_service.add_user_message(request.prompt)
+                await conversation_service.add_assistant_message(
+                    content=cached["summary"],
+                    message_metadata={
+                        "call_type": "agent_generation_cached",
+                        "identified_skills": cached["activated_skills"],
+                    },
+                )
+                await update_project_tags(project_id, cached["tags"])
+                await _invalidate_generation_cache(project_id)
+                return AgentGenerateResponse(project_id=project_id, **cached)
+
+        # Deferred results have no tags yet, so they are not shared or cached
+        if (
+            result_cache_key
+            and not defer_tags
+            and result_cache_key not in _inflight_generations
+        ):
+            inflight = asyncio.get_running_loop().create_future()
+            _inflight_generations[result_cache_key] = inflight
+
         # Generate agent schema with automatic validation and AI self-correction
+        # Tags are generated alongside the summary once the schema is valid,
+        # unless the request defers them to a background task
         (
             agent_schema,
             identified_skills,
             summary,
+            tags,
         ) = await generate_validated_agent_schema(
             prompt=request.prompt,
             user_id=request.user_id,
             existing_agent=request.existing_agent,
             llm_logger=llm_logger,
+            generate_tags=not defer_tags,
         )
 
-        # Generate tags using Nation API
-        tags = await generate_tags_from_nation_api(agent_schema, request.prompt)
-
         logger.info(
-            f"Agent generation completed successfully (project_id={project_id})"
+            "Agent generation completed successfully (project_id=%s)", project_id
         )
+
+        # Store tags on the project, generating them after the response if deferred
+        if defer_tags:
+            background_tasks.add_task(
+                _generate_and_store_tags, project_id, agent_schema, request.prompt
+            )
+        else:
+            await update_project_tags(project_id, tags)
         if is_update:
             logger.info(
-                f"Agent schema updated via minimal changes with AI self-correction (project_id={project_id})"
+                "Agent schema updated via minimal changes with AI self-correction (project_id=%s)",
+                project_id,
             )
         else:
             logger.info(
-                f"New agent schema generated successfully with validation (project_id={project_id})"
+                "New agent schema generated successfully with validation (project_id=%s)",
+                project_id,
             )
 
         # Extract autonomous tasks and activated skills from the schema
         autonomous_tasks = agent_schema.get("autonomous", [])
         activated_skills = list(agent_schema.get("skills", {}).keys())
 
+        if inflight is not None:
+            result = {
+                "agent": agent_schema,
+                "summary": summary,
+                "tags": tags,
+                "autonomous_tasks": autonomous_tasks,
+                "activated_skills": activated_skills,
+            }
+            inflight.set_result(result)
+            await _set_cached_generation_result(result_cache_key, result)
+
         # Enhanced logging for autonomous functionality
-        if autonomous_tasks:
-            logger.info(f" Autonomous tasks detected: {len(autonomous_tasks)} tasks")
-            for task in autonomous_tasks:
-                schedule_info = (
-                    f"{task.get('minutes')} minutes"
-                    if task.get("minutes")
-                    else task.get("cron", "unknown")
+        if logger.isEnabledFor(logging.INFO):
+            if autonomous_tasks:
+                logger.info(
+                    " Autonomous tasks detected: %d tasks", len(autonomous_tasks)
                 )
-                logger.info(f"  '{task.get('name', 'Unnamed Task')}' - {schedule_info}")
-        else:
-            logger.info(" No autonomous tasks in generated agent")
+                for task in autonomous_tasks:
+                    schedule_info = (
+                        f"{task.get('minutes')} minutes"
+                        if task.get("minutes")
+                        else task.get("cron", "unknown")
+                    )
+                    logger.info(
+                        "  '%s' - %s", task.get("name", "Unnamed Task"), schedule_info
+                    )
+            else:
+                logger.info(" No autonomous tasks in generated agent")
 
-        logger.info(
-            f" Activated skills: {len(activated_skills)} skills - {activated_skills}"
-        )
+            logger.info(
+                " Activated skills: %d skills - %s",
+                len(activated_skills),
+                activated_skills,
+            )
 
+        await _invalidate_generation_cache(project_id)
         return AgentGenerateResponse(
             agent=agent_schema,
             project_id=project_id,
             summary=summary,
             tags=tags,
+            tags_status="pending" if defer_tags else "ready",
             autonomous_tasks=autonomous_tasks,
             activated_skills=activated_skills,
         )
 
     except Exception as e:
+        # Messages may have been stored before the failure
+        await _invalidate_generation_cache(project_id)
         # All internal retries and AI self-correction failed
-        logger.error(
-            f"Agent generation failed after all attempts (project_id={project_id}): {str(e)}",
-            exc_info=True,
+        logger.exception(
+            "Agent generation failed after all attempts (project_id=%s): %s",
+            project_id,
+            e,
         )
         raise HTTPException(
             status_code=500,
@@ -281,6 +557,129 @@ async def generate_agent(
                 "project_id": project_id,
             },
         )
+    finally:
+        if inflight is not None:
+            _inflight_generations.pop(result_cache_key, None)
+            if not inflight.done():
+                inflight.set_result(None)
+
+
+@router.post(
+    "/generate",
+    summary="Generate Agent from Natural Language Prompt",
+    response_model=AgentGenerateResponse,
+)
+async def generate_agent(
+    request: AgentGenerateRequest,
+    background_tasks: BackgroundTasks,
+    no_cache: bool = Query(
+        False, description="Skip the cached result for an identical request"
+    ),
+) -> AgentGenerateResponse:
+    """Generate an agent schema from a natural language prompt.
+
+    Converts plain English descriptions into complete, validated agent configurations.
+    Automatically identifies required skills, sets up configurations, detects autonomous
+    task patterns, and ensures everything works correctly with intelligent error correction.
+
+    **Autonomous Task Detection:**
+    The API can automatically detect scheduling patterns in prompts like:
+    - "Buy 0.1 ETH every hour" → Creates 60-minute autonomous task with CDP trade skill
+    - "Check portfolio daily" → Creates 24-hour autonomous task with portfolio skills
+    - "Post tweet every 30 minutes" → Creates 30-minute autonomous task with Twitter skill
+
+    **Request Body:**
+    * `prompt` - Natural language description of the agent's desired capabilities and schedule
+    * `existing_agent` - Optional existing agent to update (preserves current setup while adding capabilities)
+    * `user_id` - Required user ID for logging and rate limiting
+    * `project_id` - Optional project ID for conversation history
+    * `defer_tags` - Optional, generate tags in the background to return sooner
+
+    **Query Parameters:**
+    * `no_cache` - Skip the cached result for an identical new-project request
+
+    Requests without a `project_id` reuse the result of an identical prompt from
+    the last hour, recorded under the new project. Requests that continue
+    a project always generate, since earlier messages can change the result.
+
+    **Returns:**
+    * `AgentGenerateResponse` - Contains agent schema, autonomous tasks, activated skills, project ID, and summary
+
+    **Response Fields:**
+    * `agent` - Complete agent schema with skills and autonomous configurations
+    * `autonomous_tasks` - List of autonomous tasks detected and configured
+    * `activated_skills` - List of skills that were activated based on the prompt
+    * `project_id` - Project ID for conversation tracking
+    * `summary` - Human-readable summary of the generated agent
+    * `tags` - Generated tags for categorization, empty while `tags_status` is pending
+    * `tags_status` - `ready`, or `pending` when tags are generated in the background
+
+    **Raises:**
+    * `HTTPException`:
+      - 400: Invalid request (missing user_id, invalid prompt format or length)
+      - 500: Agent generation failed after retries
+    """
+    return await _generate_agent_impl(
+        request, background_tasks=background_tasks, no_cache=no_cache
+    )
+
+
+@router.post(
+    "/generate/batch",
+    summary="Generate Multiple Agents from Natural Language Prompts",
+    response_model=AgentGenerateBatchResponse,
+)
+async def generate_agents_batch(
+    request: AgentGenerateBatchRequest,
+    background_tasks: BackgroundTasks,
+) -> AgentGenerateBatchResponse:
+    """Generate several agent schemas in one request.
+
+    Each item is processed exactly like a `/agent/generate` request. Items run
+    concurrently, at most `max_concurrency` at a time, so the batch takes about
+    as long as its slowest items instead of the sum of all of them.
+
+    **Request Body:**
+    * `items` - List of generation requests (1 to 20), same format as `/agent/generate`
+    * `max_concurrency` - Maximum number of generations running at once (1 to 8, default: 4)
+
+    **Returns:**
+    * `AgentGenerateBatchResponse` - Per-item results in request order, each with
+      either the generation result or the error detail
+    """
+    logger.info(
+        "Batch agent generation request received: %d items, max_concurrency=%d",
+        len(request.items),
+        request.max_concurrency,
+    )
+    semaphore = asyncio.Semaphore(request.max_concurrency)
+
+    async def generate_one(item: AgentGenerateRequest) -> AgentGenerateBatchItemResult:
+        async with semaphore:
+            try:
+                result = await _generate_agent_impl(
+                    item, background_tasks=background_tasks
+                )
+                return AgentGenerateBatchItemResult(success=True, result=result)
+            except HTTPException as e:
+                detail = e.detail if isinstance(e.detail, dict) else {"msg": e.detail}
+                return AgentGenerateBatchItemResult(success=False, error=detail)
+            except Exception as e:
+                # One failing item must not fail the rest of the batch
+                logger.exception("Batch item generation failed: %s", e)
+                return AgentGenerateBatchItemResult(
+                    success=False,
+                    error={"error": "AgentGenerationFailed", "msg": str(e)},
+                )
+
+    results = await asyncio.gather(*(generate_one(item) for item in request.items))
+
+    logger.info(
+        "Batch agent generation completed: %d/%d succeeded",
+        sum(1 for r in results if r.success),
+        len(results),
+    )
+    return AgentGenerateBatchResponse(results=results)
 
 
 @router.get(
@@ -308,17 +707,28 @@ async def get_generations(
     if limit < 1 or limit > 100:
         raise HTTPException(status_code=400, detail="Limit must be between 1 and 100")
 
-    logger.info(f"Getting generations for user_id={user_id}, limit={limit}")
+    logger.info("Getting generations for user_id=%s, limit=%d", user_id, limit)
+
+    cache_key = f"{user_id}:{limit}"
+    cached = await _get_cached_history(
+        "generations", cache_key, _generations_cache_ttl, GenerationsListResponse
+    )
+    if cached is not None:
+        return cached
 
     try:
         # Get recent projects with their conversation history
         projects = await get_projects_by_user(user_id=user_id, limit=limit)
 
-        logger.info(f"Retrieved {len(projects)} projects for user {user_id}")
-        return GenerationsListResponse(projects=projects)
+        logger.info("Retrieved %d projects for user %s", len(projects), user_id)
+        response = GenerationsListResponse(projects=projects)
+        await _set_cached_history(
+            "generations", cache_key, _generations_cache_ttl, response
+        )
+        return response
 
     except Exception as e:
-        logger.error(f"Failed to retrieve generations: {str(e)}", exc_info=True)
+        logger.exception("Failed to retrieve generations: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -334,7 +744,10 @@ async def get_generations(
     response_model=GenerationDetailResponse,
 )
 async def get_generation_detail(
-    project_id: str, user_id: Optional[str] = None
+    project_id: str,
+    user_id: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 100,
 ) -> GenerationDetailResponse:
     """Get specific project conversation history.
 
@@ -343,68 +756,93 @@ async def get_generation_detail(
 
     **Query Parameters:**
     * `user_id` - Optional user ID for access validation
+    * `offset` - Number of messages to skip, oldest first (default: 0)
+    * `limit` - Maximum number of messages to return (default: 100, max: 500)
 
     **Returns:**
-    * `GenerationDetailResponse` - Contains full conversation history for the project
+    * `GenerationDetailResponse` - Contains a page of conversation history for the project
 
     **Raises:**
     * `HTTPException`:
+      - 400: Invalid offset or limit
       - 404: Project not found or access denied
       - 500: Failed to retrieve generation detail
     """
     logger.info(
-        f"Getting generation detail for project_id={project_id}, user_id={user_id}"
+        "Getting generation detail for project_id=%s, user_id=%s, offset=%d, limit=%d",
+        project_id,
+        user_id,
+        offset,
+        limit,
     )
 
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="Offset must be non-negative")
+    if limit < 1 or limit > 500:
+        raise HTTPException(status_code=400, detail="Limit must be between 1 and 500")
+
+    cache_scope = f"generation:{project_id}"
+    cache_key = f"{user_id}:{offset}:{limit}"
+    cached = await _get_cached_history(
+        cache_scope, cache_key, _generation_detail_cache_ttl, GenerationDetailResponse
+    )
+    if cached is not None:
+        return cached
+
     try:
-        # Get conversation history for the specific project
+        # Count, first/last messages and the requested page are fetched
+        # separately so the full conversation is never loaded at once
         try:
-            conversation_history = await get_conversation_history(
-                project_id=project_id,
-                user_id=user_id,  # Used for additional access validation
+            summary, conversation_history, project_metadata = await asyncio.gather(
+                get_conversation_summary(project_id, user_id),
+                get_conversation_history(
+                    project_id=project_id,
+                    user_id=user_id,  # Used for additional access validation
+                    offset=offset,
+                    limit=limit,
+                ),
+                get_project_metadata(project_id),
             )
         except ValueError as ve:
-            logger.warning(f"Access denied or project not found: {ve}")
+            logger.warning("Access denied or project not found: %s", ve)
             raise HTTPException(status_code=404, detail=str(ve))
 
-        if not conversation_history:
-            logger.warning(f"No conversation history found for project {project_id}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"No conversation history found for project {project_id}",
-            )
-
-        # Get project metadata for additional information
-        project_metadata = await get_project_metadata(project_id)
+        message_count = summary["message_count"]
+        next_offset = offset + len(conversation_history)
+        has_more = next_offset < message_count
 
         logger.info(
-            f"Retrieved conversation with {len(conversation_history)} messages for project {project_id}"
+            "Retrieved %d of %d messages for project %s",
+            len(conversation_history),
+            message_count,
+            project_id,
         )
 
-        return GenerationDetailResponse(
+        response = GenerationDetailResponse(
             project_id=project_id,
-            user_id=project_metadata.get("user_id") if project_metadata else user_id,
-            created_at=datetime.fromtimestamp(
-                project_metadata.get("created_at")
-            ).isoformat()
-            if project_metadata and project_metadata.get("created_at")
-            else None,
-            last_activity=datetime.fromtimestamp(
-                project_metadata.get("last_activity")
-            ).isoformat()
-            if project_metadata and project_metadata.get("last_activity")
+            user_id=project_metadata["user_id"] if project_metadata else user_id,
+            created_at=project_metadata["created_at_iso"] if project_metadata else None,
+            last_activity=project_metadata["last_activity_iso"]
+            if project_metadata
             else None,
-            message_count=len(conversation_history),
-            last_message=conversation_history[-1] if conversation_history else None,
-            first_message=conversation_history[0] if conversation_history else None,
             conversation_history=conversation_history,
+            message_count=message_count,
+            first_message=summary["first_message"],
+            last_message=summary["last_message"],
+            offset=offset,
+            has_more=has_more,
+            next_offset=next_offset if has_more else None,
         )
+        await _set_cached_history(
+            cache_scope, cache_key, _generation_detail_cache_ttl, response
+        )
+        return response
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        logger.error(f"Failed to retrieve generation detail: {str(e)}", exc_info=True)
+        logger.exception("Failed to retrieve generation detail: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -412,3 +850,58 @@ async def get_generation_detail(
                 "msg": f"Failed to retrieve generation detail: {str(e)}",
             },
         )
+
+
+@router.get(
+    "/generations/{project_id}/tags",
+    summary="Get Generated Tags by Project ID",
+    response_model=GenerationTagsResponse,
+)
+async def get_generation_tags(
+    project_id: str, user_id: Optional[str] = None
+) -> GenerationTagsResponse:
+    """Get the generated tags of a project.
+
+    Used to poll for tags when generation was requested with `defer_tags`.
+
+    **Path Parameters:**
+    * `project_id` - Project ID to get tags for
+
+    **Query Parameters:**
+    * `user_id` - Optional user ID for access validation
+
+    **Returns:**
+    * `GenerationTagsResponse` - Tags and whether they are ready
+
+    **Raises:**
+    * `HTTPException`:
+      - 404: Project not found or access denied
+      - 500: Failed to retrieve tags
+    """
+    try:
+        project_metadata = await get_project_metadata(project_id)
+        if not project_metadata or (
+            user_id is not None and project_metadata["user_id"] != user_id
+        ):
+            raise HTTPException(
+                status_code=404, detail=f"Project {project_id} not found"
+            )
+
+        tags = project_metadata["tags"]
+        return GenerationTagsResponse(
+            project_id=project_id,
+            status="pending" if tags is None else "ready",
+            tags=tags or [],
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Failed to retrieve generation tags: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "GenerationTagsRetrievalFailed",
+                "msg": f"Failed to retrieve generation tags: {str(e)}",
+            },
+        )
@@ -4,40 +4,81 @@ AI-powered system for generating IntentKit agent schemas from natural language p
 Each LLM call is individually tracked with request ID and retry count for cost analysis.
 """
 
-from .agent_generator import (
-    generate_agent_schema,
-    generate_validated_agent_schema,
-)
-from .ai_assistant import (
-    enhance_agent,
-    generate_agent_attributes,
-    generate_validated_agent,
-)
-from .conversation_service import (
-    ConversationService,
-    get_conversation_history,
-    get_project_metadata,
-    get_projects_by_user,
-)
-from .llm_logger import (
-    LLMLogger,
-    create_llm_logger,
-)
-from .skill_processor import (
-    filter_skills_for_auto_generation,
-    identify_skills,
-)
-from .utils import (
-    ALLOWED_MODELS,
-    extract_token_usage,
-    generate_agent_summary,
-    generate_request_id,
-)
-from .validation import (
-    ValidationResult,
-    validate_agent_create,
-    validate_schema,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_generator import (
+        generate_agent_schema,
+        generate_validated_agent_schema,
+    )
+    from .ai_assistant import (
+        enhance_agent,
+        generate_agent_attributes,
+        generate_validated_agent,
+    )
+    from .conversation_service import (
+        ConversationService,
+        get_conversation_history,
+        get_project_metadata,
+        get_projects_by_user,
+        update_project_tags,
+    )
+    from .llm_logger import (
+        LLMLogger,
+        create_llm_logger,
+    )
+    from .skill_processor import (
+        filter_skills_for_auto_generation,
+        identify_skills,
+    )
+    from .utils import (
+        ALLOWED_MODELS,
+        close_http_client,
+        close_openai_client,
+        extract_token_usage,
+        generate_agent_summary,
+        generate_request_id,
+        get_http_client,
+        get_openai_client,
+    )
+    from .validation import (
+        ValidationResult,
+        validate_agent_create,
+        validate_schema,
+        warm_up_schema_validator,
+    )
+
+# Submodules are imported on first attribute access, so importing the package
+# (e.g. through app.admin) doesn't load the generator and its dependencies
+_LAZY_IMPORTS = {
+    "generate_agent_schema": ".agent_generator",
+    "generate_validated_agent_schema": ".agent_generator",
+    "enhance_agent": ".ai_assistant",
+    "generate_agent_attributes": ".ai_assistant",
+    "generate_validated_agent": ".ai_assistant",
+    "ConversationService": ".conversation_service",
+    "get_conversation_history": ".conversation_service",
+    "get_project_metadata": ".conversation_service",
+    "get_projects_by_user": ".conversation_service",
+    "update_project_tags": ".conversation_service",
+    "LLMLogger": ".llm_logger",
+    "create_llm_logger": ".llm_logger",
+    "filter_skills_for_auto_generation": ".skill_processor",
+    "identify_skills": ".skill_processor",
+    "ALLOWED_MODELS": ".utils",
+    "close_http_client": ".utils",
+    "close_openai_client": ".utils",
+    "extract_token_usage": ".utils",
+    "generate_agent_summary": ".utils",
+    "generate_request_id": ".utils",
+    "get_http_client": ".utils",
+    "get_openai_client": ".utils",
+    "ValidationResult": ".validation",
+    "validate_agent_create": ".validation",
+    "validate_schema": ".validation",
+    "warm_up_schema_validator": ".validation",
+}
 
 __all__ = [
     # Main generation functions
@@ -53,6 +94,7 @@ __all__ = [
     "get_conversation_history",
     "get_project_metadata",
     "get_projects_by_user",
+    "update_project_tags",
     # LLM logging
     "create_llm_logger",
     "generate_request_id",
@@ -63,8 +105,22 @@ __all__ = [
     # Utilities
     "extract_token_usage",
     "ALLOWED_MODELS",
+    "get_openai_client",
+    "close_openai_client",
+    "get_http_client",
+    "close_http_client",
     # Validation
     "validate_schema",
     "validate_agent_create",
     "ValidationResult",
+    "warm_up_schema_validator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,11 +5,10 @@ This module coordinates the skill processing, validation, and AI assistance modu
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from intentkit.config.config import config
 from intentkit.models.agent import AgentUpdate
 
 from .ai_assistant import (
@@ -23,6 +22,7 @@ from .skill_processor import (
     identify_skills,
     merge_autonomous_skills,
 )
+from .utils import get_openai_client
 
 if TYPE_CHECKING:
     from .llm_logger import LLMLogger
@@ -51,16 +51,13 @@ async def generate_agent_schema(
      A tuple of (agent_schema, identified_skills, token_usage)
     """
     logger.info(
-        f"Generating agent schema from prompt: '{prompt[:50]}{'...' if len(prompt) > 50 else ''}'"
+        "Generating agent schema from prompt: '%.50s%s'",
+        prompt,
+        "..." if len(prompt) > 50 else "",
     )
 
-    # Get OpenAI API key from config
-    api_key = config.openai_api_key
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY is not set in configuration")
-
-    # Create OpenAI client
-    client = OpenAI(api_key=api_key)
+    # Get the shared OpenAI client
+    client = get_openai_client()
 
     if existing_agent:
         # Update existing agent - preserves configuration, makes minimal changes
@@ -82,13 +79,13 @@ async def generate_agent_schema(
             llm_logger=llm_logger,
         )
 
-    logger.info(f"Generated agent schema with {len(skills)} skills: {list(skills)}")
+    logger.info("Generated agent schema with %d skills: %s", len(skills), skills)
     return schema, skills, token_usage
 
 
 async def _generate_new_agent_schema(
     prompt: str,
-    client: OpenAI,
+    client: AsyncOpenAI,
     user_id: Optional[str] = None,
     llm_logger: Optional["LLMLogger"] = None,
 ) -> Tuple[Dict[str, Any], Set[str], Dict[str, Any]]:
@@ -113,8 +110,8 @@ async def _generate_new_agent_schema(
     autonomous_skills = []
     if autonomous_result:
         autonomous_configs, autonomous_skills = autonomous_result
-        logger.info(f"Generated {len(autonomous_configs)} autonomous tasks")
-        logger.info(f"Autonomous tasks require skills: {autonomous_skills}")
+        logger.info("Generated %d autonomous tasks", len(autonomous_configs))
+        logger.info("Autonomous tasks require skills: %s", autonomous_skills)
     else:
         logger.info(
             " No autonomous patterns detected, proceeding with standard agent generation"
@@ -127,14 +124,16 @@ async def _generate_new_agent_schema(
     # Merge autonomous skills with identified skills
     if autonomous_skills:
         logger.info(
-            f"Merging {len(autonomous_skills)} autonomous skills with identified skills"
+            "Merging %d autonomous skills with identified skills",
+            len(autonomous_skills),
         )
         skills_config = merge_autonomous_skills(skills_config, autonomous_skills)
 
     # Filter out skills that require agent owner API keys
     skills_config = await filter_skills_for_auto_generation(skills_config)
 
-    logger.info(f"Final identified skills: {list(skills_config.keys())}")
+    identified_skills = set(skills_config)
+    logger.info("Final identified skills: %s", identified_skills)
 
     # Step 3: Generate agent attributes (name, purpose, personality, etc.)
     logger.info(" Step 3: Generating agent attributes")
@@ -156,25 +155,27 @@ async def _generate_new_agent_schema(
     if autonomous_configs:
         schema["autonomous"] = [config.model_dump() for config in autonomous_configs]
         logger.info(
-            f"Added {len(autonomous_configs)} autonomous configurations to schema"
+            "Added %d autonomous configurations to schema", len(autonomous_configs)
         )
 
         # Log details of each autonomous task
-        for config in autonomous_configs:
-            schedule_info = (
-                f"{config.minutes} minutes" if config.minutes else config.cron
-            )
-            logger.info(f"Task: '{config.name}' - {schedule_info}")
+        if logger.isEnabledFor(logging.INFO):
+            for config in autonomous_configs:
+                schedule_info = (
+                    f"{config.minutes} minutes" if config.minutes else config.cron
+                )
+                logger.info("Task: '%s' - %s", config.name, schedule_info)
 
     # Set user ID if provided
     if user_id:
         schema["owner"] = user_id
-        logger.debug(f"Set agent owner: {user_id}")
+        logger.debug("Set agent owner: %s", user_id)
 
-    identified_skills = set(skills_config.keys())
     autonomous_count = len(autonomous_configs)
     logger.info(
-        f"New agent schema generated with {len(identified_skills)} skills and {autonomous_count} autonomous tasks"
+        "New agent schema generated with %d skills and %d autonomous tasks",
+        len(identified_skills),
+        autonomous_count,
     )
 
     return schema, identified_skills, token_usage
@@ -186,21 +187,24 @@ async def generate_validated_agent_schema(
     user_id: Optional[str] = None,
     existing_agent: Optional[AgentUpdate] = None,
     llm_logger: Optional["LLMLogger"] = None,
-) -> Tuple[Dict[str, Any], Set[str], str]:
-    """Generate and validate agent schema with summary.
+    generate_tags: bool = True,
+) -> Tuple[Dict[str, Any], Set[str], str, List[Dict[str, int]]]:
+    """Generate and validate agent schema with summary and tags.
 
     Args:
      prompt: Natural language description of the desired agent
      user_id: Optional user ID for ownership and validation
      existing_agent: Optional existing agent to update
      llm_logger: Optional LLM logger for tracking individual API calls
+     generate_tags: Whether to generate tags, if False an empty list is returned
 
     Returns:
-     A tuple of (agent_schema, identified_skills, summary_message)
+     A tuple of (agent_schema, identified_skills, summary_message, tags)
     """
     return await generate_validated_agent(
         prompt=prompt,
         user_id=user_id,
         existing_agent=existing_agent,
         llm_logger=llm_logger,
+        generate_tags=generate_tags,
     )
@@ -6,12 +6,14 @@ This module handles core AI operations for agent generation including:
 - AI-powered error correction and schema fixing
 """
 
+import asyncio
 import json
 import logging
+import re
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from intentkit.config.config import config
 from intentkit.models.agent import AgentUpdate
@@ -28,7 +30,12 @@ from .skill_processor import (
     identify_skills,
     merge_autonomous_skills,
 )
-from .utils import extract_token_usage, generate_agent_summary
+from .utils import (
+    extract_token_usage,
+    generate_agent_summary,
+    generate_tags_from_nation_api,
+    get_openai_client,
+)
 from .validation import (
     validate_agent_create,
     validate_schema,
@@ -39,11 +46,83 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Prompt words that ask for changes to the agent's text attributes, phrases like
+# "change name" or "rename" are already covered by their attribute word
+_ATTRIBUTE_KEYWORDS_RE = re.compile(
+    r"name|purpose|personality|principle|description", re.IGNORECASE
+)
+
+# Attributes used when the LLM reply for a new agent can't be parsed
+FALLBACK_AGENT_ATTRIBUTES = {
+    "name": "AI Assistant",
+    "purpose": "A helpful AI agent designed to assist users with various tasks.",
+    "personality": "Friendly, professional, and helpful. Always strives to provide accurate and useful information.",
+    "principles": "• Be helpful and accurate\n• Respect user privacy\n• Provide clear explanations",
+}
+
+# System prompts are static so OpenAI can reuse the cached prompt prefix across
+# requests, anything request specific belongs in the user message
+ATTRIBUTE_UPDATE_SYSTEM_PROMPT = """You are updating an existing agent's text attributes only.
+
+CRITICAL INSTRUCTIONS:
+1. Only update name, purpose, personality, and principles based on the prompt
+2. Keep all existing skills exactly as they are - DO NOT modify skills
+3. Keep the existing model and temperature settings
+4. Only make changes if the prompt specifically requests them
+5. Return the complete agent schema as valid JSON
+
+The user message contains the update request and the agent's current attributes and schema.
+
+Make minimal changes based on the prompt. If this is part of an ongoing conversation, consider the previous context."""
+
+ATTRIBUTE_GENERATION_SYSTEM_PROMPT = """You are generating agent attributes for an IntentKit AI agent.
+
+Based on the user's description, create appropriate attributes for an agent that will use the skills listed in the request.
+
+Generate a JSON object with these exact fields:
+- "name": A clear, descriptive name for the agent (2-4 words)
+- "purpose": A concise description of what the agent does (1-2 sentences)
+- "personality": The agent's communication style and personality traits (1-2 sentences)
+- "principles": Core rules and guidelines the agent follows (1-3 bullet points)
+
+Make the attributes coherent and well-suited for the identified skills.
+Return only valid JSON, no additional text.
+
+If this is part of an ongoing conversation, consider the previous context while creating the agent."""
+
+SCHEMA_CORRECTION_SYSTEM_PROMPT = """You are an expert at fixing IntentKit agent schema validation errors.
+
+The user created an agent but the schema has validation errors. Your job is to fix these errors while preserving the user's intent.
+
+CRITICAL RULES:
+1. Only use real IntentKit skills that actually exist
+2. Skills must have real states (not made-up ones)
+3. Fix validation errors while maintaining user intent
+4. Return only valid JSON for the complete agent schema
+5. Do not add fake skills or fake states
+6. ALWAYS preserve the owner field if it exists in the original schema
+
+AUTONOMOUS CONFIGURATION RULES:
+- For autonomous tasks, use EITHER "minutes" OR "cron", NEVER both
+- If both are present, keep only "minutes" and remove "cron" entirely
+- If "cron" is null/None, remove it entirely from the configuration
+- Minimum interval is 5 minutes for "minutes" field
+- Example: {"minutes": 60} OR {"cron": "0 * * * *"} but NOT both
+
+Common validation errors and fixes:
+- Missing required fields: Add them with appropriate values
+- Invalid skill names: Remove or replace with real skills
+- Invalid skill states: Replace with real states for that skill
+- Invalid model names: Use gpt-4.1-nano as default
+- Missing skill configurations: Add proper enabled/states/api_key_provider structure
+- Missing owner field: Will be automatically added after your response
+- "only one of minutes or cron can be set": Remove the cron field if minutes is present"""
+
 
 async def enhance_agent(
     prompt: str,
     existing_agent: "AgentUpdate",
-    client: OpenAI,
+    client: AsyncOpenAI,
     user_id: Optional[str] = None,
     llm_logger: Optional["LLMLogger"] = None,
 ) -> Tuple[Dict[str, Any], Set[str], Dict[str, Any]]:
@@ -85,23 +164,33 @@ async def enhance_agent(
     # Convert existing agent to dictionary format
     existing_schema = existing_agent.model_dump(exclude_unset=True)
 
-    # Check for autonomous patterns first
+    # Only update agent attributes if the prompt specifically asks for them
+    should_update_attributes = _ATTRIBUTE_KEYWORDS_RE.search(prompt) is not None
+
+    # Autonomous patterns, skills and text attributes are independent LLM calls,
+    # so run them together instead of one after another
     logger.info("Checking for autonomous patterns in update prompt")
-    autonomous_result = await generate_autonomous_configuration(
-        prompt, client, llm_logger=llm_logger
-    )
+    llm_calls = [
+        generate_autonomous_configuration(prompt, client, llm_logger=llm_logger),
+        identify_skills(prompt, client, llm_logger=llm_logger),
+    ]
+    if should_update_attributes:
+        logger.info("Prompt requests attribute updates - using AI for text fields only")
+        llm_calls.append(
+            _generate_attribute_updates(
+                prompt, existing_schema, existing_agent, client, llm_logger
+            )
+        )
+    results = await asyncio.gather(*llm_calls)
+    autonomous_result, identified_skills_config, *attribute_result = results
 
     autonomous_configs = []
     autonomous_skills = []
     if autonomous_result:
         autonomous_configs, autonomous_skills = autonomous_result
-        logger.info(f"Generated {len(autonomous_configs)} autonomous tasks for update")
-        logger.info(f"Autonomous tasks require skills: {autonomous_skills}")
+        logger.info("Generated %d autonomous tasks for update", len(autonomous_configs))
+        logger.info("Autonomous tasks require skills: %s", autonomous_skills)
 
-    # Use the real skill processor to identify skills from prompt
-    identified_skills_config = await identify_skills(
-        prompt, client, llm_logger=llm_logger
-    )
     identified_skill_names = set(identified_skills_config.keys())
 
     # Merge autonomous skills with identified skills
@@ -110,37 +199,36 @@ async def enhance_agent(
     )
     identified_skill_names.update(autonomous_skills)
 
-    logger.info(f"Real skills identified from prompt: {identified_skill_names}")
+    logger.info("Real skills identified from prompt: %s", identified_skill_names)
 
-    # Start with existing configuration
-    updated_schema = existing_schema.copy()
+    # Start with existing configuration, the dump is a fresh dict owned by this
+    # call so it is updated in place instead of copied
+    updated_schema = existing_schema
 
     # Ensure model field is present (required field)
     if "model" not in updated_schema or not updated_schema["model"]:
         updated_schema["model"] = "gpt-4.1-nano"  # Default model
 
     # Merge skills carefully - preserve existing, add new real skills
-    existing_skills = updated_schema.get("skills", {})
-    merged_skills = existing_skills.copy()
+    merged_skills = updated_schema.get("skills", {})
 
     # Add newly identified real skills
     for skill_name, skill_config in identified_skills_config.items():
         if skill_name not in merged_skills:
             merged_skills[skill_name] = skill_config
-            logger.info(f"Added new skill: {skill_name}")
+            logger.info("Added new skill: %s", skill_name)
         else:
             # Enable existing skill if it was disabled, and merge states
             existing_skill = merged_skills[skill_name]
             if not existing_skill.get("enabled", False):
                 merged_skills[skill_name] = skill_config
-                logger.info(f"Enabled existing skill: {skill_name}")
+                logger.info("Enabled existing skill: %s", skill_name)
             else:
-                # Merge states from both existing and new
-                existing_states = existing_skill.get("states", {})
-                new_states = skill_config.get("states", {})
-                merged_states = {**existing_states, **new_states}
-                merged_skills[skill_name]["states"] = merged_states
-                logger.info(f"Merged states for skill: {skill_name}")
+                # Merge new states into the existing ones in place
+                existing_skill.setdefault("states", {}).update(
+                    skill_config.get("states", {})
+                )
+                logger.info("Merged states for skill: %s", skill_name)
 
     updated_schema["skills"] = merged_skills
 
@@ -149,16 +237,15 @@ async def enhance_agent(
         existing_autonomous = updated_schema.get("autonomous", [])
         # Convert existing autonomous configs to list of dicts if they aren't already
         if existing_autonomous and not isinstance(existing_autonomous[0], dict):
-            existing_autonomous = [
-                config.model_dump() for config in existing_autonomous
-            ]
+            existing_autonomous = [task.model_dump() for task in existing_autonomous]
 
         # Add new autonomous configs
-        new_autonomous_dicts = [config.model_dump() for config in autonomous_configs]
+        new_autonomous_dicts = [task.model_dump() for task in autonomous_configs]
         updated_autonomous = existing_autonomous + new_autonomous_dicts
         updated_schema["autonomous"] = updated_autonomous
         logger.info(
-            f"Added {len(autonomous_configs)} autonomous configurations to existing agent"
+            "Added %d autonomous configurations to existing agent",
+            len(autonomous_configs),
         )
 
     # Filter skills for auto-generation (remove agent-owner API key skills)
@@ -170,181 +257,181 @@ async def enhance_agent(
     if user_id:
         updated_schema["owner"] = user_id
 
-    # Only update agent attributes if the prompt specifically asks for them
-    should_update_attributes = any(
-        keyword in prompt.lower()
-        for keyword in [
-            "name",
-            "purpose",
-            "personality",
-            "principle",
-            "description",
-            "rename",
-            "change name",
-            "update name",
-            "modify purpose",
-            "change purpose",
-            "update personality",
-            "change personality",
-        ]
-    )
+    # Apply the text attribute updates, skills and other configs stay untouched
+    if attribute_result:
+        attribute_updates, total_token_usage = attribute_result[0]
+        updated_schema.update(attribute_updates)
 
-    if should_update_attributes:
-        logger.info("Prompt requests attribute updates - using AI for text fields only")
+    # Store assistant response in conversation for updates
+    if conversation_service:
+        if should_update_attributes and len(identified_skill_names) > 0:
+            response_content = f"I've updated your agent with the requested changes and added {len(identified_skill_names)} skills: {', '.join(identified_skill_names)}."
+        elif should_update_attributes:
+            response_content = "I've updated your agent's attributes as requested."
+        else:
+            response_content = f"I've updated your agent with {len(identified_skill_names)} new skills: {', '.join(identified_skill_names) if identified_skill_names else 'none'}."
 
-        # Get conversation history if logger has a project_id
-        history_messages = []
-        if llm_logger:
-            try:
-                history_messages = await get_conversation_history(
-                    project_id=llm_logger.request_id,
-                    user_id=llm_logger.user_id,
-                )
-            except Exception as e:
-                logger.warning(f"Failed to get conversation history: {e}")
-                history_messages = []
+        await conversation_service.add_assistant_message(
+            content=response_content,
+            message_metadata={
+                "call_type": "agent_enhancement",
+                "identified_skills": list(identified_skill_names),
+                "attribute_updates": should_update_attributes,
+            },
+        )
 
-        # Prepare system message for agent attribute updates
-        system_message = {
-            "role": "system",
-            "content": f"""You are updating an existing agent's text attributes only. 
-            
-CRITICAL INSTRUCTIONS:
-1. Only update name, purpose, personality, and principles based on the prompt
-2. Keep all existing skills exactly as they are - DO NOT modify skills
-3. Keep the existing model and temperature settings
-4. Only make changes if the prompt specifically requests them
-5. Return the complete agent schema as valid JSON
+    logger.info("Agent enhancement completed with minimal changes")
+    return updated_schema, identified_skill_names, total_token_usage
 
-The agent currently has these attributes:
-- Name: {updated_schema.get("name", "Unnamed Agent")}
-- Purpose: {updated_schema.get("purpose", "No purpose defined")}
-- Personality: {updated_schema.get("personality", "No personality defined")} 
-- Principles: {updated_schema.get("principles", "No principles defined")}
 
-Make minimal changes based on the prompt. If this is part of an ongoing conversation, consider the previous context.""",
-        }
+async def _generate_attribute_updates(
+    prompt: str,
+    existing_schema: Dict[str, Any],
+    existing_agent: "AgentUpdate",
+    client: AsyncOpenAI,
+    llm_logger: Optional["LLMLogger"] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Ask the LLM for updated text attributes of an existing agent.
 
-        # Build messages with conversation history
-        messages = [system_message]
+    Args:
+        prompt: The natural language prompt describing desired changes
+        existing_schema: The current agent configuration as a dictionary
+        existing_agent: The current agent configuration
+        client: OpenAI client for API calls
+        llm_logger: Optional LLM logger for tracking API calls
 
-        # Add conversation history if available
-        if history_messages:
-            logger.info(
-                f"Using {len(history_messages)} messages from conversation history for update"
+    Returns:
+        A tuple of (attribute_updates, token_usage)
+    """
+    # Get conversation history if logger has a project_id
+    history_messages = []
+    if llm_logger:
+        try:
+            history_messages = await get_conversation_history(
+                project_id=llm_logger.request_id,
+                user_id=llm_logger.user_id,
             )
-            messages.extend(history_messages)
+        except Exception as e:
+            logger.warning("Failed to get conversation history: %s", e)
+            history_messages = []
 
-        # Add current request
-        messages.append(
-            {
-                "role": "user",
-                "content": f"Update request: {prompt}\n\nCurrent agent schema:\n{json.dumps(updated_schema, indent=2)}",
-            }
+    # Prepare system message for agent attribute updates
+    system_message = {
+        "role": "system",
+        "content": ATTRIBUTE_UPDATE_SYSTEM_PROMPT,
+    }
+
+    # Build messages with conversation history
+    messages = [system_message]
+
+    # Add conversation history if available
+    if history_messages:
+        logger.info(
+            "Using %d messages from conversation history for update",
+            len(history_messages),
         )
+        messages.extend(history_messages)
 
-        # Log the LLM call if logger is provided
-        if llm_logger:
-            async with llm_logger.log_call(
-                call_type="agent_attribute_update",
-                prompt=prompt,
-                retry_count=0,
-                is_update=True,
-                existing_agent_id=getattr(existing_agent, "id", None),
-                llm_model="gpt-4.1-nano",
-                openai_messages=messages,
-            ) as call_log:
-                call_start_time = time.time()
-
-                # Make OpenAI API call
-                response = client.chat.completions.create(
-                    model="gpt-4.1-nano",
-                    messages=messages,
-                    temperature=0.3,
-                    max_tokens=2000,
-                )
+    # Add current request
+    messages.append(
+        {
+            "role": "user",
+            "content": f"""Update request: {prompt}
 
-                # Extract generated content
-                ai_response_content = response.choices[0].message.content.strip()
-
-                try:
-                    # Parse AI response
-                    ai_updated_schema = json.loads(ai_response_content)
-
-                    # Safely merge only text attributes, preserving skills and other configs
-                    for attr in ["name", "purpose", "personality", "principles"]:
-                        if attr in ai_updated_schema:
-                            updated_schema[attr] = ai_updated_schema[attr]
-
-                    generated_content = {
-                        "updated_attributes": {
-                            attr: ai_updated_schema.get(attr)
-                            for attr in ["name", "purpose", "personality", "principles"]
-                            if attr in ai_updated_schema
-                        }
-                    }
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse AI response as JSON: {e}")
-                    generated_content = {"error": "Failed to parse AI response"}
-
-                # Log successful call
-                await llm_logger.log_successful_call(
-                    call_log=call_log,
-                    response=response,
-                    generated_content=generated_content,
-                    openai_messages=messages,
-                    call_start_time=call_start_time,
-                )
+The agent currently has these attributes:
+- Name: {existing_schema.get("name", "Unnamed Agent")}
+- Purpose: {existing_schema.get("purpose", "No purpose defined")}
+- Personality: {existing_schema.get("personality", "No personality defined")}
+- Principles: {existing_schema.get("principles", "No principles defined")}
 
-                # Extract token usage for return
-                total_token_usage = extract_token_usage(response)
-        else:
-            # Make call without logging (fallback)
-            response = client.chat.completions.create(
+Current agent schema:
+{json.dumps(existing_schema, indent=2)}""",
+        }
+    )
+
+    attribute_updates = {}
+
+    # Log the LLM call if logger is provided
+    if llm_logger:
+        async with llm_logger.log_call(
+            call_type="agent_attribute_update",
+            prompt=prompt,
+            retry_count=0,
+            is_update=True,
+            existing_agent_id=getattr(existing_agent, "id", None),
+            llm_model="gpt-4.1-nano",
+            openai_messages=messages,
+        ) as call_log:
+            call_start_time = time.time()
+
+            # Make OpenAI API call
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.3,
                 max_tokens=2000,
             )
 
+            # Extract generated content
             ai_response_content = response.choices[0].message.content.strip()
 
             try:
+                # Parse AI response
                 ai_updated_schema = json.loads(ai_response_content)
-                for attr in ["name", "purpose", "personality", "principles"]:
-                    if attr in ai_updated_schema:
-                        updated_schema[attr] = ai_updated_schema[attr]
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse AI response as JSON: {e}")
 
-            total_token_usage = extract_token_usage(response)
+                # Keep only text attributes, skills and other configs are preserved
+                attribute_updates = {
+                    attr: ai_updated_schema[attr]
+                    for attr in ["name", "purpose", "personality", "principles"]
+                    if attr in ai_updated_schema
+                }
 
-    # Store assistant response in conversation for updates
-    if conversation_service:
-        if should_update_attributes and len(identified_skill_names) > 0:
-            response_content = f"I've updated your agent with the requested changes and added {len(identified_skill_names)} skills: {', '.join(identified_skill_names)}."
-        elif should_update_attributes:
-            response_content = "I've updated your agent's attributes as requested."
-        else:
-            response_content = f"I've updated your agent with {len(identified_skill_names)} new skills: {', '.join(identified_skill_names) if identified_skill_names else 'none'}."
+                generated_content = {"updated_attributes": attribute_updates}
+            except json.JSONDecodeError as e:
+                logger.warning("Failed to parse AI response as JSON: %s", e)
+                generated_content = {"error": "Failed to parse AI response"}
 
-        await conversation_service.add_assistant_message(
-            content=response_content,
-            message_metadata={
-                "call_type": "agent_enhancement",
-                "identified_skills": list(identified_skill_names),
-                "attribute_updates": should_update_attributes,
-            },
+            # Log successful call
+            await llm_logger.log_successful_call(
+                call_log=call_log,
+                response=response,
+                generated_content=generated_content,
+                openai_messages=messages,
+                call_start_time=call_start_time,
+            )
+
+            # Extract token usage for return
+            token_usage = extract_token_usage(response)
+    else:
+        # Make call without logging (fallback)
+        response = await client.chat.completions.create(
+            model="gpt-4.1-nano",
+            messages=messages,
+            temperature=0.3,
+            max_tokens=2000,
         )
 
-    logger.info("Agent enhancement completed with minimal changes")
-    return updated_schema, identified_skill_names, total_token_usage
+        ai_response_content = response.choices[0].message.content.strip()
+
+        try:
+            ai_updated_schema = json.loads(ai_response_content)
+            attribute_updates = {
+                attr: ai_updated_schema[attr]
+                for attr in ["name", "purpose", "personality", "principles"]
+                if attr in ai_updated_schema
+            }
+        except json.JSONDecodeError as e:
+            logger.warning("Failed to parse AI response as JSON: %s", e)
+
+        token_usage = extract_token_usage(response)
+
+    return attribute_updates, token_usage
 
 
 async def generate_agent_attributes(
     prompt: str,
     skills_config: Dict[str, Any],
-    client: OpenAI,
+    client: AsyncOpenAI,
     llm_logger: Optional["LLMLogger"] = None,
     user_id: Optional[str] = None,
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
@@ -374,26 +461,13 @@ async def generate_agent_attributes(
                 user_id=llm_logger.user_id,
             )
         except Exception as e:
-            logger.warning(f"Failed to get conversation history: {e}")
+            logger.warning("Failed to get conversation history: %s", e)
             history_messages = []
 
     # Prepare messages for agent generation
     system_message = {
         "role": "system",
-        "content": f"""You are generating agent attributes for an IntentKit AI agent.
-
-Based on the user's description, create appropriate attributes for an agent that will use these skills: {skill_summary}
-
-Generate a JSON object with these exact fields:
-- "name": A clear, descriptive name for the agent (2-4 words)
-- "purpose": A concise description of what the agent does (1-2 sentences)
-- "personality": The agent's communication style and personality traits (1-2 sentences)
-- "principles": Core rules and guidelines the agent follows (1-3 bullet points)
-
-Make the attributes coherent and well-suited for the identified skills.
-Return only valid JSON, no additional text.
-
-If this is part of an ongoing conversation, consider the previous context while creating the agent.""",
+        "content": ATTRIBUTE_GENERATION_SYSTEM_PROMPT,
     }
 
     # Build messages with conversation history
@@ -401,14 +475,16 @@ If this is part of an ongoing conversation, consider the previous context while
 
     # Add conversation history if available
     if history_messages:
-        logger.info(f"Using {len(history_messages)} messages from conversation history")
+        logger.info(
+            "Using %d messages from conversation history", len(history_messages)
+        )
         messages.extend(history_messages)
 
     # Add current user message
     messages.append(
         {
             "role": "user",
-            "content": f"Create an agent for: {prompt}",
+            "content": f"Create an agent for: {prompt}\n\nThe agent will use these skills: {skill_summary}",
         }
     )
 
@@ -425,11 +501,11 @@ If this is part of an ongoing conversation, consider the previous context while
             call_start_time = time.time()
 
             # Make OpenAI API call
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.7,
-                max_tokens=1500,
+                max_tokens=768,
             )
 
             # Extract and parse generated content
@@ -439,14 +515,9 @@ If this is part of an ongoing conversation, consider the previous context while
                 attributes = json.loads(ai_response_content)
                 generated_content = {"attributes": attributes}
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse agent attributes JSON: {e}")
+                logger.error("Failed to parse agent attributes JSON: %s", e)
                 # Provide fallback attributes
-                attributes = {
-                    "name": "AI Assistant",
-                    "purpose": "A helpful AI agent designed to assist users with various tasks.",
-                    "personality": "Friendly, professional, and helpful. Always strives to provide accurate and useful information.",
-                    "principles": "• Be helpful and accurate\n• Respect user privacy\n• Provide clear explanations",
-                }
+                attributes = dict(FALLBACK_AGENT_ATTRIBUTES)
                 generated_content = {
                     "error": "Failed to parse AI response",
                     "fallback_used": True,
@@ -466,11 +537,11 @@ If this is part of an ongoing conversation, consider the previous context while
             token_usage = extract_token_usage(response)
     else:
         # Make call without logging (fallback)
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=messages,
             temperature=0.7,
-            max_tokens=1500,
+            max_tokens=768,
         )
 
         ai_response_content = response.choices[0].message.content.strip()
@@ -478,17 +549,12 @@ If this is part of an ongoing conversation, consider the previous context while
         try:
             attributes = json.loads(ai_response_content)
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse agent attributes JSON: {e}")
-            attributes = {
-                "name": "AI Assistant",
-                "purpose": "A helpful AI agent designed to assist users with various tasks.",
-                "personality": "Friendly, professional, and helpful. Always strives to provide accurate and useful information.",
-                "principles": "• Be helpful and accurate\n• Respect user privacy\n• Provide clear explanations",
-            }
+            logger.error("Failed to parse agent attributes JSON: %s", e)
+            attributes = dict(FALLBACK_AGENT_ATTRIBUTES)
 
         token_usage = extract_token_usage(response)
 
-    logger.info(f"Generated agent attributes: {attributes.get('name', 'Unknown')}")
+    logger.info("Generated agent attributes: %s", attributes.get("name", "Unknown"))
     return attributes, token_usage
 
 
@@ -498,7 +564,8 @@ async def generate_validated_agent(
     existing_agent: Optional["AgentUpdate"] = None,
     llm_logger: Optional["LLMLogger"] = None,
     max_attempts: int = 3,
-) -> Tuple[Dict[str, Any], Set[str], str]:
+    generate_tags: bool = True,
+) -> Tuple[Dict[str, Any], Set[str], str, List[Dict[str, int]]]:
     """Generate agent schema with automatic validation retry and AI self-correction.
 
     This function uses an iterative approach:
@@ -506,6 +573,7 @@ async def generate_validated_agent(
     2. Validate it
     3. If validation fails, feed raw errors back to AI for self-correction
     4. Repeat until validation passes or max attempts reached
+    5. Generate the summary and tags for the validated schema concurrently
 
     Args:
         prompt: The natural language prompt describing the agent
@@ -513,9 +581,10 @@ async def generate_validated_agent(
         existing_agent: Optional existing agent to update
         llm_logger: Optional LLM logger for tracking API calls
         max_attempts: Maximum number of generation attempts
+        generate_tags: Whether to generate tags, if False an empty list is returned
 
     Returns:
-        A tuple of (validated_schema, identified_skills, summary_message)
+        A tuple of (validated_schema, identified_skills, summary_message, tags)
     """
     start_time = time.time()
 
@@ -558,8 +627,8 @@ async def generate_validated_agent(
             )
         raise ValueError(error_msg)
 
-    # Create OpenAI client
-    client = OpenAI(api_key=api_key)
+    # Get the shared OpenAI client
+    client = get_openai_client()
 
     last_schema = None
     last_errors = []
@@ -568,7 +637,9 @@ async def generate_validated_agent(
     try:
         for attempt in range(max_attempts):
             try:
-                logger.info(f"Schema generation attempt {attempt + 1}/{max_attempts}")
+                logger.info(
+                    "Schema generation attempt %d/%d", attempt + 1, max_attempts
+                )
 
                 if attempt == 0:
                     # First attempt: Generate from scratch
@@ -613,20 +684,29 @@ async def generate_validated_agent(
                         all_token_details.append(token_usage)
 
                 # Validate the schema
-                schema_validation = await validate_schema(schema)
-                agent_validation = await validate_agent_create(schema, user_id)
+                schema_validation, agent_validation = await asyncio.gather(
+                    validate_schema(schema),
+                    validate_agent_create(schema, user_id),
+                )
 
                 # Check if validation passed
                 if schema_validation.valid and agent_validation.valid:
-                    logger.info(f"Validation passed on attempt {attempt + 1}")
+                    logger.info("Validation passed on attempt %d", attempt + 1)
 
-                    # Generate summary message
-                    summary = await generate_agent_summary(
+                    # Generate summary message and tags, both only need the schema
+                    summary_task = generate_agent_summary(
                         schema=schema,
                         identified_skills=identified_skills,
                         client=client,
                         llm_logger=llm_logger,
                     )
+                    if generate_tags:
+                        summary, tags = await asyncio.gather(
+                            summary_task,
+                            generate_tags_from_nation_api(schema, prompt),
+                        )
+                    else:
+                        summary, tags = await summary_task, []
 
                     # Store assistant response in conversation
                     if conversation_service:
@@ -659,7 +739,7 @@ async def generate_validated_agent(
                             success=True,
                         )
 
-                    return schema, identified_skills, summary
+                    return schema, identified_skills, summary, tags
 
                 # Collect raw validation errors for AI feedback
                 last_errors = []
@@ -676,11 +756,13 @@ async def generate_validated_agent(
                     )
 
                 logger.warning(
-                    f"Attempt {attempt + 1} validation failed with {len(last_errors)} errors"
+                    "Attempt %d validation failed with %d errors",
+                    attempt + 1,
+                    len(last_errors),
                 )
 
             except Exception as e:
-                logger.error(f"Attempt {attempt + 1} failed with exception: {str(e)}")
+                logger.error("Attempt %d failed with exception: %s", attempt + 1, e)
                 last_errors = [f"Generation exception: {str(e)}"]
 
         # All attempts failed
@@ -736,7 +818,7 @@ async def fix_agent_schema_with_ai_logged(
     original_prompt: str,
     failed_schema: Dict[str, Any],
     validation_errors: List[str],
-    client: OpenAI,
+    client: AsyncOpenAI,
     user_id: Optional[str] = None,
     existing_agent: Optional["AgentUpdate"] = None,
     llm_logger: Optional["LLMLogger"] = None,
@@ -757,7 +839,7 @@ async def fix_agent_schema_with_ai_logged(
     Returns:
         A tuple of (fixed_schema, identified_skills, token_usage)
     """
-    logger.info(f"Attempting to fix schema using AI (retry {retry_count})")
+    logger.info("Attempting to fix schema using AI (retry %d)", retry_count)
 
     # Prepare detailed error context for AI
     error_details = "\n".join([f"- {error}" for error in validation_errors])
@@ -766,33 +848,7 @@ async def fix_agent_schema_with_ai_logged(
     messages = [
         {
             "role": "system",
-            "content": """You are an expert at fixing IntentKit agent schema validation errors.
-
-The user created an agent but the schema has validation errors. Your job is to fix these errors while preserving the user's intent.
-
-CRITICAL RULES:
-1. Only use real IntentKit skills that actually exist
-2. Skills must have real states (not made-up ones)
-3. Fix validation errors while maintaining user intent
-4. Return only valid JSON for the complete agent schema
-5. Do not add fake skills or fake states
-6. ALWAYS preserve the owner field if it exists in the original schema
-
-AUTONOMOUS CONFIGURATION RULES:
-- For autonomous tasks, use EITHER "minutes" OR "cron", NEVER both
-- If both are present, keep only "minutes" and remove "cron" entirely
-- If "cron" is null/None, remove it entirely from the configuration
-- Minimum interval is 5 minutes for "minutes" field
-- Example: {"minutes": 60} OR {"cron": "0 * * * *"} but NOT both
-
-Common validation errors and fixes:
-- Missing required fields: Add them with appropriate values
-- Invalid skill names: Remove or replace with real skills
-- Invalid skill states: Replace with real states for that skill
-- Invalid model names: Use gpt-4.1-nano as default
-- Missing skill configurations: Add proper enabled/states/api_key_provider structure
-- Missing owner field: Will be automatically added after your response
-- "only one of minutes or cron can be set": Remove the cron field if minutes is present""",
+            "content": SCHEMA_CORRECTION_SYSTEM_PROMPT,
         },
         {
             "role": "user",
@@ -822,7 +878,7 @@ Please fix these errors and return the corrected agent schema as valid JSON.""",
             call_start_time = time.time()
 
             # Make OpenAI API call
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.3,
@@ -849,7 +905,7 @@ Please fix these errors and return the corrected agent schema as valid JSON.""",
                     "identified_skills": list(identified_skills),
                 }
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse AI-fixed schema JSON: {e}")
+                logger.error("Failed to parse AI-fixed schema JSON: %s", e)
                 # Return original schema if AI response is invalid
                 fixed_schema = failed_schema
                 # Ensure owner is set even for fallback schema
@@ -875,7 +931,7 @@ Please fix these errors and return the corrected agent schema as valid JSON.""",
             token_usage = extract_token_usage(response)
     else:
         # Make call without logging (fallback)
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=messages,
             temperature=0.3,
@@ -891,7 +947,7 @@ Please fix these errors and return the corrected agent schema as valid JSON.""",
                 fixed_schema["owner"] = user_id
             identified_skills = set(fixed_schema.get("skills", {}).keys())
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI-fixed schema JSON: {e}")
+            logger.error("Failed to parse AI-fixed schema JSON: %s", e)
             fixed_schema = failed_schema
             # Ensure owner is set even for fallback schema
             if user_id:
@@ -900,5 +956,5 @@ Please fix these errors and return the corrected agent schema as valid JSON.""",
 
         token_usage = extract_token_usage(response)
 
-    logger.info(f"AI schema correction completed (retry {retry_count})")
+    logger.info("AI schema correction completed (retry %d)", retry_count)
     return fixed_schema, identified_skills, token_usage
@@ -4,13 +4,15 @@ AI-based autonomous configuration generator for IntentKit agents.
 Uses LLM to detect scheduling patterns and generate proper autonomous configurations.
 """
 
+import hashlib
 import json
 import logging
+import re
 import time
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from epyxid import XID
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from intentkit.models.agent import AgentAutonomous
 from intentkit.skills import __all__ as available_skill_categories
@@ -20,26 +22,86 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# In-memory cache for autonomous pattern analysis responses
+_cache: Dict[str, Dict[str, Any]] = {}
+_cache_ttl = 86400  # 1 day in seconds
+_cache_max_size = 1024
+
+# Words that can indicate a recurring or triggered task. Plain ASCII prompts
+# without any of them can't describe an autonomous task, so the LLM analysis
+# is skipped for them. Other prompts, e.g. in other languages, always use it.
+_SCHEDULE_HINT_RE = re.compile(
+    r"\b(?:every|each|daily|hourly|weekly|monthly|yearly|annual|nightly|schedul"
+    r"|cron|second|minute|min\b|hour|hr|day|week|month|year|morning|afternoon"
+    r"|evening|night|noon|midnight|periodic|regular|recurr|repeat|interval"
+    r"|routine|auto|continu|constant|always|frequent|times|o'clock"
+    r"|\d+\s*(?:am|pm)|at\s+\d|monitor|watch|track|alert|notif|remind|until"
+    r"|when|once|twice|keep|loop|background)",
+    re.IGNORECASE,
+)
+
+
+def _may_describe_autonomous_task(prompt: str) -> bool:
+    """Check whether a prompt could describe a scheduled or autonomous task."""
+    return not prompt.isascii() or _SCHEDULE_HINT_RE.search(prompt) is not None
+
+
+def _analysis_cache_key(
+    model: str, messages: List[Dict[str, str]], temperature: float
+) -> str:
+    """Build the response cache key for an autonomous pattern analysis call."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _get_cached_analysis(cache_key: str) -> Optional[str]:
+    """Get a cached raw analysis response if it has not expired."""
+    cached = _cache.get(cache_key)
+    if cached and time.time() - cached["timestamp"] < _cache_ttl:
+        return cached["data"]
+    return None
+
+
+def _set_cached_analysis(cache_key: str, result_text: str) -> None:
+    """Cache a raw analysis response, evicting the oldest entry when full."""
+    _cache.pop(cache_key, None)
+    if len(_cache) >= _cache_max_size:
+        _cache.pop(next(iter(_cache)))
+    _cache[cache_key] = {"data": result_text, "timestamp": time.time()}
+
 
 async def generate_autonomous_configuration(
     prompt: str,
-    client: OpenAI,
+    client: AsyncOpenAI,
     llm_logger: Optional["LLMLogger"] = None,
+    cache: bool = True,
 ) -> Optional[Tuple[List[AgentAutonomous], List[str]]]:
     """Generate autonomous configuration from a prompt using AI.
 
+    The raw LLM analysis is cached by prompt, the low temperature makes the
+    response stable enough to reuse. Task ids are generated on every call.
+    Prompts without any scheduling hint skip the LLM call entirely.
+
     Args:
       prompt: The natural language prompt to analyze
       client: OpenAI client for LLM analysis
       llm_logger: Optional LLM logger for tracking API calls
+      cache: Whether to reuse a cached analysis for the same prompt
 
     Returns:
       Tuple of (autonomous_configs, required_skills) if autonomous pattern detected,
       None otherwise
     """
+    if not _may_describe_autonomous_task(prompt):
+        logger.info("No scheduling hints in prompt, skipping autonomous analysis")
+        return None
+
     logger.info("Using AI to analyze prompt for autonomous patterns")
     logger.debug(
-        f"Analyzing prompt: '{prompt[:100]}{'...' if len(prompt) > 100 else ''}'"
+        "Analyzing prompt: '%.100s%s'", prompt, "..." if len(prompt) > 100 else ""
     )
 
     system_message = f"""You are an expert at analyzing user prompts to detect autonomous task patterns and generating IntentKit agent configurations.
@@ -96,8 +158,14 @@ Be accurate and only detect true autonomous patterns with clear scheduling inten
 
         result_text = ""  # Initialize result_text
 
-        # Log the LLM call if logger is provided
-        if llm_logger:
+        cache_key = _analysis_cache_key("gpt-4.1", messages, 0.1)
+        cached_text = _get_cached_analysis(cache_key) if cache else None
+
+        if cached_text is not None:
+            logger.debug("Using cached autonomous pattern analysis")
+            result_text = cached_text
+        elif llm_logger:
+            # Log the LLM call if logger is provided
             async with llm_logger.log_call(
                 call_type="autonomous_pattern_analysis",
                 prompt=prompt,
@@ -110,7 +178,7 @@ Be accurate and only detect true autonomous patterns with clear scheduling inten
 
                 try:
                     # Make OpenAI API call
-                    response = client.chat.completions.create(
+                    response = await client.chat.completions.create(
                         model="gpt-4.1",
                         messages=messages,
                         temperature=0.1,
@@ -136,7 +204,7 @@ Be accurate and only detect true autonomous patterns with clear scheduling inten
         else:
             # Make call without logging (fallback)
             try:
-                response = client.chat.completions.create(
+                response = await client.chat.completions.create(
                     model="gpt-4.1", messages=messages, temperature=0.1, max_tokens=500
                 )
             except Exception as api_error:
@@ -149,6 +217,8 @@ Be accurate and only detect true autonomous patterns with clear scheduling inten
             )
 
         result = json.loads(result_text)
+        if cache and cached_text is None:
+            _set_cached_analysis(cache_key, result_text)
 
         if not result.get("has_autonomous", False):
             logger.info(" No autonomous pattern detected in prompt")
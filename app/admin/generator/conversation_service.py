@@ -7,12 +7,16 @@ This is separate from LLM logging which tracks technical API calls.
 import logging
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import func, update
+
 from intentkit.models.conversation import (
     ConversationMessage,
     ConversationMessageCreate,
     ConversationProject,
     ConversationProjectCreate,
+    ConversationProjectTable,
 )
+from intentkit.models.db import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -134,47 +138,96 @@ async def add_message(
     message_metadata: Optional[Dict[str, Any]] = None,
     user_id: Optional[str] = None,
 ) -> ConversationMessage:
-    """Add a message to a conversation project."""
-    # Ensure project exists
-    await create_or_get_project(project_id, user_id)
-
-    # Create and save message
-    message_create = ConversationMessageCreate(
-        project_id=project_id,
-        role=role,
-        content=content,
-        message_metadata=message_metadata,
-    )
-    message = await message_create.save()
+    """Add a message to a conversation project.
+
+    Creates the project if needed, stores the message and bumps the project's
+    last activity in a single session.
+    """
+    async with get_session() as db:
+        # Ensure project exists
+        if await db.get(ConversationProjectTable, project_id) is None:
+            await ConversationProjectCreate(
+                id=project_id, user_id=user_id
+            ).save_in_session(db)
+
+        # Create and save message
+        message_create = ConversationMessageCreate(
+            project_id=project_id,
+            role=role,
+            content=content,
+            message_metadata=message_metadata,
+        )
+        message = await message_create.save_in_session(db)
 
-    # Update project activity
-    project = await ConversationProject.get(project_id)
-    if project:
-        await project.update_activity()
+        # Update project activity
+        await db.execute(
+            update(ConversationProjectTable)
+            .where(ConversationProjectTable.id == project_id)
+            .values(last_activity=func.now())
+        )
+        await db.commit()
 
     return message
 
 
+def _message_to_dict(message: ConversationMessage) -> Dict[str, Any]:
+    """Convert a conversation message to the dict format expected by the API."""
+    return {
+        "id": message.id,
+        "role": message.role,
+        "content": message.content,
+        "metadata": message.message_metadata or {},
+        "created_at": message.created_at.isoformat(),
+    }
+
+
 async def get_conversation_history(
-    project_id: str, user_id: Optional[str] = None
+    project_id: str,
+    user_id: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """Get conversation history for a project."""
-    messages = await ConversationMessage.get_by_project(project_id, user_id)
+    """Get conversation history for a project.
+
+    Args:
+        project_id: Project ID
+        user_id: Optional user ID for access validation
+        offset: Number of messages to skip, oldest first
+        limit: Maximum number of messages to return, None for all
+
+    Raises:
+        ValueError: If the project has no conversation or the user has no access
+    """
+    messages = await ConversationMessage.get_by_project(
+        project_id, user_id, offset=offset, limit=limit
+    )
 
-    if not messages:
+    # An empty page past the end of an existing conversation is not an error
+    if not messages and offset == 0:
         raise ValueError(f"No conversation found for project {project_id}")
 
-    # Convert to dict format expected by API
-    return [
-        {
-            "id": message.id,
-            "role": message.role,
-            "content": message.content,
-            "metadata": message.message_metadata or {},
-            "created_at": message.created_at.isoformat(),
-        }
-        for message in messages
-    ]
+    return [_message_to_dict(message) for message in messages]
+
+
+async def get_conversation_summary(
+    project_id: str, user_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get the message count and the first and last messages of a conversation.
+
+    Raises:
+        ValueError: If the project has no conversation or the user has no access
+    """
+    count, first, last = await ConversationMessage.get_project_summary(
+        project_id, user_id
+    )
+    if not count:
+        raise ValueError(f"No conversation found for project {project_id}")
+
+    return {
+        "message_count": count,
+        "first_message": _message_to_dict(first),
+        "last_message": _message_to_dict(last),
+    }
 
 
 async def get_projects_by_user(
@@ -222,4 +275,12 @@ async def get_project_metadata(project_id: str) -> Optional[Dict[str, Any]]:
         "user_id": project.user_id,
         "created_at": project.created_at.timestamp(),
         "last_activity": project.last_activity.timestamp(),
+        "created_at_iso": project.created_at.isoformat(),
+        "last_activity_iso": project.last_activity.isoformat(),
+        "tags": project.tags,
     }
+
+
+async def update_project_tags(project_id: str, tags: List[Dict[str, int]]) -> None:
+    """Store the generated tags for a project."""
+    await ConversationProject.update_tags(project_id, tags)
@@ -9,10 +9,11 @@ This module handles all skill-related operations for agent generation including:
 import importlib
 import json
 import logging
+import re
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from intentkit.skills import __all__ as available_skill_categories
 
@@ -22,12 +23,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Get available skill categories from the skills module
-AVAILABLE_SKILL_CATEGORIES = set(available_skill_categories)
+AVAILABLE_SKILL_CATEGORIES = frozenset(available_skill_categories)
+_AVAILABLE_SKILLS_STR = ", ".join(sorted(AVAILABLE_SKILL_CATEGORIES))
 
 # Cache for skill states to avoid repeated imports
 _skill_states_cache: Dict[str, Set[str]] = {}
 _all_skills_cache: Dict[str, Dict[str, Set[str]]] = {}
 _skill_schemas_cache: Dict[str, Dict[str, Any]] = {}
+_keyword_matcher_cache: Dict[str, Any] = {}
+_api_key_skills_cache: Dict[str, FrozenSet[str]] = {}
 
 
 def load_skill_schema(skill_name: str) -> Optional[Dict[str, Any]]:
@@ -47,15 +51,18 @@ def load_skill_schema(skill_name: str) -> Optional[Dict[str, Any]]:
                 _skill_schemas_cache[skill_name] = schema
                 return schema
         else:
-            logger.warning(f"Schema file not found for skill: {skill_name}")
+            logger.warning("Schema file not found for skill: %s", skill_name)
             return None
     except Exception as e:
-        logger.error(f"Error loading schema for skill {skill_name}: {e}")
+        logger.error("Error loading schema for skill %s: %s", skill_name, e)
         return None
 
 
-def get_agent_owner_api_key_skills() -> Set[str]:
+def get_agent_owner_api_key_skills() -> FrozenSet[str]:
     """Get skills that require agent owner API keys."""
+    if "agent_owner" in _api_key_skills_cache:
+        return _api_key_skills_cache["agent_owner"]
+
     agent_owner_skills = set()
 
     for skill_name in AVAILABLE_SKILL_CATEGORIES:
@@ -73,14 +80,18 @@ def get_agent_owner_api_key_skills() -> Set[str]:
                     agent_owner_skills.add(skill_name)
         except Exception as e:
             logger.warning(
-                f"Error checking API key requirement for skill {skill_name}: {e}"
+                "Error checking API key requirement for skill %s: %s", skill_name, e
             )
 
-    return agent_owner_skills
+    _api_key_skills_cache["agent_owner"] = frozenset(agent_owner_skills)
+    return _api_key_skills_cache["agent_owner"]
 
 
-def get_configurable_api_key_skills() -> Set[str]:
+def get_configurable_api_key_skills() -> FrozenSet[str]:
     """Get skills with configurable API key providers."""
+    if "configurable" in _api_key_skills_cache:
+        return _api_key_skills_cache["configurable"]
+
     configurable_skills = set()
 
     for skill_name in AVAILABLE_SKILL_CATEGORIES:
@@ -98,10 +109,11 @@ def get_configurable_api_key_skills() -> Set[str]:
                         configurable_skills.add(skill_name)
         except Exception as e:
             logger.warning(
-                f"Error checking API key configurability for skill {skill_name}: {e}"
+                "Error checking API key configurability for skill %s: %s", skill_name, e
             )
 
-    return configurable_skills
+    _api_key_skills_cache["configurable"] = frozenset(configurable_skills)
+    return _api_key_skills_cache["configurable"]
 
 
 def get_skill_keyword_config() -> Dict[str, List[str]]:
@@ -124,7 +136,7 @@ def get_skill_keyword_config() -> Dict[str, List[str]]:
 
             config[skill_name] = keywords
         except Exception as e:
-            logger.warning(f"Error getting keywords for skill {skill_name}: {e}")
+            logger.warning("Error getting keywords for skill %s: %s", skill_name, e)
             config[skill_name] = [skill_name]
 
     return config
@@ -155,7 +167,7 @@ def get_skill_state_default(skill_name: str, state_name: str) -> str:
         return "private"
 
     except Exception as e:
-        logger.warning(f"Error getting default for {skill_name}.{state_name}: {e}")
+        logger.warning("Error getting default for %s.%s: %s", skill_name, state_name, e)
         return "private"
 
 
@@ -184,7 +196,9 @@ def get_skill_default_api_key_provider(skill_name: str) -> str:
         return "platform"
 
     except Exception as e:
-        logger.warning(f"Error getting API key provider default for {skill_name}: {e}")
+        logger.warning(
+            "Error getting API key provider default for %s: %s", skill_name, e
+        )
         return "platform"
 
 
@@ -206,10 +220,10 @@ def get_skill_states(skill_category: str) -> Set[str]:
                 _skill_states_cache[skill_category] = states
                 return states
 
-        logger.warning(f"Could not find SkillStates for {skill_category}")
+        logger.warning("Could not find SkillStates for %s", skill_category)
 
     except ImportError as e:
-        logger.warning(f"Could not import skill category {skill_category}: {e}")
+        logger.warning("Could not import skill category %s: %s", skill_category, e)
 
     # Fallback: try to extract states from schema.json
     try:
@@ -221,15 +235,15 @@ def get_skill_states(skill_category: str) -> Set[str]:
             and "properties" in schema["properties"]["states"]
         ):
             states = set(schema["properties"]["states"]["properties"].keys())
-            logger.info(f"Using schema-based states for {skill_category}: {states}")
+            logger.info("Using schema-based states for %s: %s", skill_category, states)
             _skill_states_cache[skill_category] = states
             return states
     except Exception as e:
         logger.warning(
-            f"Could not extract states from schema for {skill_category}: {e}"
+            "Could not extract states from schema for %s: %s", skill_category, e
         )
 
-    logger.warning(f"No states found for skill category {skill_category}")
+    logger.warning("No states found for skill category %s", skill_category)
     return set()
 
 
@@ -265,20 +279,20 @@ def merge_autonomous_skills(
         return skills_config
 
     logger.info(
-        f"Merging {len(autonomous_skills)} autonomous skills: {autonomous_skills}"
+        "Merging %d autonomous skills: %s", len(autonomous_skills), autonomous_skills
     )
-    logger.debug(f"Input skills config keys: {list(skills_config.keys())}")
+    logger.debug("Input skills config keys: %s", list(skills_config.keys()))
 
     for skill_name in autonomous_skills:
         if skill_name not in skills_config:
             # Add required autonomous skills with dynamic configuration
             skill_states = get_skill_states(skill_name)
             logger.debug(
-                f"Got {len(skill_states)} states for {skill_name}: {skill_states}"
+                "Got %d states for %s: %s", len(skill_states), skill_name, skill_states
             )
 
             if not skill_states:
-                logger.warning(f"No states found for autonomous skill: {skill_name}")
+                logger.warning("No states found for autonomous skill: %s", skill_name)
                 continue
 
             states_dict = {}
@@ -291,14 +305,16 @@ def merge_autonomous_skills(
                 "api_key_provider": get_skill_default_api_key_provider(skill_name),
             }
             logger.info(
-                f"Added autonomous skill: {skill_name} (with {len(skill_states)} states)"
+                "Added autonomous skill: %s (with %d states)",
+                skill_name,
+                len(skill_states),
             )
         else:
             # Ensure autonomous skills are enabled
             skills_config[skill_name]["enabled"] = True
-            logger.info(f"Enabled existing skill for autonomous use: {skill_name}")
+            logger.info("Enabled existing skill for autonomous use: %s", skill_name)
 
-    logger.debug(f"Output skills config keys: {list(skills_config.keys())}")
+    logger.debug("Output skills config keys: %s", list(skills_config.keys()))
     return skills_config
 
 
@@ -382,21 +398,23 @@ async def validate_skills_exist(skills_config: Dict[str, Any]) -> Dict[str, Any]
     Returns:
      Validated skills configuration with only existing skills
     """
-    logger.debug(f"Validating skills exist - input: {list(skills_config.keys())}")
-    logger.debug(f"Available skill categories: {list(AVAILABLE_SKILL_CATEGORIES)}")
+    logger.debug("Validating skills exist - input: %s", list(skills_config.keys()))
+    logger.debug("Available skill categories: %s", _AVAILABLE_SKILLS_STR)
 
     validated_skills = {}
 
     for skill_name, skill_config in skills_config.items():
         if skill_name in AVAILABLE_SKILL_CATEGORIES:
             validated_skills[skill_name] = skill_config
-            logger.debug(f"Skill {skill_name} exists and validated")
+            logger.debug("Skill %s exists and validated", skill_name)
         else:
             logger.warning(
-                f"Skipping non-existent skill '{skill_name}' - only available skills: {list(AVAILABLE_SKILL_CATEGORIES)}"
+                "Skipping non-existent skill '%s' - only available skills: %s",
+                skill_name,
+                _AVAILABLE_SKILLS_STR,
             )
 
-    logger.debug(f"Validated skills output: {list(validated_skills.keys())}")
+    logger.debug("Validated skills output: %s", list(validated_skills.keys()))
     return validated_skills
 
 
@@ -422,7 +440,8 @@ async def filter_skills_for_auto_generation(
         # Skip skills that always require agent owner API keys
         if skill_name in agent_owner_skills:
             logger.info(
-                f"Excluding skill '{skill_name}' from auto-generation: requires agent owner API key"
+                "Excluding skill '%s' from auto-generation: requires agent owner API key",
+                skill_name,
             )
             continue
 
@@ -442,7 +461,7 @@ async def filter_skills_for_auto_generation(
 
 
 async def identify_skills(
-    prompt: str, client: OpenAI, llm_logger: Optional["LLMLogger"] = None
+    prompt: str, client: AsyncOpenAI, llm_logger: Optional["LLMLogger"] = None
 ) -> Dict[str, Any]:
     """Identify relevant skills from the prompt using only real skill data.
 
@@ -462,6 +481,65 @@ async def identify_skills(
     return skills_config
 
 
+def _get_keyword_matcher() -> Tuple[
+    re.Pattern,
+    Dict[str, List[str]],
+    Dict[str, Dict[str, Set[str]]],
+    Dict[str, Tuple[Dict[str, str], str]],
+]:
+    """Get the compiled keyword matcher for keyword_match_skills.
+
+    Returns a regex that finds the longest keyword starting at each position of
+    the prompt, a map from each keyword to every keyword contained in it, the
+    keyword to skill mapping, and each mapped skill's state defaults and API key
+    provider. Together they build the skill configs in a single scan.
+    """
+    if _keyword_matcher_cache:
+        return (
+            _keyword_matcher_cache["pattern"],
+            _keyword_matcher_cache["contained"],
+            _keyword_matcher_cache["mapping"],
+            _keyword_matcher_cache["skill_defaults"],
+        )
+
+    mapping: Dict[str, Dict[str, Set[str]]] = {}
+    for keyword, skill_mapping in get_skill_mapping().items():
+        keyword = keyword.lower()
+        for skill_name, states in skill_mapping.items():
+            mapping.setdefault(keyword, {}).setdefault(skill_name, set()).update(
+                states
+            )
+
+    # Longest first, so the alternation picks the longest keyword at a position
+    keywords = sorted((k for k in mapping if k), key=len, reverse=True)
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))"
+    )
+    contained = {
+        keyword: [other for other in keywords if other in keyword]
+        for keyword in keywords
+    }
+
+    # Schema-based defaults are constant per skill, resolve them once
+    skill_states: Dict[str, Set[str]] = {}
+    for skill_mapping in mapping.values():
+        for skill_name, states in skill_mapping.items():
+            skill_states.setdefault(skill_name, set()).update(states)
+    skill_defaults = {
+        skill_name: (
+            {state: get_skill_state_default(skill_name, state) for state in states},
+            get_skill_default_api_key_provider(skill_name),
+        )
+        for skill_name, states in skill_states.items()
+    }
+
+    _keyword_matcher_cache["pattern"] = pattern
+    _keyword_matcher_cache["contained"] = contained
+    _keyword_matcher_cache["mapping"] = mapping
+    _keyword_matcher_cache["skill_defaults"] = skill_defaults
+    return pattern, contained, mapping, skill_defaults
+
+
 def keyword_match_skills(prompt: str) -> Dict[str, Any]:
     """Match skills using keyword matching with real skill states only.
 
@@ -472,31 +550,30 @@ def keyword_match_skills(prompt: str) -> Dict[str, Any]:
      Dict containing skill configurations with real states only
     """
     skills_config = {}
-    prompt_lower = prompt.lower()
+    pattern, contained, mapping, skill_defaults = _get_keyword_matcher()
+    if not contained:
+        return skills_config
 
-    for keyword, skill_mapping in get_skill_mapping().items():
-        if keyword.lower() in prompt_lower:
-            for skill_name, states in skill_mapping.items():
-                if skill_name not in skills_config:
-                    # Get states with schema-based defaults
-                    states_dict = {}
-                    for state in states:
-                        states_dict[state] = get_skill_state_default(skill_name, state)
-
-                    skills_config[skill_name] = {
-                        "enabled": True,
-                        "states": states_dict,
-                        "api_key_provider": get_skill_default_api_key_provider(
-                            skill_name
-                        ),
-                    }
-                else:
-                    # Merge states if skill already exists
-                    existing_states = skills_config[skill_name]["states"]
-                    for state in states:
-                        if state not in existing_states:
-                            existing_states[state] = get_skill_state_default(
-                                skill_name, state
-                            )
+    # Every keyword occurring in the prompt, deduplicated in match order
+    matched_keywords = dict.fromkeys(
+        keyword
+        for match in pattern.finditer(prompt.lower())
+        for keyword in contained[match.group(1)]
+    )
+
+    for keyword in matched_keywords:
+        for skill_name, states in mapping[keyword].items():
+            state_defaults, api_key_provider = skill_defaults[skill_name]
+            if skill_name not in skills_config:
+                skills_config[skill_name] = {
+                    "enabled": True,
+                    "states": {state: state_defaults[state] for state in states},
+                    "api_key_provider": api_key_provider,
+                }
+            else:
+                # Merge states if skill already exists
+                existing_states = skills_config[skill_name]["states"]
+                for state in states:
+                    existing_states.setdefault(state, state_defaults[state])
 
     return skills_config
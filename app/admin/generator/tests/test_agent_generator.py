@@ -0,0 +1,70 @@
+"""Tests for the agent schema generation pipeline."""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.admin.generator import agent_generator
+
+MODULE = "app.admin.generator.agent_generator"
+
+
+class TestNewAgentSchema(unittest.IsolatedAsyncioTestCase):
+    """Test generation of a new agent schema from a prompt."""
+
+    def setUp(self):
+        self.task = MagicMock(
+            minutes=60, cron=None, model_dump=MagicMock(return_value={"id": "t1"})
+        )
+        self.task.name = "Hourly trade"
+        self.generate_agent_attributes = AsyncMock(
+            return_value=({"name": "Trader"}, {"total_tokens": 10})
+        )
+        patches = [
+            patch(
+                f"{MODULE}.identify_skills",
+                AsyncMock(return_value={"twitter": {}, "owner_only": {}}),
+            ),
+            patch(
+                f"{MODULE}.generate_autonomous_configuration",
+                AsyncMock(return_value=([self.task], ["cdp"])),
+            ),
+            patch(
+                f"{MODULE}.merge_autonomous_skills",
+                MagicMock(side_effect=lambda skills, extra: {**skills, "cdp": {}}),
+            ),
+            patch(
+                f"{MODULE}.filter_skills_for_auto_generation",
+                AsyncMock(
+                    side_effect=lambda skills: {
+                        k: v for k, v in skills.items() if k != "owner_only"
+                    }
+                ),
+            ),
+            patch(
+                f"{MODULE}.generate_agent_attributes", self.generate_agent_attributes
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_attributes_describe_final_skill_set(self):
+        generate = agent_generator._generate_new_agent_schema
+        schema, identified_skills, token_usage = await generate(
+            "Tweet and trade every hour", MagicMock(), user_id="user-1"
+        )
+
+        # Attributes are generated after autonomous skills are merged in and
+        # skills needing owner API keys are filtered out
+        skills_config = self.generate_agent_attributes.await_args.args[1]
+        self.assertEqual(skills_config, {"twitter": {}, "cdp": {}})
+        self.assertEqual(identified_skills, {"twitter", "cdp"})
+        self.assertEqual(schema["skills"], skills_config)
+        self.assertEqual(schema["name"], "Trader")
+        self.assertEqual(schema["autonomous"], [{"id": "t1"}])
+        self.assertEqual(schema["owner"], "user-1")
+        self.assertEqual(token_usage, {"total_tokens": 10})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Tests for the conversation history service."""
+
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.admin.generator import conversation_service
+
+MODULE = "app.admin.generator.conversation_service"
+
+
+def make_message(message_id, role="user", content="hello"):
+    return SimpleNamespace(
+        id=message_id,
+        role=role,
+        content=content,
+        message_metadata=None,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+class TestConversationHistory(unittest.IsolatedAsyncioTestCase):
+    """Test paginated conversation history and summaries."""
+
+    def setUp(self):
+        self.get_by_project = AsyncMock(return_value=[])
+        self.get_project_summary = AsyncMock(return_value=(0, None, None))
+        patches = [
+            patch(
+                f"{MODULE}.ConversationMessage.get_by_project", self.get_by_project
+            ),
+            patch(
+                f"{MODULE}.ConversationMessage.get_project_summary",
+                self.get_project_summary,
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_history_page_is_requested_from_the_database(self):
+        self.get_by_project.return_value = [make_message("m3"), make_message("m4")]
+
+        history = await conversation_service.get_conversation_history(
+            "project-a", "user-1", offset=2, limit=2
+        )
+
+        self.get_by_project.assert_awaited_once_with(
+            "project-a", "user-1", offset=2, limit=2
+        )
+        self.assertEqual([m["id"] for m in history], ["m3", "m4"])
+        self.assertEqual(history[0]["metadata"], {})
+        self.assertEqual(history[0]["created_at"], "2025-01-01T00:00:00+00:00")
+
+    async def test_missing_conversation_raises(self):
+        with self.assertRaises(ValueError):
+            await conversation_service.get_conversation_history("project-a")
+
+    async def test_page_past_the_end_is_empty(self):
+        history = await conversation_service.get_conversation_history(
+            "project-a", offset=10, limit=5
+        )
+
+        self.assertEqual(history, [])
+
+    async def test_summary_has_count_and_first_and_last_messages(self):
+        self.get_project_summary.return_value = (
+            3,
+            make_message("m1"),
+            make_message("m3", role="assistant"),
+        )
+
+        summary = await conversation_service.get_conversation_summary(
+            "project-a", "user-1"
+        )
+
+        self.get_project_summary.assert_awaited_once_with("project-a", "user-1")
+        self.assertEqual(summary["message_count"], 3)
+        self.assertEqual(summary["first_message"]["id"], "m1")
+        self.assertEqual(summary["last_message"]["role"], "assistant")
+
+    async def test_summary_of_missing_conversation_raises(self):
+        with self.assertRaises(ValueError):
+            await conversation_service.get_conversation_summary("project-a")
+
+
+if __name__ == "__main__":
+    unittest.main()
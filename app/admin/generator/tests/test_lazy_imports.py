@@ -0,0 +1,60 @@
+"""Tests for lazy loading of the agent generator package."""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import app.admin.generator as generator
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
+def modules_after_import(module: str) -> set:
+    """Import a module in a fresh interpreter and list the loaded app modules."""
+    code = (
+        f"import sys, {module}; "
+        "print('\\n'.join(m for m in sys.modules if m.startswith('app.')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    ).stdout
+    return set(output.split())
+
+
+class TestGeneratorLazyImports(unittest.TestCase):
+    """Test that generator submodules load on first use only."""
+
+    def test_package_import_loads_no_submodules(self):
+        loaded = modules_after_import("app.admin.generator")
+
+        self.assertEqual(
+            {m for m in loaded if m.startswith("app.admin.generator.")}, set()
+        )
+
+    def test_admin_import_skips_generator_api(self):
+        loaded = modules_after_import("app.admin")
+
+        self.assertNotIn("app.admin.agent_generator_api", loaded)
+        self.assertNotIn("app.admin.generator.agent_generator", loaded)
+
+    def test_attribute_access_imports_and_caches(self):
+        from app.admin.generator.utils import ALLOWED_MODELS
+
+        self.assertIs(generator.ALLOWED_MODELS, ALLOWED_MODELS)
+        self.assertIs(vars(generator)["ALLOWED_MODELS"], ALLOWED_MODELS)
+
+    def test_unknown_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            getattr(generator, "not_a_generator_function")
+
+    def test_every_export_is_lazily_importable(self):
+        self.assertEqual(set(generator.__all__), set(generator._LAZY_IMPORTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
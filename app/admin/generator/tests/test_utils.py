@@ -0,0 +1,117 @@
+"""Tests for the agent generator utilities."""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from app.admin.generator import utils
+
+MODULE = "app.admin.generator.utils"
+
+
+class TestTagsApiCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    """Test the circuit breaker around the Crestal tags API."""
+
+    def setUp(self):
+        utils._tags_api_failures = 0
+        utils._tags_api_open_until = 0.0
+        self.addCleanup(setattr, utils, "_tags_api_failures", 0)
+        self.addCleanup(setattr, utils, "_tags_api_open_until", 0.0)
+
+        self.now = 1000.0
+        self.http_get = AsyncMock(side_effect=httpx.ConnectError("unreachable"))
+        self.sleep = AsyncMock()
+        patches = [
+            patch(f"{MODULE}.time", MagicMock(time=lambda: self.now)),
+            patch(f"{MODULE}.asyncio", MagicMock(sleep=self.sleep)),
+            patch(
+                f"{MODULE}.get_http_client",
+                MagicMock(return_value=MagicMock(get=self.http_get)),
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def generate_tags(self, times=1):
+        for _ in range(times):
+            tags = await utils.generate_tags_from_nation_api({}, "A trading agent")
+        return tags
+
+    async def test_retries_transient_errors_with_backoff(self):
+        self.http_get.side_effect = [
+            httpx.ConnectError("unreachable"),
+            MagicMock(status_code=503, text="unavailable"),
+            MagicMock(status_code=200, json=lambda: []),
+        ]
+
+        await self.generate_tags()
+
+        self.assertEqual(self.http_get.await_count, 3)
+        delays = [call.args[0] for call in self.sleep.await_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertLessEqual(delays[0], utils._tags_api_retry_delay)
+        self.assertLessEqual(delays[1], utils._tags_api_retry_delay * 2)
+        self.assertEqual(utils._tags_api_failures, 0)
+
+    async def test_client_errors_are_not_retried(self):
+        self.http_get.side_effect = None
+        self.http_get.return_value = MagicMock(status_code=404, text="not found")
+
+        await self.generate_tags()
+
+        self.assertEqual(self.http_get.await_count, 1)
+        self.sleep.assert_not_awaited()
+        self.assertEqual(utils._tags_api_failures, 1)
+
+    async def test_opens_after_consecutive_failures(self):
+        await self.generate_tags()
+        self.assertEqual(self.http_get.await_count, utils._tags_api_max_attempts)
+        self.assertEqual(utils._tags_api_open_until, 0.0)
+
+        # Retries stop as soon as the breaker opens
+        await self.generate_tags()
+        self.assertEqual(self.http_get.await_count, utils._tags_api_failure_threshold)
+        self.assertEqual(
+            utils._tags_api_open_until, self.now + utils._tags_api_reset_timeout
+        )
+
+        tags = await self.generate_tags()
+        self.assertEqual(len(tags), 3)
+        self.assertEqual(self.http_get.await_count, utils._tags_api_failure_threshold)
+
+    async def test_retries_api_after_reset_timeout(self):
+        await self.generate_tags(2)
+        calls = self.http_get.await_count
+
+        self.now += utils._tags_api_reset_timeout - 1
+        await self.generate_tags()
+        self.assertEqual(self.http_get.await_count, calls)
+
+        self.now += 2
+        await self.generate_tags()
+        self.assertEqual(
+            self.http_get.await_count, calls + utils._tags_api_max_attempts
+        )
+
+    async def test_success_resets_failure_count(self):
+        await self.generate_tags()
+        self.assertEqual(utils._tags_api_failures, utils._tags_api_max_attempts)
+
+        self.http_get.side_effect = None
+        self.http_get.return_value = MagicMock(status_code=200, json=lambda: [])
+        await self.generate_tags()
+        self.assertEqual(utils._tags_api_failures, 0)
+
+    async def test_malformed_response_counts_as_failure(self):
+        self.http_get.side_effect = None
+        self.http_get.return_value = MagicMock(status_code=200, json=lambda: [1, 2])
+
+        tags = await self.generate_tags()
+
+        self.assertEqual(len(tags), 3)
+        self.assertEqual(utils._tags_api_failures, 1)
+
+if __name__ == "__main__":
+    unittest.main()
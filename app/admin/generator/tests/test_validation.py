@@ -0,0 +1,76 @@
+"""Tests for agent schema validation."""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.admin.generator import validation
+
+MODULE = "app.admin.generator.validation"
+
+AGENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "model": {"type": "string"},
+    },
+    "required": ["name"],
+    "additionalProperties": False,
+}
+
+
+class TestSchemaValidatorCache(unittest.IsolatedAsyncioTestCase):
+    """Test the TTL cache of the compiled agent schema validator."""
+
+    def setUp(self):
+        validation._cache.clear()
+        self.addCleanup(validation._cache.clear)
+
+        self.now = 1000.0
+        self.get_json_schema = AsyncMock(return_value=AGENT_SCHEMA)
+        patches = [
+            patch(f"{MODULE}.time", MagicMock(time=lambda: self.now)),
+            patch(f"{MODULE}.Agent.get_json_schema", self.get_json_schema),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_validator_is_reused_within_ttl(self):
+        first = await validation._get_agent_schema_validator()
+        self.now += validation._cache_ttl - 1
+        second = await validation._get_agent_schema_validator()
+
+        self.assertIs(first, second)
+        self.get_json_schema.assert_awaited_once()
+
+    async def test_validator_is_rebuilt_after_ttl(self):
+        first = await validation._get_agent_schema_validator()
+        self.now += validation._cache_ttl
+        second = await validation._get_agent_schema_validator()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.get_json_schema.await_count, 2)
+
+    async def test_warm_up_builds_validator(self):
+        await validation.warm_up_schema_validator()
+        await validation.validate_schema({"name": "Agent"})
+
+        self.get_json_schema.assert_awaited_once()
+
+    async def test_validate_schema_collects_all_errors(self):
+        result = await validation.validate_schema({"model": 1, "extra": True})
+
+        self.assertFalse(result.valid)
+        self.assertEqual(len(result.errors), 3)
+        self.assertIn("Missing required fields: name", result.errors)
+        self.assertIn("Field 'model' should be string, got int", result.errors)
+
+    async def test_validate_schema_accepts_valid_data(self):
+        result = await validation.validate_schema({"name": "Agent", "model": "gpt"})
+
+        self.assertTrue(result.valid)
+        self.assertEqual(result.errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 Common helper functions used across the generator modules.
 """
 
+import asyncio
 import json
 import logging
 import random
@@ -11,7 +12,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 import httpx
 from epyxid import XID
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from intentkit.config.config import config
 
@@ -20,6 +21,67 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Shared async OpenAI client, created on first use
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Get the shared async OpenAI client for agent generation.
+
+    Reusing one client keeps its HTTP connection pool alive across requests.
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set in configuration
+    """
+    global _openai_client
+    if _openai_client is None:
+        if not config.openai_api_key:
+            raise ValueError("OPENAI_API_KEY is not set in configuration")
+        _openai_client = AsyncOpenAI(
+            api_key=config.openai_api_key,
+            max_retries=2,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            # Bounded pool, concurrent calls beyond it wait for a free connection
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+            ),
+        )
+    return _openai_client
+
+
+async def close_openai_client() -> None:
+    """Close the shared async OpenAI client if it was created."""
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+
+
+# Shared async HTTP client for third-party APIs, created on first use
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for agent generation.
+
+    Reusing one client keeps connections and TLS sessions alive across requests.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared async HTTP client if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def extract_token_usage(response) -> Dict[str, Any]:
     """Extract token usage information from OpenAI response.
@@ -84,7 +146,7 @@ def generate_request_id() -> str:
 async def generate_agent_summary(
     schema: Dict[str, Any],
     identified_skills: Set[str],
-    client: OpenAI,
+    client: AsyncOpenAI,
     llm_logger: Optional["LLMLogger"] = None,
 ) -> str:
     """Generate a human-readable summary of the created agent.
@@ -149,7 +211,7 @@ Write a congratulatory message.""",
             call_start_time = time.time()
 
             # Make OpenAI API call
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4.1-nano",
                 messages=messages,
                 temperature=0.7,
@@ -177,7 +239,7 @@ Write a congratulatory message.""",
             return summary
     else:
         # Make call without logging (fallback)
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=messages,
             temperature=0.7,
@@ -188,8 +250,8 @@ Write a congratulatory message.""",
         return summary
 
 
-# List of allowed models
-ALLOWED_MODELS = [
+# Allowed models
+ALLOWED_MODELS = (
     "gpt-4o",
     "gpt-4o-mini",
     "gpt-4.1-nano",
@@ -204,13 +266,104 @@ ALLOWED_MODELS = [
     "reigent",
     "venice-uncensored",
     "venice-llama-4-maverick-17b",
-]
+)
+
+
+# Simple circuit breaker for the Crestal tags API: after repeated failures,
+# skip the call for a while and use fallback tags instead
+_tags_api_url = "https://api.service.crestal.dev/v1/tags"
+_tags_api_timeout = httpx.Timeout(5.0, connect=1.0)
+_tags_api_failure_threshold = 5
+_tags_api_reset_timeout = 30  # seconds
+_tags_api_failures = 0
+_tags_api_open_until = 0.0
+
+# Transient tags API errors are retried with jittered exponential backoff
+_tags_api_max_attempts = 3
+_tags_api_retry_delay = 0.2  # seconds, doubled on every retry
+# Own generator, the fallback tags reseed the global one with the current time
+_tags_api_retry_random = random.Random()
+
+
+def _record_tags_api_result(success: bool) -> None:
+    """Update the tags API circuit breaker with the result of a call."""
+    global _tags_api_failures, _tags_api_open_until
+    if success:
+        _tags_api_failures = 0
+        return
+
+    _tags_api_failures += 1
+    if _tags_api_failures >= _tags_api_failure_threshold:
+        _tags_api_open_until = time.time() + _tags_api_reset_timeout
+        _tags_api_failures = 0
+        logger.warning(
+            "Crestal API failed %d times in a row, skipping it for %ds",
+            _tags_api_failure_threshold,
+            _tags_api_reset_timeout,
+        )
+
+
+async def _fetch_tags_from_api() -> Optional[Any]:
+    """Fetch the tag list from the Crestal API.
+
+    Timeouts, connection errors and 429 or 5xx responses are retried with jittered
+    exponential backoff. Every failed attempt counts towards the circuit breaker,
+    and retries stop as soon as it opens.
+
+    Returns:
+        The decoded response, or None if the API failed
+    """
+    for attempt in range(1, _tags_api_max_attempts + 1):
+        retryable = False
+        try:
+            logger.info("Fetching tags from Crestal API: %s", _tags_api_url)
+            response = await get_http_client().get(
+                _tags_api_url, timeout=_tags_api_timeout
+            )
+            logger.info("Crestal API response status: %s", response.status_code)
+
+            if response.status_code == 200:
+                tags_data = response.json()
+                _record_tags_api_result(True)
+                return tags_data
+
+            logger.warning(
+                "Crestal API returned status %s: %s",
+                response.status_code,
+                response.text,
+            )
+            retryable = response.status_code == 429 or response.status_code >= 500
+        except httpx.TimeoutException:
+            logger.warning("Crestal API request timed out")
+            retryable = True
+        except httpx.TransportError as e:
+            logger.warning("Could not connect to Crestal API: %s", e)
+            retryable = True
+        except Exception as e:
+            logger.warning("Error fetching tags from Crestal API: %s", e)
+
+        _record_tags_api_result(False)
+        if (
+            not retryable
+            or attempt == _tags_api_max_attempts
+            or time.time() < _tags_api_open_until
+        ):
+            return None
+
+        delay = _tags_api_retry_delay * 2 ** (attempt - 1)
+        await asyncio.sleep(_tags_api_retry_random.uniform(0, delay))
+
+    return None
 
 
 async def generate_tags_from_nation_api(
     agent_schema: Dict[str, Any], prompt: str
 ) -> List[Dict[str, int]]:
-    """Generate tags using Crestal API and LLM selection."""
+    """Generate tags using Crestal API and LLM selection.
+
+    Falls back to default tags instead of raising, and skips the API entirely
+    while its circuit breaker is open.
+    """
 
     # Simple fallback tags if everything fails - randomized to add variety
     def get_default_tags() -> List[Dict[str, int]]:
@@ -235,106 +388,90 @@ async def generate_tags_from_nation_api(
         random.seed(int(time.time()) % 10000)
         selected_set = random.choice(fallback_sets)
 
-        logger.info(f"Using randomized fallback tags: {selected_set}")
+        logger.info("Using randomized fallback tags: %s", selected_set)
         return selected_set
 
+    if time.time() < _tags_api_open_until:
+        logger.warning("Crestal API circuit breaker is open, using default tags")
+        return get_default_tags()
+
     try:
-        # Use the fixed Crestal API endpoint
-        crestal_api_url = "https://api.service.crestal.dev/v1/tags"
-        logger.info(f"Fetching tags from Crestal API: {crestal_api_url}")
+        tags_data = await _fetch_tags_from_api()
+        if tags_data is None:
+            return get_default_tags()
 
-        # Get tags from Crestal API
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(crestal_api_url)
+        logger.info(
+            "Received %d tags from Crestal API",
+            len(tags_data) if isinstance(tags_data, list) else 0,
+        )
 
-            logger.info(f"Crestal API response status: {response.status_code}")
+        if not isinstance(tags_data, list) or len(tags_data) == 0:
+            logger.warning("Crestal API response is not a valid list or is empty")
+            return get_default_tags()
+
+        # Group by category with tag IDs
+        categories = {}
+        tag_lookup = {}  # name -> {id, name, category}
+
+        for tag in tags_data:
+            # Handle the actual Crestal API response format
+            cat = tag.get("category", "")
+            name = tag.get("name", "")
+            tag_id = tag.get("id")
+
+            if cat and name and tag_id:
+                # Clean up category name (decode \u0026 to &)
+                clean_category = cat.replace("\\u0026", "&")
+
+                if clean_category not in categories:
+                    categories[clean_category] = []
+                categories[clean_category].append(name)
+                tag_lookup[name] = {
+                    "id": tag_id,
+                    "name": name,
+                    "category": clean_category,
+                }
 
-            if response.status_code != 200:
-                logger.warning(
-                    f"Crestal API returned status {response.status_code}: {response.text}"
-                )
-                return get_default_tags()
+        logger.info(
+            "Grouped tags into %d categories: %s",
+            len(categories),
+            list(categories.keys()),
+        )
 
-            tags_data = response.json()
-            logger.info(
-                f"Received {len(tags_data) if isinstance(tags_data, list) else 0} tags from Crestal API"
-            )
+        if not categories:
+            logger.warning("No valid categories found after processing tags")
+            return get_default_tags()
 
-            if not isinstance(tags_data, list) or len(tags_data) == 0:
-                logger.warning("Crestal API response is not a valid list or is empty")
-                return get_default_tags()
-
-            # Group by category with tag IDs
-            categories = {}
-            tag_lookup = {}  # name -> {id, name, category}
-
-            for tag in tags_data:
-                # Handle the actual Crestal API response format
-                cat = tag.get("category", "")
-                name = tag.get("name", "")
-                tag_id = tag.get("id")
-
-                if cat and name and tag_id:
-                    # Clean up category name (decode \u0026 to &)
-                    clean_category = cat.replace("\\u0026", "&")
-
-                    if clean_category not in categories:
-                        categories[clean_category] = []
-                    categories[clean_category].append(name)
-                    tag_lookup[name] = {
-                        "id": tag_id,
-                        "name": name,
-                        "category": clean_category,
-                    }
-
-            logger.info(
-                f"Grouped tags into {len(categories)} categories: {list(categories.keys())}"
-            )
+        # Use LLM to select tag names, then convert to IDs
+        selected_names = await select_tags_with_llm(agent_schema, prompt, categories)
+        logger.info("LLM selected tag names: %s", selected_names)
 
-            if not categories:
-                logger.warning("No valid categories found after processing tags")
-                return get_default_tags()
+        if not selected_names:
+            logger.warning("LLM returned no tag names")
+            return get_default_tags()
 
-            # Use LLM to select tag names, then convert to IDs
-            selected_names = await select_tags_with_llm(
-                agent_schema, prompt, categories
-            )
-            logger.info(f"LLM selected tag names: {selected_names}")
+        # Convert names to ID objects for frontend
+        selected_tags = []
+        for name in selected_names:
+            if name in tag_lookup:
+                selected_tags.append({"id": tag_lookup[name]["id"]})
+                logger.info("Converted tag '%s' to ID %s", name, tag_lookup[name]["id"])
+            else:
+                logger.warning("Tag name '%s' not found in lookup table", name)
 
-            if not selected_names:
-                logger.warning("LLM returned no tag names")
-                return get_default_tags()
+        if len(selected_tags) < 3:
+            logger.warning("Only got %d valid tags, using defaults", len(selected_tags))
+            return get_default_tags()
+
+        # Return exactly 3 tags
+        final_tags = selected_tags[:3]
+        logger.info("Final selected tags (3 max): %s", final_tags)
+        return final_tags
 
-            # Convert names to ID objects for frontend
-            selected_tags = []
-            for name in selected_names:
-                if name in tag_lookup:
-                    selected_tags.append({"id": tag_lookup[name]["id"]})
-                    logger.info(
-                        f"Converted tag '{name}' to ID {tag_lookup[name]['id']}"
-                    )
-                else:
-                    logger.warning(f"Tag name '{name}' not found in lookup table")
-
-            if len(selected_tags) < 3:
-                logger.warning(
-                    f"Only got {len(selected_tags)} valid tags, using defaults"
-                )
-                return get_default_tags()
-
-            # Return exactly 3 tags
-            final_tags = selected_tags[:3]
-            logger.info(f"Final selected tags (3 max): {final_tags}")
-            return final_tags
-
-    except httpx.TimeoutException:
-        logger.warning("Crestal API request timed out")
-        return get_default_tags()
-    except httpx.ConnectError:
-        logger.warning("Could not connect to Crestal API")
-        return get_default_tags()
     except Exception as e:
-        logger.error(f"Error in tag generation: {str(e)}")
+        # select_tags_with_llm doesn't raise, so this is a malformed API response
+        logger.error("Error in tag generation: %s", e)
+        _record_tags_api_result(False)
         return get_default_tags()
 
 
@@ -347,7 +484,7 @@ async def select_tags_with_llm(
             logger.warning("OpenAI API key not configured")
             return []
 
-        client = OpenAI(api_key=config.openai_api_key)
+        client = get_openai_client()
 
         random_seed = int(time.time() * 1000) % 10000
         random.seed(random_seed)
@@ -400,7 +537,7 @@ Your selection:"""
         logger.info("Calling OpenAI for tag selection with randomized prompt")
 
         # Increase temperature for more diverse outputs
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=[{"role": "user", "content": llm_prompt}],
             temperature=0.8,
@@ -409,14 +546,14 @@ Your selection:"""
         )
 
         result = response.choices[0].message.content.strip()
-        logger.info(f"LLM raw response: {result}")
+        logger.info("LLM raw response: %s", result)
 
         try:
             selected_tags = json.loads(result)
-            logger.info(f"Parsed LLM response: {selected_tags}")
+            logger.info("Parsed LLM response: %s", selected_tags)
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {e}")
-            logger.error(f"Raw response was: {result}")
+            logger.error("Failed to parse LLM response as JSON: %s", e)
+            logger.error("Raw response was: %s", result)
             return []
 
         # Validate tags exist in categories and limit to 3
@@ -437,13 +574,15 @@ Your selection:"""
                 if tag_category and tag_category not in selected_categories:
                     valid_tags.append(tag)
                     selected_categories.add(tag_category)
-                    logger.info(f"Added tag '{tag}' from category '{tag_category}'")
+                    logger.info("Added tag '%s' from category '%s'", tag, tag_category)
                 elif tag_category in selected_categories:
                     logger.info(
-                        f"Skipped tag '{tag}' - category '{tag_category}' already selected"
+                        "Skipped tag '%s' - category '%s' already selected",
+                        tag,
+                        tag_category,
                     )
             elif tag not in all_tag_names:
-                logger.warning(f"Tag '{tag}' not found in available tags")
+                logger.warning("Tag '%s' not found in available tags", tag)
 
         if len(valid_tags) < 3:
             unused_categories = [
@@ -460,14 +599,16 @@ Your selection:"""
                     valid_tags.append(random_tag)
                     selected_categories.add(cat_name)
                     logger.info(
-                        f"Added random tag '{random_tag}' from unused category '{cat_name}'"
+                        "Added random tag '%s' from unused category '%s'",
+                        random_tag,
+                        cat_name,
                     )
 
         logger.info(
-            f"Final valid tags after filtering and diversification: {valid_tags}"
+            "Final valid tags after filtering and diversification: %s", valid_tags
         )
         return valid_tags[:3]  # Ensure exactly 3 tags
 
     except Exception as e:
-        logger.error(f"Error in LLM tag selection: {str(e)}")
+        logger.error("Error in LLM tag selection: %s", e)
         return []
@@ -6,9 +6,11 @@ This module handles all validation operations for agent generation including:
 - Error formatting and handling
 """
 
+import asyncio
 import logging
 import re
-from typing import Any, Dict, List
+import time
+from typing import Any, Callable, Dict, List
 
 import jsonschema
 from pydantic import BaseModel, Field, ValidationError
@@ -18,6 +20,10 @@ from intentkit.models.agent import Agent, AgentUpdate
 
 logger = logging.getLogger(__name__)
 
+# In-memory cache for the compiled agent schema validator
+_cache: Dict[str, Dict[str, Any]] = {}
+_cache_ttl = 180  # 3 minutes, the schema follows enabled models and skills
+
 
 class ValidationResult(BaseModel):
     """Result of schema validation."""
@@ -54,6 +60,29 @@ async def validate_schema_against_json_schema(
     return result
 
 
+async def _get_agent_schema_validator() -> jsonschema.protocols.Validator:
+    """Get the compiled agent schema validator, building it at most once per TTL."""
+    cached = _cache.get("agent_schema")
+    if cached and time.time() - cached["timestamp"] < _cache_ttl:
+        return cached["data"]
+
+    # Use the shared schema function with admin configuration
+    schema = await Agent.get_json_schema(
+        filter_owner_api_skills=True,
+        admin_llm_skill_control=config.admin_llm_skill_control,
+    )
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    _cache["agent_schema"] = {"data": validator, "timestamp": time.time()}
+    return validator
+
+
+async def warm_up_schema_validator() -> None:
+    """Build the compiled agent schema validator ahead of the first request."""
+    await _get_agent_schema_validator()
+
+
 async def validate_schema(data: Dict[str, Any]) -> ValidationResult:
     """Validate a schema against the agent schema.
 
@@ -63,48 +92,99 @@ async def validate_schema(data: Dict[str, Any]) -> ValidationResult:
     Returns:
         ValidationResult with validation status and errors
     """
-    # Use the shared schema function with admin configuration
-    schema = await Agent.get_json_schema(
-        filter_owner_api_skills=True,
-        admin_llm_skill_control=config.admin_llm_skill_control,
-    )
-    return await validate_schema_against_json_schema(data, schema)
+    result = ValidationResult(valid=True)
+    validator = await _get_agent_schema_validator()
 
+    try:
+        # Collect every error so the AI fix step sees all of them at once, the
+        # schema walk runs in a worker thread to keep the event loop free
+        errors = await asyncio.to_thread(list, validator.iter_errors(data))
+        for error in errors:
+            result.valid = False
+            result.errors.append(_format_validation_error(error))
+    except Exception as e:
+        result.valid = False
+        result.errors.append(f"Schema validation failed: {str(e)}")
 
-def _format_validation_error(error: jsonschema.exceptions.ValidationError) -> str:
-    """Format a jsonschema validation error into a concise, user-friendly message."""
-    field_path = (
-        ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
-    )
+    if not result.valid:
+        logger.error(f"Schema validation failed: {data}")
 
-    if error.validator == "required":
-        return f"Missing required fields: {', '.join(error.validator_value)}"
+    return result
+
+
+_UNEXPECTED_PROPERTIES_RE = re.compile(r"\(([^)]+) were unexpected\)")
+
+
+def _format_required_error(
+    error: jsonschema.exceptions.ValidationError, field_path: str
+) -> str:
+    return f"Missing required fields: {', '.join(error.validator_value)}"
+
+
+def _format_additional_properties_error(
+    error: jsonschema.exceptions.ValidationError, field_path: str
+) -> str:
+    match = _UNEXPECTED_PROPERTIES_RE.search(error.message)
+    if match:
+        unexpected = match.group(1).replace("'", "").replace(" ", "")
+        return f"Unexpected properties: {unexpected}"
+    return "Schema contains unexpected properties"
 
-    elif error.validator == "additionalProperties":
-        if "were unexpected" in error.message:
-            match = re.search(r"\(([^)]+) were unexpected\)", error.message)
-            if match:
-                unexpected = match.group(1).replace("'", "").replace(" ", "")
-                return f"Unexpected properties: {unexpected}"
-        return "Schema contains unexpected properties"
 
-    elif error.validator == "type":
-        return f"Field '{field_path}' should be {error.validator_value}, got {type(error.instance).__name__}"
+def _format_type_error(
+    error: jsonschema.exceptions.ValidationError, field_path: str
+) -> str:
+    return f"Field '{field_path}' should be {error.validator_value}, got {type(error.instance).__name__}"
 
-    elif error.validator in ["maxLength", "minLength"]:
-        limit = error.validator_value
-        actual = len(error.instance) if error.instance else 0
-        op = "max" if error.validator == "maxLength" else "min"
-        return f"Field '{field_path}' length invalid ({op} {limit}, got {actual})"
 
-    elif error.validator == "enum":
-        return f"Field '{field_path}' must be one of: {', '.join(str(v) for v in error.validator_value)}"
+def _format_length_error(
+    error: jsonschema.exceptions.ValidationError, field_path: str
+) -> str:
+    limit = error.validator_value
+    actual = len(error.instance) if error.instance else 0
+    op = "max" if error.validator == "maxLength" else "min"
+    return f"Field '{field_path}' length invalid ({op} {limit}, got {actual})"
 
-    elif error.validator == "pattern":
-        return f"Field '{field_path}' does not match required pattern"
 
-    else:
-        return f"Validation error in '{field_path}': {error.message.split('.')[0]}"
+def _format_enum_error(
+    error: jsonschema.exceptions.ValidationError, field_path: str
+) -> str:
+    return f"Field '{field_path}' must be one of: {', '.join(str(v) for v in error.validator_value)}"
+
+
+def _format_pattern_error(
+    error: jsonschema.exceptions.ValidationError, field_path: str
+) -> str:
+    return f"Field '{field_path}' does not match required pattern"
+
+
+def _format_generic_error(
+    error: jsonschema.exceptions.ValidationError, field_path: str
+) -> str:
+    return f"Validation error in '{field_path}': {error.message.split('.')[0]}"
+
+
+# Formatters for jsonschema errors, keyed by the failing validator keyword
+_ERROR_FORMATTERS: Dict[
+    str, Callable[[jsonschema.exceptions.ValidationError, str], str]
+] = {
+    "required": _format_required_error,
+    "additionalProperties": _format_additional_properties_error,
+    "type": _format_type_error,
+    "maxLength": _format_length_error,
+    "minLength": _format_length_error,
+    "enum": _format_enum_error,
+    "pattern": _format_pattern_error,
+}
+
+
+def _format_validation_error(error: jsonschema.exceptions.ValidationError) -> str:
+    """Format a jsonschema validation error into a concise, user-friendly message."""
+    field_path = (
+        ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
+    )
+    formatter = _ERROR_FORMATTERS.get(error.validator, _format_generic_error)
+    return formatter(error, field_path)
 
 
 async def validate_agent_create(
@@ -158,46 +238,3 @@ async def validate_agent_create(
             result.errors.append(f"{error['loc'][0]}: {error['msg']}")
 
     return result
-
-
-async def fix_validation_errors(
-    schema: Dict[str, Any], schema_errors: List[str], agent_errors: List[str]
-) -> Dict[str, Any]:
-    """Attempt to fix validation errors.
-
-    Args:
-        schema: The original schema
-        schema_errors: Schema validation errors
-        agent_errors: Agent validation errors
-
-    Returns:
-        Fixed schema
-    """
-    fixed_schema = schema.copy()
-
-    # Fix required fields
-    required_fields = ["name", "purpose", "personality", "principles"]
-    for field in required_fields:
-        if field not in fixed_schema or not fixed_schema[field]:
-            fixed_schema[field] = f"Default {field.capitalize()}"
-
-    # Fix model and temperature
-    if "model" not in fixed_schema or not fixed_schema["model"]:
-        fixed_schema["model"] = (
-            "gpt-4.1-nano"  # Use default model, let schema validation handle validity
-        )
-    if "temperature" not in fixed_schema or not (0 <= fixed_schema["temperature"] <= 2):
-        fixed_schema["temperature"] = 0.7
-
-    # Fix agent-specific issues
-    if "Owner is required" in agent_errors:
-        fixed_schema["owner"] = "system"
-    if "Fee percentage too high" in agent_errors and "fee_percentage" in fixed_schema:
-        fixed_schema["fee_percentage"] = 100
-    if (
-        any("autonomous" in error for error in agent_errors)
-        and "autonomous" in fixed_schema
-    ):
-        fixed_schema.pop("autonomous")
-
-    return fixed_schema
@@ -0,0 +1,262 @@
+"""Tests for the account checking procedures."""
+
+import unittest
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.sql.elements import TextClause
+
+from app.admin import account_checking
+from app.admin.account_checking import AccountCheckingResult
+
+MODULE = "app.admin.account_checking"
+
+
+def make_account(account_id, balance, last_event_id, checkpoint_event_id, **tx):
+    """Build a row of the batched account balance query."""
+    row = {
+        "id": account_id,
+        "owner_type": "user",
+        "owner_id": f"owner-{account_id}",
+        "free_credits": Decimal("0"),
+        "reward_credits": Decimal("0"),
+        "credits": Decimal(balance),
+        "last_event_id": last_event_id,
+        "checkpoint_event_id": checkpoint_event_id,
+        "tx_credits": Decimal(balance),
+        "tx_debits": Decimal("0"),
+        "tx_free_credits": Decimal("0"),
+        "tx_reward_credits": Decimal("0"),
+        "tx_permanent_credits": Decimal(balance),
+    }
+    row.update({key: Decimal(value) for key, value in tx.items()})
+    return SimpleNamespace(**row)
+
+
+class TestAccountBalanceConsistency(unittest.IsolatedAsyncioTestCase):
+    """Test the batched, checkpointed account balance check."""
+
+    def setUp(self):
+        self.batches = []
+        self.queries = []
+        self.upserts = []
+
+        async def execute(statement, params=None):
+            if isinstance(statement, TextClause):
+                self.queries.append(params)
+                rows = self.batches.pop(0) if self.batches else []
+                return MagicMock(fetchall=MagicMock(return_value=rows))
+            self.upserts.append(params)
+            return MagicMock()
+
+        session = MagicMock(execute=AsyncMock(side_effect=execute), commit=AsyncMock())
+        session_context = MagicMock()
+        session_context.__aenter__.return_value = session
+        patcher = patch(
+            f"{MODULE}.get_session", MagicMock(return_value=session_context)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_consistent_accounts_are_checkpointed(self):
+        self.batches = [
+            [
+                make_account("a", "100", "event-2", "event-1"),
+                make_account("b", "50", "event-1", "event-1"),
+                make_account("c", "10", None, None),
+            ]
+        ]
+
+        results = await account_checking.check_account_balance_consistency(
+            use_checkpoint=True
+        )
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].status)
+        self.assertEqual(results[0].details["checked_count"], 3)
+        self.assertEqual(results[0].details["passed_count"], 3)
+        # Only accounts with a new event cutoff get a checkpoint
+        self.assertEqual(len(self.upserts), 1)
+        self.assertEqual([c["account_id"] for c in self.upserts[0]], ["a"])
+        self.assertEqual(self.upserts[0][0]["last_event_id"], "event-2")
+        self.assertEqual(self.upserts[0][0]["credits"], Decimal("100"))
+
+    async def test_inconsistent_account_is_reported_and_not_checkpointed(self):
+        self.batches = [
+            [
+                make_account("a", "100", "event-2", None, tx_permanent_credits="90"),
+                make_account("b", "50", "event-1", None),
+            ]
+        ]
+
+        results = await account_checking.check_account_balance_consistency(
+            use_checkpoint=True
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertFalse(results[0].status)
+        self.assertEqual(results[0].details["account_id"], "a")
+        # The summary result comes last with the counts of the whole run
+        self.assertFalse(results[1].status)
+        self.assertEqual(results[1].details["checked_count"], 2)
+        self.assertEqual(results[1].details["passed_count"], 1)
+        self.assertEqual(results[1].details["failed_count"], 1)
+        self.assertEqual(
+            results[0].details["permanent_credits_difference"], Decimal("10")
+        )
+        self.assertTrue(results[0].details["is_total_consistent"])
+        self.assertFalse(results[0].details["is_permanent_consistent"])
+        self.assertEqual([c["account_id"] for c in self.upserts[0]], ["b"])
+
+    async def test_batches_are_paginated_by_account_id(self):
+        self.batches = [
+            [make_account("a", "1", "event-1", "event-1")],
+            [make_account("b", "1", "event-1", "event-1")],
+        ]
+
+        results = await account_checking.check_account_balance_consistency(
+            check_recent_only=False
+        )
+
+        self.assertEqual(results[0].details["batches"], 2)
+        self.assertEqual([q["last_id"] for q in self.queries], ["", "a", "b"])
+        self.assertNotIn("time_threshold", self.queries[0])
+        self.assertEqual(self.upserts, [])
+
+    async def test_default_run_is_read_only(self):
+        self.batches = [[make_account("a", "100", "event-2", None)]]
+
+        results = await account_checking.check_account_balance_consistency()
+
+        self.assertTrue(results[0].status)
+        self.assertFalse(self.queries[0]["use_checkpoint"])
+        self.assertIn("time_threshold", self.queries[0])
+        self.assertEqual(self.upserts, [])
+
+
+class TestCountResults(unittest.TestCase):
+    """Test counting of checked and failed items for the run summary."""
+
+    def test_summary_result_counts_are_used(self):
+        results = [
+            AccountCheckingResult("account_balance_consistency", False),
+            AccountCheckingResult(
+                "account_balance_consistency",
+                False,
+                {"checked_count": 40, "passed_count": 39, "failed_count": 1},
+            ),
+        ]
+
+        self.assertEqual(account_checking._count_results(results), (40, 1))
+
+    def test_results_are_counted_without_summary(self):
+        results = [
+            AccountCheckingResult("orphaned_events", False),
+            AccountCheckingResult("orphaned_events", True),
+        ]
+
+        self.assertEqual(account_checking._count_results(results), (2, 1))
+
+
+class TestSystemTotalChecks(unittest.IsolatedAsyncioTestCase):
+    """Test the system-wide total balance checks."""
+
+    def setUp(self):
+        self.totals = SimpleNamespace(
+            total_free_credits=Decimal("10"),
+            total_reward_credits=Decimal("-4"),
+            total_permanent_credits=Decimal("-6"),
+            total_credits=Decimal("5"),
+            total_debits=Decimal("3"),
+        )
+        self.query = AsyncMock(return_value=self.totals)
+        patcher = patch(f"{MODULE}._query_system_totals", self.query)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_given_totals_are_not_queried_again(self):
+        credit = await account_checking.check_total_credit_balance(self.totals)
+        transaction = await account_checking.check_transaction_total_balance(
+            self.totals
+        )
+
+        self.assertTrue(credit[0].status)
+        self.assertFalse(transaction[0].status)
+        self.assertEqual(transaction[0].details["difference"], Decimal("2"))
+        self.query.assert_not_awaited()
+
+    async def test_totals_are_queried_when_not_given(self):
+        results = await account_checking.check_total_credit_balance()
+
+        self.assertEqual(results[0].details["grand_total"], Decimal("0"))
+        self.query.assert_awaited_once()
+
+
+class TestRunQuickChecks(unittest.IsolatedAsyncioTestCase):
+    """Test the full and fast modes of the quick checks."""
+
+    def setUp(self):
+        self.checks = {}
+        for name in (
+            "check_transaction_balance",
+            "check_orphaned_transactions",
+            "check_orphaned_events",
+            "check_total_credit_balance",
+            "check_transaction_total_balance",
+        ):
+            self.checks[name] = AsyncMock(
+                return_value=[AccountCheckingResult(check_type=name, status=True)]
+            )
+            patcher = patch(f"{MODULE}.{name}", self.checks[name])
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.totals = SimpleNamespace(total_credits=Decimal("0"))
+        self.query = AsyncMock(return_value=self.totals)
+        self.report_results = MagicMock()
+        for name, mock in (
+            ("_query_system_totals", self.query),
+            ("_report_results", self.report_results),
+        ):
+            patcher = patch(f"{MODULE}.{name}", mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_full_mode_runs_every_check(self):
+        results = await account_checking.run_quick_checks()
+
+        self.assertEqual(
+            list(results),
+            [
+                "transaction_balance",
+                "orphaned_transactions",
+                "orphaned_events",
+                "total_credit_balance",
+                "transaction_total_balance",
+            ],
+        )
+        for check in self.checks.values():
+            check.assert_awaited_once()
+        # Both total checks share one totals query
+        self.query.assert_awaited_once()
+        self.checks["check_total_credit_balance"].assert_awaited_once_with(self.totals)
+        self.checks["check_transaction_total_balance"].assert_awaited_once_with(
+            self.totals
+        )
+        self.report_results.assert_called_once_with("quick", results)
+
+    async def test_fast_mode_runs_total_balance_checks_only(self):
+        results = await account_checking.run_quick_checks(mode="fast")
+
+        self.assertEqual(
+            list(results), ["total_credit_balance", "transaction_total_balance"]
+        )
+        self.checks["check_transaction_balance"].assert_not_called()
+        self.checks["check_orphaned_transactions"].assert_not_called()
+        self.checks["check_orphaned_events"].assert_not_called()
+        self.report_results.assert_called_once_with("quick", results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,543 @@
+"""Tests for the agent generator API endpoints and caches."""
+
+import asyncio
+import itertools
+import unittest
+from typing import Dict, Set
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.admin import agent_generator_api
+from app.admin.agent_generator_api import router
+
+MODULE = "app.admin.agent_generator_api"
+
+
+async def fake_generate(prompt, user_id, existing_agent, llm_logger, generate_tags):
+    """Stand-in for generate_validated_agent_schema."""
+    if "fail" in prompt:
+        raise ValueError("generation exploded")
+    agent_schema = {"name": "Agent", "skills": {"cdp": {}}, "autonomous": []}
+    tags = [{"id": 1}] if generate_tags else []
+    return agent_schema, {"cdp"}, "An agent that trades", tags
+
+
+class GeneratorApiTestCase(unittest.TestCase):
+    """Patch the generator pipeline and storage used by the endpoints."""
+
+    def setUp(self):
+        agent_generator_api._cache.clear()
+        agent_generator_api._inflight_generations.clear()
+
+        project_ids = (f"project-{n}" for n in itertools.count(1))
+        self.generate = AsyncMock(side_effect=fake_generate)
+        self.update_project_tags = AsyncMock()
+        self.generate_tags = AsyncMock(return_value=[{"id": 7}])
+        self.get_projects_by_user = AsyncMock(return_value=[{"project_id": "p"}])
+        self.get_conversation_summary = AsyncMock(
+            return_value={
+                "message_count": 1,
+                "first_message": {"role": "user", "content": "hi"},
+                "last_message": {"role": "user", "content": "hi"},
+            }
+        )
+        self.get_conversation_history = AsyncMock(
+            return_value=[{"role": "user", "content": "hi"}]
+        )
+        self.get_project_metadata = AsyncMock(return_value=None)
+        patches = [
+            patch(f"{MODULE}.config", MagicMock(redis_host=None, release="test")),
+            patch(f"{MODULE}.generate_validated_agent_schema", self.generate),
+            patch(f"{MODULE}.update_project_tags", self.update_project_tags),
+            patch(f"{MODULE}.generate_tags_from_nation_api", self.generate_tags),
+            patch(f"{MODULE}.get_projects_by_user", self.get_projects_by_user),
+            patch(f"{MODULE}.get_conversation_summary", self.get_conversation_summary),
+            patch(f"{MODULE}.get_conversation_history", self.get_conversation_history),
+            patch(f"{MODULE}.get_project_metadata", self.get_project_metadata),
+            patch(
+                f"{MODULE}.ConversationService",
+                MagicMock(side_effect=lambda **kwargs: AsyncMock()),
+            ),
+            patch(
+                f"{MODULE}.create_llm_logger",
+                MagicMock(
+                    side_effect=lambda **kwargs: MagicMock(
+                        request_id=next(project_ids)
+                    )
+                ),
+            ),
+            patch(
+                f"{MODULE}.LLMLogger",
+                MagicMock(side_effect=lambda request_id, user_id: MagicMock()),
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+
+
+class TestGenerateBatchRoute(GeneratorApiTestCase):
+    """Test the batch generation route."""
+
+    def test_batch_returns_results_in_request_order(self):
+        response = self.client.post(
+            "/agent/generate/batch",
+            json={
+                "items": [
+                    {"prompt": "Create a trading agent", "user_id": "user-1"},
+                    {"prompt": "Create an agent that will fail", "user_id": "user-1"},
+                    {"prompt": "Create a twitter agent", "user_id": "user-2"},
+                ],
+                "max_concurrency": 2,
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([r["success"] for r in results], [True, False, True])
+        self.assertEqual(results[0]["result"]["activated_skills"], ["cdp"])
+        self.assertEqual(results[0]["result"]["tags"], [{"id": 1}])
+        self.assertEqual(results[0]["result"]["tags_status"], "ready")
+        self.assertEqual(results[1]["error"]["error"], "AgentGenerationFailed")
+        self.assertIn("generation exploded", results[1]["error"]["msg"])
+        self.assertEqual(self.generate.await_count, 3)
+
+    def test_batch_defers_tags_to_background_tasks(self):
+        response = self.client.post(
+            "/agent/generate/batch",
+            json={
+                "items": [
+                    {
+                        "prompt": "Create a trading agent",
+                        "user_id": "user-1",
+                        "defer_tags": True,
+                    }
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        result = response.json()["results"][0]["result"]
+        self.assertEqual(result["tags_status"], "pending")
+        self.assertEqual(result["tags"], [])
+        self.assertFalse(self.generate.await_args.kwargs["generate_tags"])
+        # Background tasks run once the response is sent
+        self.generate_tags.assert_awaited_once()
+        self.update_project_tags.assert_awaited_with(result["project_id"], [{"id": 7}])
+
+    def test_batch_reports_unexpected_errors_per_item(self):
+        generate_agent_impl = agent_generator_api._generate_agent_impl
+
+        async def generate_or_crash(item, **kwargs):
+            if "crash" in item.prompt:
+                raise RuntimeError("logger unavailable")
+            return await generate_agent_impl(item, **kwargs)
+
+        with patch(f"{MODULE}._generate_agent_impl", generate_or_crash):
+            response = self.client.post(
+                "/agent/generate/batch",
+                json={
+                    "items": [
+                        {"prompt": "Create an agent that will crash", "user_id": "u"},
+                        {"prompt": "Create a trading agent", "user_id": "u"},
+                    ]
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual([r["success"] for r in results], [False, True])
+        self.assertEqual(results[0]["error"]["msg"], "logger unavailable")
+
+    def test_batch_rejects_empty_items(self):
+        response = self.client.post("/agent/generate/batch", json={"items": []})
+
+        self.assertEqual(response.status_code, 422)
+        self.generate.assert_not_awaited()
+
+
+class TestGenerationResultCache(GeneratorApiTestCase):
+    """Test reuse of results for identical generation requests."""
+
+    body = {"prompt": "Create a trading agent", "user_id": "user-1"}
+
+    def test_identical_request_reuses_result_in_new_project(self):
+        first = self.client.post("/agent/generate", json=self.body).json()
+        second = self.client.post("/agent/generate", json=self.body).json()
+
+        self.assertEqual(self.generate.await_count, 1)
+        self.assertNotEqual(first["project_id"], second["project_id"])
+        self.assertEqual(first["agent"], second["agent"])
+        self.assertEqual(second["tags"], [{"id": 1}])
+        # The cached result is still recorded under the new project
+        self.update_project_tags.assert_awaited_with(second["project_id"], [{"id": 1}])
+
+    def test_no_cache_query_skips_cached_result(self):
+        self.client.post("/agent/generate", json=self.body)
+        response = self.client.post("/agent/generate?no_cache=true", json=self.body)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.generate.await_count, 2)
+
+    def test_helper_uses_cache_by_default(self):
+        request = agent_generator_api.AgentGenerateRequest(**self.body)
+
+        async def generate_twice():
+            await agent_generator_api._generate_agent_impl(request)
+            await agent_generator_api._generate_agent_impl(request)
+
+        asyncio.run(generate_twice())
+        self.assertEqual(self.generate.await_count, 1)
+
+    def test_failed_cache_hit_returns_generation_error(self):
+        self.client.post("/agent/generate", json=self.body)
+        self.update_project_tags.side_effect = ValueError("database unavailable")
+
+        with patch(f"{MODULE}._invalidate_generation_cache", AsyncMock()) as invalidate:
+            response = self.client.post("/agent/generate", json=self.body)
+
+        self.assertEqual(response.status_code, 500)
+        detail = response.json()["detail"]
+        self.assertEqual(detail["error"], "AgentGenerationFailed")
+        self.assertIn("database unavailable", detail["msg"])
+        self.assertEqual(self.generate.await_count, 1)
+        invalidate.assert_awaited_with(detail["project_id"])
+
+    def test_continued_project_is_not_cached(self):
+        body = {**self.body, "project_id": "project-a"}
+        self.client.post("/agent/generate", json=body)
+        self.client.post("/agent/generate", json=body)
+
+        self.assertEqual(self.generate.await_count, 2)
+
+
+class TestInflightGenerations(GeneratorApiTestCase):
+    """Test coalescing of identical concurrent generation requests."""
+
+    request = agent_generator_api.AgentGenerateRequest(
+        prompt="Create a trading agent", user_id="user-1"
+    )
+
+    def test_concurrent_identical_requests_share_one_generation(self):
+        async def slow_generate(**kwargs):
+            await asyncio.sleep(0.01)
+            return await fake_generate(**kwargs)
+
+        self.generate.side_effect = slow_generate
+
+        async def generate_concurrently():
+            generations = [
+                agent_generator_api._generate_agent_impl(self.request)
+                for _ in range(3)
+            ]
+            return await asyncio.gather(*generations)
+
+        results = asyncio.run(generate_concurrently())
+
+        self.assertEqual(self.generate.await_count, 1)
+        self.assertEqual(len({r.project_id for r in results}), 3)
+        self.assertTrue(all(r.agent == results[0].agent for r in results))
+        self.assertEqual(agent_generator_api._inflight_generations, {})
+
+    def test_waiting_request_generates_after_first_fails(self):
+        calls = 0
+
+        async def fail_first(**kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            if calls == 1:
+                raise ValueError("generation exploded")
+            return await fake_generate(**kwargs)
+
+        self.generate.side_effect = fail_first
+
+        async def generate_concurrently():
+            return await asyncio.gather(
+                agent_generator_api._generate_agent_impl(self.request),
+                agent_generator_api._generate_agent_impl(self.request),
+                return_exceptions=True,
+            )
+
+        first, second = asyncio.run(generate_concurrently())
+
+        self.assertIsInstance(first, HTTPException)
+        self.assertIsInstance(second, agent_generator_api.AgentGenerateResponse)
+        self.assertEqual(self.generate.await_count, 2)
+        self.assertEqual(agent_generator_api._inflight_generations, {})
+
+
+class TestGenerationDetailPagination(GeneratorApiTestCase):
+    """Test paging through the conversation of a generation."""
+
+    def setUp(self):
+        super().setUp()
+        self.get_conversation_summary.return_value = {
+            "message_count": 3,
+            "first_message": {"id": "m1"},
+            "last_message": {"id": "m3"},
+        }
+
+    def test_first_page_points_to_the_next(self):
+        self.get_conversation_history.return_value = [{"id": "m1"}, {"id": "m2"}]
+
+        response = self.client.get("/agent/generations/project-a?limit=2")
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["message_count"], 3)
+        self.assertTrue(body["has_more"])
+        self.assertEqual(body["next_offset"], 2)
+        self.get_conversation_history.assert_awaited_once_with(
+            project_id="project-a", user_id=None, offset=0, limit=2
+        )
+
+    def test_last_page_has_no_next_offset(self):
+        self.get_conversation_history.return_value = [{"id": "m3"}]
+
+        body = self.client.get("/agent/generations/project-a?offset=2&limit=2").json()
+
+        self.assertFalse(body["has_more"])
+        self.assertIsNone(body["next_offset"])
+        self.assertEqual(body["offset"], 2)
+
+    def test_invalid_page_is_rejected(self):
+        for query in ("offset=-1", "limit=0", "limit=501"):
+            response = self.client.get(f"/agent/generations/project-a?{query}")
+            self.assertEqual(response.status_code, 400)
+
+    def test_missing_project_is_not_found(self):
+        self.get_conversation_summary.side_effect = ValueError("No conversation")
+
+        response = self.client.get("/agent/generations/project-a")
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestGenerationTags(GeneratorApiTestCase):
+    """Test polling for the tags of a generation."""
+
+    def set_project_tags(self, tags):
+        self.get_project_metadata.return_value = {"user_id": "user-1", "tags": tags}
+
+    def test_tags_are_pending_until_stored(self):
+        self.set_project_tags(None)
+
+        body = self.client.get("/agent/generations/project-a/tags").json()
+
+        self.assertEqual(
+            body, {"project_id": "project-a", "status": "pending", "tags": []}
+        )
+
+    def test_stored_tags_are_ready(self):
+        self.set_project_tags([{"id": 3}])
+
+        response = self.client.get("/agent/generations/project-a/tags?user_id=user-1")
+        body = response.json()
+
+        self.assertEqual(body["status"], "ready")
+        self.assertEqual(body["tags"], [{"id": 3}])
+
+    def test_other_users_project_is_not_found(self):
+        self.set_project_tags([{"id": 3}])
+
+        response = self.client.get("/agent/generations/project-a/tags?user_id=user-2")
+
+        self.assertEqual(response.status_code, 404)
+
+
+class FakeRedisPipeline:
+    """Queues commands and applies them to a FakeRedis on execute."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, value))
+
+    def sadd(self, key, member):
+        self.commands.append(("sadd", key, member))
+
+    def expire(self, key, ttl):
+        self.commands.append(("expire", key, ttl))
+
+    async def execute(self):
+        for command, key, value in self.commands:
+            if command == "set":
+                self.redis.values[key] = value
+            elif command == "sadd":
+                self.redis.sets.setdefault(key, set()).add(value)
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the caches use."""
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.sets: Dict[str, Set[str]] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def sunion(self, keys):
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+
+class TestGenerationHistoryCache(GeneratorApiTestCase):
+    """Test caching and invalidation of generation history responses."""
+
+    def test_generations_list_is_cached_until_a_generation(self):
+        for _ in range(2):
+            response = self.client.get("/agent/generations?user_id=user-1")
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_projects_by_user.await_count, 1)
+
+        # A different limit is a different page
+        self.client.get("/agent/generations?user_id=user-1&limit=10")
+        self.assertEqual(self.get_projects_by_user.await_count, 2)
+
+        self.client.post(
+            "/agent/generate",
+            json={"prompt": "Create a trading agent", "user_id": "user-1"},
+        )
+        self.client.get("/agent/generations?user_id=user-1")
+        self.assertEqual(self.get_projects_by_user.await_count, 3)
+
+    def test_generation_detail_is_invalidated_per_project(self):
+        for project_id in ("project-a", "project-b", "project-a"):
+            response = self.client.get(f"/agent/generations/{project_id}")
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_conversation_summary.await_count, 2)
+
+        self.client.post(
+            "/agent/generate",
+            json={
+                "prompt": "Create a trading agent",
+                "user_id": "user-1",
+                "project_id": "project-a",
+            },
+        )
+        for project_id in ("project-a", "project-b"):
+            self.client.get(f"/agent/generations/{project_id}")
+
+        fetched = [c.args[0] for c in self.get_conversation_summary.await_args_list]
+        self.assertEqual(fetched, ["project-a", "project-b", "project-a"])
+
+    def test_failed_generation_invalidates_its_project(self):
+        self.client.get("/agent/generations/project-a")
+        response = self.client.post(
+            "/agent/generate",
+            json={
+                "prompt": "Create an agent that will fail",
+                "user_id": "user-1",
+                "project_id": "project-a",
+            },
+        )
+        self.assertEqual(response.status_code, 500)
+
+        self.client.get("/agent/generations/project-a")
+        self.assertEqual(self.get_conversation_summary.await_count, 2)
+
+
+class TestGenerationHistoryRedisCache(unittest.IsolatedAsyncioTestCase):
+    """Test the Redis backed generation history cache."""
+
+    def setUp(self):
+        agent_generator_api._cache.clear()
+        self.redis = FakeRedis()
+        patches = [
+            patch(
+                f"{MODULE}.config", MagicMock(redis_host="localhost", release="test")
+            ),
+            patch(f"{MODULE}.get_redis", MagicMock(return_value=self.redis)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    async def test_round_trip(self):
+        response = agent_generator_api.GenerationsListResponse(
+            projects=[{"project_id": "p"}]
+        )
+        await agent_generator_api._set_cached_history(
+            "generations", "user-1:50", 30, response
+        )
+
+        cached = await agent_generator_api._get_cached_history(
+            "generations", "user-1:50", 30, agent_generator_api.GenerationsListResponse
+        )
+        self.assertEqual(cached, response)
+        self.assertEqual(agent_generator_api._cache, {})
+
+    async def test_invalidation_drops_only_affected_scopes(self):
+        response = agent_generator_api.GenerationsListResponse(projects=[])
+        for scope in ("generations", "generation:project-a", "generation:project-b"):
+            await agent_generator_api._set_cached_history(
+                scope, "user-1:0:100", 60, response
+            )
+
+        await agent_generator_api._invalidate_generation_cache("project-a")
+
+        remaining = {
+            scope: await agent_generator_api._get_cached_history(
+                scope,
+                "user-1:0:100",
+                60,
+                agent_generator_api.GenerationsListResponse,
+            )
+            for scope in ("generations", "generation:project-a", "generation:project-b")
+        }
+        self.assertIsNone(remaining["generations"])
+        self.assertIsNone(remaining["generation:project-a"])
+        self.assertEqual(remaining["generation:project-b"], response)
+
+    async def test_redis_errors_are_cache_misses(self):
+        self.redis.get = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        cached = await agent_generator_api._get_cached_history(
+            "generations", "user-1:50", 30, agent_generator_api.GenerationsListResponse
+        )
+        self.assertIsNone(cached)
+
+    async def test_generation_result_round_trip(self):
+        request = agent_generator_api.AgentGenerateRequest(
+            prompt="Create a trading agent", user_id="user-1"
+        )
+        key = agent_generator_api._generation_result_cache_key(request)
+        result = {"agent": {"name": "Agent"}, "summary": "An agent", "tags": []}
+
+        self.assertIsNone(await agent_generator_api._get_cached_generation_result(key))
+        await agent_generator_api._set_cached_generation_result(key, result)
+
+        self.assertEqual(
+            await agent_generator_api._get_cached_generation_result(key), result
+        )
+        self.assertIn(key, self.redis.values)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,8 +13,10 @@ import sentry_sdk
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from sqlalchemy import select
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.admin import (
     admin_router,
@@ -28,6 +30,12 @@ from app.admin import (
     user_router,
     user_router_readonly,
 )
+from app.admin.generator import (
+    close_http_client,
+    close_openai_client,
+    get_openai_client,
+    warm_up_schema_validator,
+)
 from app.entrypoints.agent_api import router_ro as agent_api_ro
 from app.entrypoints.agent_api import router_rw as agent_api_rw
 from app.entrypoints.openai_compatible import openai_router
@@ -62,6 +70,70 @@ if config.sentry_dsn:
     )
 
 
+class MaxBodySizeMiddleware:
+    """Reject oversized request bodies on selected paths.
+
+    Requests with a Content-Length over the limit are rejected before any of the
+    body is read. Other requests, e.g. chunked ones, have their body counted
+    while it is read and are rejected as soon as it exceeds the limit. The body
+    is then replayed to the app, which buffers it for parsing anyway.
+    """
+
+    def __init__(self, app: ASGIApp, limits: dict[str, int]) -> None:
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        max_bytes = None
+        if scope["type"] == "http":
+            # A trailing slash reaches the same route, so it gets the same limit
+            max_bytes = self.limits.get(scope["path"].rstrip("/"))
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > max_bytes:
+                    await self._reject(scope, receive, send, max_bytes)
+                    return
+                break
+
+        messages: list[Message] = []
+        received = 0
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            received += len(message.get("body", b""))
+            if received > max_bytes:
+                await self._reject(scope, receive, send, max_bytes)
+                return
+            if not message.get("more_body", False):
+                break
+
+        async def replay_receive() -> Message:
+            if messages:
+                return messages.pop(0)
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+
+    @staticmethod
+    async def _reject(
+        scope: Scope, receive: Receive, send: Send, max_bytes: int
+    ) -> None:
+        response = JSONResponse(
+            status_code=413,
+            content={
+                "error": "RequestEntityTooLarge",
+                "msg": f"Request body exceeds {max_bytes} bytes",
+            },
+        )
+        await response(scope, receive, send)
+
+
 # Read agent API documentation from file
 def _load_agent_api_docs() -> str:
     """Load agent API documentation from docs/agent_api.md file."""
@@ -152,10 +224,27 @@ async def lifespan(app: FastAPI):
     # Create example agent if no agents exist
     await create_example_agent()
 
+    # Warm up the agent generator so the first request doesn't pay for it
+    try:
+        await warm_up_schema_validator()
+    except Exception as e:
+        logger.warning(f"Failed to warm up agent schema validator: {e}")
+    if config.openai_api_key:
+        get_openai_client()
+
+    # Build the OpenAPI schemas now, FastAPI caches them on the app afterwards
+    try:
+        app.openapi()
+        agent_app.openapi()
+    except Exception as e:
+        logger.warning(f"Failed to warm up OpenAPI schema: {e}")
+
     logger.info("API server start")
     yield
     # Clean up will run after the API server shutdown
     logger.info("Cleaning up and shutdown...")
+    await close_openai_client()
+    await close_http_client()
 
 
 app = FastAPI(
@@ -179,6 +268,17 @@ app.exception_handler(RequestValidationError)(request_validation_exception_handl
 app.exception_handler(StarletteHTTPException)(http_exception_handler)
 app.exception_handler(Exception)(intentkit_other_error_handler)
 
+# Reject oversized agent generation requests before the body is parsed, a batch
+# carries up to 20 requests (see AgentGenerateBatchRequest)
+_agent_generate_max_bytes = 256 * 1024
+app.add_middleware(
+    MaxBodySizeMiddleware,
+    limits={
+        "/agent/generate": _agent_generate_max_bytes,
+        "/agent/generate/batch": _agent_generate_max_bytes * 20,
+    },
+)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -7,6 +7,7 @@ tasks that only require read-only database access.
 import asyncio
 import logging
 import signal
+from typing import Literal
 
 import sentry_sdk
 from apscheduler.jobstores.redis import RedisJobStore
@@ -37,15 +38,18 @@ if config.sentry_dsn:
     )
 
 
-async def run_quick_account_checks():
+async def run_quick_account_checks(mode: Literal["full", "fast"] = "full"):
     """Run quick account consistency checks and send results to Slack.
 
     This runs the faster checks for account balances, transactions, and other credit-related consistency
     issues and reports the results to the configured Slack channel.
+
+    Args:
+        mode: "full" runs all quick checks, "fast" only the system-wide total balance checks
     """
-    logger.info("Running scheduled quick account consistency checks")
+    logger.info(f"Running scheduled quick account consistency checks ({mode} mode)")
     try:
-        await run_quick_checks()
+        await run_quick_checks(mode=mode)
         logger.info("Completed quick account consistency checks")
     except Exception as e:
         logger.error(f"Error running quick account consistency checks: {e}")
@@ -96,16 +100,28 @@ def create_checker():
 
     scheduler = AsyncIOScheduler(jobstores=jobstores)
 
-    # Run quick account consistency checks every 2 hours at the top of the hour
+    # Run quick account consistency checks every 2 hours at half past the hour,
+    # all of them every 6 hours and only the system-wide totals in between
     scheduler.add_job(
         run_quick_account_checks,
         trigger=CronTrigger(
-            hour="*/2", minute="30", timezone="UTC"
-        ),  # Run every 2 hours
+            hour="0,6,12,18", minute="30", timezone="UTC"
+        ),  # Run 4 times a day
+        kwargs={"mode": "full"},
         id="quick_account_checks",
         name="Quick Account Consistency Checks",
         replace_existing=True,
     )
+    scheduler.add_job(
+        run_quick_account_checks,
+        trigger=CronTrigger(
+            hour="2,4,8,10,14,16,20,22", minute="30", timezone="UTC"
+        ),  # Run on the remaining 2-hour ticks
+        kwargs={"mode": "fast"},
+        id="fast_account_checks",
+        name="Fast Account Consistency Checks",
+        replace_existing=True,
+    )
 
     # Run slow account consistency checks once a day at midnight UTC
     scheduler.add_job(
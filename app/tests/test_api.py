@@ -0,0 +1,140 @@
+"""Tests for the API server middleware."""
+
+import json
+import unittest
+from unittest.mock import AsyncMock
+
+from fastapi import FastAPI, Request
+
+from app.api import MaxBodySizeMiddleware, app
+
+
+def make_receive(chunks):
+    """Build an ASGI receive callable that yields the body in chunks."""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    return AsyncMock(side_effect=messages)
+
+
+def make_scope(path, content_length=None):
+    headers = [(b"content-type", b"application/octet-stream")]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("testclient", 123),
+        "server": ("testserver", 80),
+    }
+
+
+class TestMaxBodySizeMiddleware(unittest.IsolatedAsyncioTestCase):
+    """Test rejection of oversized request bodies."""
+
+    def setUp(self):
+        echo_app = FastAPI()
+
+        @echo_app.post("/agent/generate")
+        @echo_app.post("/other")
+        async def echo(request: Request):
+            return {"size": len(await request.body())}
+
+        self.app_calls = 0
+
+        async def inner_app(scope, receive, send):
+            self.app_calls += 1
+            await echo_app(scope, receive, send)
+
+        self.middleware = MaxBodySizeMiddleware(
+            inner_app, limits={"/agent/generate": 16}
+        )
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    def response(self):
+        status = self.sent[0]["status"]
+        body = b"".join(m.get("body", b"") for m in self.sent[1:])
+        return status, json.loads(body)
+
+    async def test_rejects_declared_oversized_body_before_reading(self):
+        receive = make_receive([b"x" * 17])
+
+        await self.middleware(
+            make_scope("/agent/generate", content_length=17), receive, self.send
+        )
+
+        status, body = self.response()
+        self.assertEqual(status, 413)
+        self.assertEqual(body["error"], "RequestEntityTooLarge")
+        self.assertEqual(body["msg"], "Request body exceeds 16 bytes")
+        receive.assert_not_awaited()
+        self.assertEqual(self.app_calls, 0)
+
+    async def test_trailing_slash_path_is_limited(self):
+        receive = make_receive([b"x" * 17])
+
+        await self.middleware(
+            make_scope("/agent/generate/", content_length=17), receive, self.send
+        )
+
+        status, _ = self.response()
+        self.assertEqual(status, 413)
+        self.assertEqual(self.app_calls, 0)
+
+    async def test_rejects_chunked_body_once_over_limit(self):
+        receive = make_receive([b"x" * 10, b"x" * 10, b"x" * 10])
+
+        await self.middleware(make_scope("/agent/generate"), receive, self.send)
+
+        status, _ = self.response()
+        self.assertEqual(status, 413)
+        # The last chunk is never read
+        self.assertEqual(receive.await_count, 2)
+        self.assertEqual(self.app_calls, 0)
+
+    async def test_replays_body_under_limit(self):
+        receive = make_receive([b"x" * 8, b"x" * 8])
+
+        await self.middleware(make_scope("/agent/generate"), receive, self.send)
+
+        self.assertEqual(self.response(), (200, {"size": 16}))
+
+    async def test_other_paths_are_not_limited(self):
+        receive = make_receive([b"x" * 100])
+
+        await self.middleware(
+            make_scope("/other", content_length=100), receive, self.send
+        )
+
+        self.assertEqual(self.response(), (200, {"size": 100}))
+
+
+class TestAppBodyLimits(unittest.TestCase):
+    """Test the body limits registered on the API server."""
+
+    def test_batch_limit_covers_every_item(self):
+        limits = next(
+            m.kwargs["limits"]
+            for m in app.user_middleware
+            if m.cls is MaxBodySizeMiddleware
+        )
+
+        self.assertEqual(
+            limits["/agent/generate/batch"], limits["/agent/generate"] * 20
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
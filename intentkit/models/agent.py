@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import re
@@ -35,6 +36,29 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+AGENT_SCHEMA_PATH = Path(__file__).parent / "agent_schema.json"
+
+# Resolved agent_schema.json, loaded once per process
+_agent_schema_cache: Optional[Dict[str, Any]] = None
+
+
+def _load_agent_schema() -> Dict[str, Any]:
+    """Load agent_schema.json with all $ref references resolved.
+
+    The file is read and resolved only on the first call. Each call returns a
+    deep copy, so callers are free to modify the result.
+    """
+    global _agent_schema_cache
+    if _agent_schema_cache is None:
+        with open(AGENT_SCHEMA_PATH) as f:
+            _agent_schema_cache = jsonref.load(
+                f,
+                base_uri=f"file://{AGENT_SCHEMA_PATH}",
+                proxies=False,
+                lazy_load=False,
+            )
+    return copy.deepcopy(_agent_schema_cache)
+
 
 class AgentAutonomous(BaseModel):
     """Autonomous agent configuration."""
@@ -1313,160 +1337,154 @@ class Agent(AgentCreate):
                     session, filter_owner_api_skills, admin_llm_skill_control
                 )
 
-        # Get the schema file path relative to this file
-        current_dir = Path(__file__).parent
-        agent_schema_path = current_dir / "agent_schema.json"
-
-        base_uri = f"file://{agent_schema_path}"
-        with open(agent_schema_path) as f:
-            schema = jsonref.load(f, base_uri=base_uri, proxies=False, lazy_load=False)
-
-            # Get the model property from the schema
-            model_property = schema.get("properties", {}).get("model", {})
-
-            if admin_llm_skill_control:
-                # Process model property - use LLMModelInfo as primary source
-                if model_property:
-                    # Query all LLM models from the database
-                    stmt = select(LLMModelInfoTable).where(LLMModelInfoTable.enabled)
-                    result = await db.execute(stmt)
-                    models = result.scalars().all()
-
-                    # Create new lists based on LLMModelInfo
-                    new_enum = []
-                    new_enum_title = []
-                    new_enum_category = []
-                    new_enum_support_skill = []
-
-                    # Process each model from database
-                    for model in models:
-                        model_info = LLMModelInfo.model_validate(model)
-
-                        # Add model ID to enum
-                        new_enum.append(model_info.id)
-
-                        # Add model name as title
-                        new_enum_title.append(model_info.name)
-
-                        # Add provider display name as category
-                        provider = (
-                            LLMProvider(model_info.provider)
-                            if isinstance(model_info.provider, str)
-                            else model_info.provider
-                        )
-                        new_enum_category.append(provider.display_name())
-
-                        # Add skill support information
-                        new_enum_support_skill.append(model_info.supports_skill_calls)
-
-                    # Update the schema with the new lists constructed from LLMModelInfo
-                    model_property["enum"] = new_enum
-                    model_property["x-enum-title"] = new_enum_title
-                    model_property["x-enum-category"] = new_enum_category
-                    model_property["x-support-skill"] = new_enum_support_skill
-
-                    # If the default model is not in the new enum, update it if possible
-                    if (
-                        "default" in model_property
-                        and model_property["default"] not in new_enum
-                        and new_enum
+        schema = _load_agent_schema()
+
+        # Get the model property from the schema
+        model_property = schema.get("properties", {}).get("model", {})
+
+        if admin_llm_skill_control:
+            # Process model property - use LLMModelInfo as primary source
+            if model_property:
+                # Query all LLM models from the database
+                stmt = select(LLMModelInfoTable).where(LLMModelInfoTable.enabled)
+                result = await db.execute(stmt)
+                models = result.scalars().all()
+
+                # Create new lists based on LLMModelInfo
+                new_enum = []
+                new_enum_title = []
+                new_enum_category = []
+                new_enum_support_skill = []
+
+                # Process each model from database
+                for model in models:
+                    model_info = LLMModelInfo.model_validate(model)
+
+                    # Add model ID to enum
+                    new_enum.append(model_info.id)
+
+                    # Add model name as title
+                    new_enum_title.append(model_info.name)
+
+                    # Add provider display name as category
+                    provider = (
+                        LLMProvider(model_info.provider)
+                        if isinstance(model_info.provider, str)
+                        else model_info.provider
+                    )
+                    new_enum_category.append(provider.display_name())
+
+                    # Add skill support information
+                    new_enum_support_skill.append(model_info.supports_skill_calls)
+
+                # Update the schema with the new lists constructed from LLMModelInfo
+                model_property["enum"] = new_enum
+                model_property["x-enum-title"] = new_enum_title
+                model_property["x-enum-category"] = new_enum_category
+                model_property["x-support-skill"] = new_enum_support_skill
+
+                # If the default model is not in the new enum, update it if possible
+                if (
+                    "default" in model_property
+                    and model_property["default"] not in new_enum
+                    and new_enum
+                ):
+                    model_property["default"] = new_enum[0]
+
+            # Process skills property
+            skills_property = schema.get("properties", {}).get("skills", {})
+            skills_properties = skills_property.get("properties", {})
+
+            if skills_properties:
+                # Load all skills from the database
+                # Query all skills grouped by category with enabled status
+                stmt = select(
+                    SkillTable.category,
+                    func.bool_or(SkillTable.enabled).label("any_enabled"),
+                ).group_by(SkillTable.category)
+                result = await db.execute(stmt)
+                category_status = {row.category: row.any_enabled for row in result}
+
+                # Query all skills with their price levels for adding x-price-level fields
+                skills_stmt = select(
+                    SkillTable.category,
+                    SkillTable.config_name,
+                    SkillTable.price_level,
+                    SkillTable.enabled,
+                ).where(SkillTable.enabled)
+                skills_result = await db.execute(skills_stmt)
+                skills_data = {}
+                category_price_levels = {}
+
+                for row in skills_result:
+                    if row.category not in skills_data:
+                        skills_data[row.category] = {}
+                        category_price_levels[row.category] = []
+
+                    if row.config_name:
+                        skills_data[row.category][row.config_name] = row.price_level
+
+                    if row.price_level is not None:
+                        category_price_levels[row.category].append(row.price_level)
+
+                # Calculate average price levels for categories
+                category_avg_price_levels = {}
+                for category, price_levels in category_price_levels.items():
+                    if price_levels:
+                        avg_price_level = int(sum(price_levels) / len(price_levels))
+                        category_avg_price_levels[category] = avg_price_level
+
+                # Create a copy of keys to avoid modifying during iteration
+                skill_keys = list(skills_properties.keys())
+
+                # Process each skill in the schema
+                for skill_category in skill_keys:
+                    if skill_category not in category_status:
+                        # If category not found in database, remove it from schema
+                        skills_properties.pop(skill_category, None)
+                    elif not category_status[skill_category]:
+                        # If category exists but all skills are disabled, remove it
+                        skills_properties.pop(skill_category, None)
+                    elif filter_owner_api_skills and cls._is_agent_owner_only_skill(
+                        skills_properties[skill_category]
                     ):
-                        model_property["default"] = new_enum[0]
-
-                # Process skills property
-                skills_property = schema.get("properties", {}).get("skills", {})
-                skills_properties = skills_property.get("properties", {})
-
-                if skills_properties:
-                    # Load all skills from the database
-                    # Query all skills grouped by category with enabled status
-                    stmt = select(
-                        SkillTable.category,
-                        func.bool_or(SkillTable.enabled).label("any_enabled"),
-                    ).group_by(SkillTable.category)
-                    result = await db.execute(stmt)
-                    category_status = {row.category: row.any_enabled for row in result}
-
-                    # Query all skills with their price levels for adding x-price-level fields
-                    skills_stmt = select(
-                        SkillTable.category,
-                        SkillTable.config_name,
-                        SkillTable.price_level,
-                        SkillTable.enabled,
-                    ).where(SkillTable.enabled)
-                    skills_result = await db.execute(skills_stmt)
-                    skills_data = {}
-                    category_price_levels = {}
-
-                    for row in skills_result:
-                        if row.category not in skills_data:
-                            skills_data[row.category] = {}
-                            category_price_levels[row.category] = []
-
-                        if row.config_name:
-                            skills_data[row.category][row.config_name] = row.price_level
-
-                        if row.price_level is not None:
-                            category_price_levels[row.category].append(row.price_level)
-
-                    # Calculate average price levels for categories
-                    category_avg_price_levels = {}
-                    for category, price_levels in category_price_levels.items():
-                        if price_levels:
-                            avg_price_level = int(sum(price_levels) / len(price_levels))
-                            category_avg_price_levels[category] = avg_price_level
-
-                    # Create a copy of keys to avoid modifying during iteration
-                    skill_keys = list(skills_properties.keys())
-
-                    # Process each skill in the schema
-                    for skill_category in skill_keys:
-                        if skill_category not in category_status:
-                            # If category not found in database, remove it from schema
-                            skills_properties.pop(skill_category, None)
-                        elif not category_status[skill_category]:
-                            # If category exists but all skills are disabled, remove it
-                            skills_properties.pop(skill_category, None)
-                        elif filter_owner_api_skills and cls._is_agent_owner_only_skill(
-                            skills_properties[skill_category]
-                        ):
-                            # If filtering owner API skills and this skill requires it, remove it
-                            skills_properties.pop(skill_category, None)
-                            logger.info(
-                                f"Filtered out skill '{skill_category}' from auto-generation: requires agent owner API key"
+                        # If filtering owner API skills and this skill requires it, remove it
+                        skills_properties.pop(skill_category, None)
+                        logger.info(
+                            f"Filtered out skill '{skill_category}' from auto-generation: requires agent owner API key"
+                        )
+                    else:
+                        # Add x-avg-price-level to category level
+                        if skill_category in category_avg_price_levels:
+                            skills_properties[skill_category][
+                                "x-avg-price-level"
+                            ] = category_avg_price_levels[skill_category]
+
+                        # Add x-price-level to individual skill states
+                        if skill_category in skills_data:
+                            skill_states = (
+                                skills_properties[skill_category]
+                                .get("properties", {})
+                                .get("states", {})
+                                .get("properties", {})
                             )
-                        else:
-                            # Add x-avg-price-level to category level
-                            if skill_category in category_avg_price_levels:
-                                skills_properties[skill_category][
-                                    "x-avg-price-level"
-                                ] = category_avg_price_levels[skill_category]
-
-                            # Add x-price-level to individual skill states
-                            if skill_category in skills_data:
-                                skill_states = (
-                                    skills_properties[skill_category]
-                                    .get("properties", {})
-                                    .get("states", {})
-                                    .get("properties", {})
-                                )
-                                for state_name, state_config in skill_states.items():
-                                    if (
-                                        state_name in skills_data[skill_category]
-                                        and skills_data[skill_category][state_name]
-                                        is not None
-                                    ):
-                                        state_config["x-price-level"] = skills_data[
-                                            skill_category
-                                        ][state_name]
-
-            # Log the changes for debugging
-            logger.debug(
-                f"Schema processed with LLM and skill controls enabled: {admin_llm_skill_control}, "
-                f"filtered owner API skills: {filter_owner_api_skills}"
-            )
+                            for state_name, state_config in skill_states.items():
+                                if (
+                                    state_name in skills_data[skill_category]
+                                    and skills_data[skill_category][state_name]
+                                    is not None
+                                ):
+                                    state_config["x-price-level"] = skills_data[
+                                        skill_category
+                                    ][state_name]
+
+        # Log the changes for debugging
+        logger.debug(
+            f"Schema processed with LLM and skill controls enabled: {admin_llm_skill_control}, "
+            f"filtered owner API skills: {filter_owner_api_skills}"
+        )
 
-            return schema
+        return schema
 
 
 class AgentResponse(BaseModel):
@@ -5,7 +5,7 @@ related to agent generation sessions.
 """
 
 from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Tuple
 
 from epyxid import XID
 from intentkit.models.base import Base
@@ -20,6 +20,7 @@ from sqlalchemy import (
     desc,
     func,
     select,
+    update,
 )
 from sqlalchemy.dialects.postgresql import JSON, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -52,6 +53,10 @@ class ConversationProjectTable(Base):
         nullable=False,
         server_default=func.now(),
     )
+    tags = Column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=True,
+    )
 
 
 class ConversationMessageTable(Base):
@@ -142,6 +147,10 @@ class ConversationProject(ConversationProjectCreate):
     last_activity: Annotated[
         datetime, Field(description="Timestamp of last activity in this project")
     ]
+    tags: Annotated[
+        Optional[List[dict]],
+        Field(None, description="Generated tags for the project, None until ready"),
+    ]
 
     @classmethod
     async def get(cls, project_id: str) -> Optional["ConversationProject"]:
@@ -160,8 +169,6 @@ class ConversationProject(ConversationProjectCreate):
     async def update_activity(self) -> "ConversationProject":
         """Update the last activity timestamp for this project."""
         async with get_session() as db:
-            from sqlalchemy import update
-
             await db.execute(
                 update(ConversationProjectTable)
                 .where(ConversationProjectTable.id == self.id)
@@ -177,6 +184,17 @@ class ConversationProject(ConversationProjectCreate):
             project = result.scalar_one()
             return ConversationProject.model_validate(project)
 
+    @classmethod
+    async def update_tags(cls, project_id: str, tags: List[dict]) -> None:
+        """Store the generated tags for a project."""
+        async with get_session() as db:
+            await db.execute(
+                update(ConversationProjectTable)
+                .where(ConversationProjectTable.id == project_id)
+                .values(tags=tags)
+            )
+            await db.commit()
+
     @classmethod
     async def get_by_user(
         cls, user_id: Optional[str] = None, limit: int = 50
@@ -253,25 +271,40 @@ class ConversationMessage(ConversationMessageCreate):
         datetime, Field(description="Timestamp when this message was created")
     ]
 
+    @staticmethod
+    def _project_access_query(project_id: str, user_id: Optional[str] = None):
+        """Build the query that checks a project exists and the user can access it."""
+        project_query = select(ConversationProjectTable.id).where(
+            ConversationProjectTable.id == project_id
+        )
+        if user_id is not None:
+            project_query = project_query.where(
+                ConversationProjectTable.user_id == user_id
+            )
+        return project_query
+
     @classmethod
     async def get_by_project(
-        cls, project_id: str, user_id: Optional[str] = None
+        cls,
+        project_id: str,
+        user_id: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List["ConversationMessage"]:
-        """Get conversation messages for a project."""
+        """Get conversation messages for a project.
+
+        Args:
+            project_id: Project ID
+            user_id: Optional user ID for access validation
+            offset: Number of messages to skip, oldest first
+            limit: Maximum number of messages to return, None for all
+        """
         async with get_session() as db:
             # First check if project exists and user has access
-            project_query = select(ConversationProjectTable).where(
-                ConversationProjectTable.id == project_id
+            project_result = await db.execute(
+                cls._project_access_query(project_id, user_id)
             )
-            if user_id is not None:
-                project_query = project_query.where(
-                    ConversationProjectTable.user_id == user_id
-                )
-
-            project_result = await db.execute(project_query)
-            project = project_result.scalar_one_or_none()
-
-            if not project:
+            if project_result.scalar_one_or_none() is None:
                 return []
 
             # Get messages for the project
@@ -279,8 +312,51 @@ class ConversationMessage(ConversationMessageCreate):
                 select(ConversationMessageTable)
                 .where(ConversationMessageTable.project_id == project_id)
                 .order_by(ConversationMessageTable.created_at)
+                .offset(offset)
             )
+            if limit is not None:
+                messages_query = messages_query.limit(limit)
 
             result = await db.execute(messages_query)
             messages = result.scalars().all()
             return [cls.model_validate(message) for message in messages]
+
+    @classmethod
+    async def get_project_summary(
+        cls, project_id: str, user_id: Optional[str] = None
+    ) -> Tuple[
+        int, Optional["ConversationMessage"], Optional["ConversationMessage"]
+    ]:
+        """Get the message count and the first and last messages of a project.
+
+        Returns:
+            A tuple of (message_count, first_message, last_message), (0, None, None)
+            if the project doesn't exist or the user has no access
+        """
+        async with get_session() as db:
+            project_result = await db.execute(
+                cls._project_access_query(project_id, user_id)
+            )
+            if project_result.scalar_one_or_none() is None:
+                return 0, None, None
+
+            count = await db.scalar(
+                select(func.count())
+                .select_from(ConversationMessageTable)
+                .where(ConversationMessageTable.project_id == project_id)
+            )
+            if not count:
+                return 0, None, None
+
+            messages_query = select(ConversationMessageTable).where(
+                ConversationMessageTable.project_id == project_id
+            )
+            first = await db.scalar(
+                messages_query.order_by(ConversationMessageTable.created_at).limit(1)
+            )
+            last = await db.scalar(
+                messages_query.order_by(
+                    desc(ConversationMessageTable.created_at)
+                ).limit(1)
+            )
+            return count, cls.model_validate(first), cls.model_validate(last)
@@ -1401,6 +1401,19 @@ class CreditTransactionTable(Base):
     __table_args__ = (
         Index("ix_credit_transactions_account", "account_id"),
         Index("ix_credit_transactions_event_id", "event_id"),
+        # Covering index for per-account balance aggregation in account checking
+        Index(
+            "ix_credit_transactions_account_event_cover",
+            "account_id",
+            "event_id",
+            postgresql_include=[
+                "credit_debit",
+                "change_amount",
+                "free_amount",
+                "reward_amount",
+                "permanent_amount",
+            ],
+        ),
     )
 
     id = Column(
@@ -1697,3 +1710,53 @@ class CreditPriceLog(BaseModel):
     modified_at: Annotated[
         datetime, Field(description="Timestamp when the modification was made")
     ]
+
+
+class CreditAccountCheckpointTable(Base):
+    """Credit account checkpoint database table model.
+
+    Stores the transaction sums of an account up to and including last_event_id,
+    so the account balance check only needs to aggregate newer transactions.
+    """
+
+    __tablename__ = "credit_account_checkpoints"
+
+    account_id = Column(
+        String,
+        primary_key=True,
+    )
+    last_event_id = Column(
+        String,
+        nullable=False,
+    )
+    credits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    debits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    free_credits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    reward_credits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    permanent_credits = Column(
+        Numeric(22, 4),
+        default=0,
+        nullable=False,
+    )
+    checked_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
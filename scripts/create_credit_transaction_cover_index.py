@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Migration script to create the covering index on credit_transactions.
+
+New databases get the index from the table definition, but existing tables are not
+altered by the automatic migration. The index is built concurrently so running programs
+are not blocked while it is created.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from intentkit.config.config import config
+from intentkit.models.db import get_engine, init_db
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "ix_credit_transactions_account_event_cover"
+
+
+async def main():
+    """Create the covering index if it does not exist."""
+    await init_db(**config.db)
+
+    # CREATE INDEX CONCURRENTLY can not run inside a transaction block
+    engine = get_engine()
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        logger.info(f"Creating index {INDEX_NAME}, this may take a while")
+        await conn.execute(
+            text(f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME}
+            ON credit_transactions (account_id, event_id)
+            INCLUDE (credit_debit, change_amount, free_amount, reward_amount, permanent_amount)
+        """)
+        )
+        logger.info(f"Index {INDEX_NAME} is ready")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())